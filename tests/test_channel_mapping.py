@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Optimized DVB map tests; they need an Enigma2 Python environment."""
+import pytest
+
+pytest.importorskip("enigma")
+
+from Plugins.Extensions.M3UConverter.plugin import EPGServiceMapper  # noqa: E402
+
+
+class _ManualDatabase:
+    """The part of ManualDatabaseManager the mapper uses, without a file."""
+
+    def add_change_listener(self, listener):
+        pass
+
+    def remove_change_listener(self, listener):
+        pass
+
+    def load_database(self):
+        return {"mappings": []}
+
+    def get_clean_name_index(self):
+        return {}
+
+
+def _mapper():
+    mapper = EPGServiceMapper(manual_db=_ManualDatabase())
+    mapper.database_mode = "dvb"
+    return mapper
+
+
+def _service(sref):
+    return {"sref": sref, "source": "lamedb", "type": "satellite"}
+
+
+def _snapshot(mapper):
+    mapping = mapper.mapping
+    return dict(mapping.optimized), dict(mapping.optimized_aliases)
+
+
+def _assert_rebuild_equivalent(mapper):
+    mapper.optimize_matching()
+    incremental = _snapshot(mapper)
+    mapper.optimize_matching(force=True)
+    assert incremental == _snapshot(mapper)
+
+
+def test_alias_moves_to_surviving_name_with_same_clean_form():
+    mapper = _mapper()
+    mapping = mapper.mapping
+    mapping.add_dvb_service("Rai 1 HD", _service("1:0:19:1:1:1:820000:0:0:0:"), origin="a")
+    mapping.add_dvb_service("RAI 1 HD", _service("1:0:19:2:1:1:820000:0:0:0:"), origin="b")
+    mapper.optimize_matching(force=True)
+    clean_name = mapper.clean_channel_name("Rai 1 HD")
+    assert mapping.optimized_aliases[clean_name] == "Rai 1 HD"
+
+    mapping.remove_dvb_origin("a")
+    _assert_rebuild_equivalent(mapper)
+    assert mapping.optimized_aliases[clean_name] == "RAI 1 HD"
+
+
+def test_incremental_updates_match_full_rebuild():
+    mapper = _mapper()
+    mapping = mapper.mapping
+    names = ("Canale 5", "CANALE 5 HD", "canale 5 hd", "Rete 4 HD", "RETE 4")
+    for index, name in enumerate(names):
+        mapping.add_dvb_service(
+            name, _service("1:0:1:%X:1:1:820000:0:0:0:" % index), origin=name)
+    mapper.optimize_matching(force=True)
+
+    for name in names:
+        mapping.remove_dvb_origin(name)
+        _assert_rebuild_equivalent(mapper)
+        mapping.add_dvb_service(
+            name, _service("1:0:1:FF:1:1:820000:0:0:0:"), origin=name)
+        _assert_rebuild_equivalent(mapper)
+
+
+def test_compact_switch_converts_loaded_services():
+    mapper = _mapper()
+    mapping = mapper.mapping
+    mapping.add_dvb_service("Rai 1 HD", _service("1:0:19:1:1:1:820000:0:0:0:"), origin="a")
+    mapper.optimize_matching(force=True)
+
+    assert mapping.set_compact_records(True) == 1
+    service = mapping.dvb["Rai 1 HD"][0]
+    assert not isinstance(service, dict)
+    assert mapping.dvb_partitions["satellite"]["Rai 1 HD"][0] is service
+    assert mapping.optimized["Rai 1 HD"] is service
+
+    assert mapping.set_compact_records(False) == 1
+    assert mapping.dvb["Rai 1 HD"][0] == dict(_service("1:0:19:1:1:1:820000:0:0:0:"), origin="a")
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import json
+import sys
+import time
+from os.path import abspath, dirname, join
+
+PLUGIN_DIR = join(
+    dirname(dirname(abspath(__file__))),
+    "usr", "lib", "enigma2", "python", "Plugins", "Extensions", "M3UConverter")
+sys.path.insert(0, PLUGIN_DIR)
+
+from playlist_parser import (  # noqa: E402
+    ChannelDeduplicator, JSONStreamParser, M3UStreamParser, chunk_lines, prefetch)
+
+
+def _channel(name):
+    return {"name": name, "url": "http://example.com/" + name + ".ts"}
+
+
+def _parse(tmp_path, document, chunk_size=JSONStreamParser.CHUNK_SIZE):
+    path = tmp_path / "playlist.json"
+    path.write_text(json.dumps(document), encoding="utf-8")
+    parser = JSONStreamParser(str(path))
+    parser.CHUNK_SIZE = chunk_size
+    return parser, [record["name"] for record in parser]
+
+
+def test_known_container_key_wins_over_earlier_object_list(tmp_path):
+    document = {
+        "categories": [{"name": "News"}, {"name": "Sport"}],
+        "channels": [_channel("a"), _channel("b")],
+    }
+    for chunk_size in (1, 7, JSONStreamParser.CHUNK_SIZE):
+        parser, names = _parse(tmp_path, document, chunk_size)
+        assert names == ["a", "b"]
+        assert parser.container == "channels"
+
+
+def test_first_object_list_is_the_fallback(tmp_path):
+    document = {
+        "tags": ["hd", "sd"],
+        "groups": [_channel("x")],
+        "more": [_channel("y")],
+        "version": 2,
+    }
+    for chunk_size in (1, 7, JSONStreamParser.CHUNK_SIZE):
+        parser, names = _parse(tmp_path, document, chunk_size)
+        assert names == ["x"]
+        assert parser.container == "groups"
+
+
+def test_object_without_lists_yields_nothing(tmp_path):
+    parser, names = _parse(tmp_path, {"tags": ["hd"], "version": 2})
+    assert names == []
+    assert parser.container is None
+
+
+def test_limit_closes_prefetched_download():
+    closed = []
+
+    def download():
+        try:
+            yield b"#EXTM3U\n"
+            while True:
+                yield b"#EXTINF:-1,a\nhttp://example.com/a.ts\n"
+        finally:
+            closed.append(True)
+
+    parser = M3UStreamParser(chunk_lines(prefetch(download(), maxsize=2)), limit=3)
+    assert len(list(parser)) == 3
+    deadline = time.time() + 5
+    while not closed and time.time() < deadline:
+        time.sleep(0.05)
+    assert closed
+
+
+def test_quality_policy_keeps_best_copy_at_first_position(tmp_path):
+    path = tmp_path / "playlist.m3u"
+    path.write_text(
+        "#EXTM3U\n"
+        "#EXTINF:-1,Rai 1 SD\nhttp://example.com/1sd.ts\n"
+        "#EXTINF:-1,Canale 5\nhttp://example.com/5.ts\n"
+        "#EXTINF:-1,Rai 1 HD\nhttp://example.com/1hd.ts\n"
+        "#EXTINF:-1,Rai 1 FHD\nhttp://example.com/1fhd.ts\n",
+        encoding="utf-8")
+    dedupe = ChannelDeduplicator("quality")
+    channels = list(M3UStreamParser(str(path), dedupe=dedupe))
+    assert [channel["name"] for channel in channels] == ["Rai 1 FHD", "Canale 5"]
+    assert dedupe.dropped["quality"] == 2
@@ -38,6 +38,7 @@ ARCHIMEDE_M3U_PATH = join(BASE_STORAGE_PATH, "movie")
 ARCHIMEDE_CONVERTER_PATH = join(BASE_STORAGE_PATH, "archimede_converter")
 LOG_DIR = ARCHIMEDE_CONVERTER_PATH
 DEBUG_DIR = join(ARCHIMEDE_CONVERTER_PATH, "debug")
+EPG_CACHE_DIR = join(ARCHIMEDE_CONVERTER_PATH, "epg_cache")
 MAIN_LOG = join(LOG_DIR, "converter.log")
 DB_PATCH = join(PLUGIN_PATH, "database", "manual_mappings.json")
 EXPORT_DIR = join(PLUGIN_PATH, "database")
@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
+import zlib
 import shutil
 import hashlib
 import unicodedata
 from re import sub
-from time import strftime
+from time import strftime, monotonic
 from threading import Lock
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from os.path import exists, isdir, join, basename
 from os import access, W_OK, listdir, remove, replace, chmod, system, makedirs
 from Components.config import config
@@ -207,38 +208,13 @@ class CoreConverter:
             if not exists(bouquet_dir):
                 makedirs(bouquet_dir, exist_ok=True)
 
-            name_bouquet = clean_group_name(self.remove_suffixes(safe_name))
-
             with open(temp_file, "w", encoding="utf-8", buffering=65536) as f:
-                f.write(f"#NAME {name_bouquet}\n")
-                f.write(
-                    "#SERVICE 1:64:0:0:0:0:0:0:0:0::--- | Archimede Converter | ---\n")
-                f.write("#DESCRIPTION --- | Archimede Converter | ---\n")
+                f.write(self._bouquet_header(safe_name))
 
                 for ch in channels:
-                    if not ch.get('url') or len(ch['url']) < 10:
-                        continue
-
-                    service_ref = ch.get('bouquet_sref')
-                    if not service_ref:
-                        service_ref = ch.get('sref', '')  # Fallback a sref
-
-                    if not service_ref:
-                        if epg_mapper:
-                            service_ref = epg_mapper._generate_service_reference(
-                                ch['url'])
-                        else:
-                            service_ref = self._generate_basic_service_reference(
-                                ch['url'])
-
-                    f.write(f"#SERVICE {service_ref}\n")
-
-                    # Clean name for description
-                    desc = ch.get('name', 'Unknown Channel')
-                    desc = ''.join(
-                        c for c in desc if c.isprintable() or c.isspace())
-                    desc = transliterate_text(desc)
-                    f.write(f"#DESCRIPTION {desc}\n")
+                    entry = self._bouquet_entry(ch, epg_mapper)
+                    if entry:
+                        f.write(entry)
 
             # Replace file
             if exists(filename):
@@ -267,6 +243,39 @@ class CoreConverter:
             )
             return False
 
+    def _bouquet_header(self, safe_name):
+        """Return the #NAME and marker lines that open a bouquet file."""
+        name_bouquet = clean_group_name(self.remove_suffixes(safe_name))
+        return (
+            f"#NAME {name_bouquet}\n"
+            "#SERVICE 1:64:0:0:0:0:0:0:0:0::--- | Archimede Converter | ---\n"
+            "#DESCRIPTION --- | Archimede Converter | ---\n"
+        )
+
+    def _bouquet_entry(self, ch, epg_mapper=None):
+        """Return the #SERVICE/#DESCRIPTION lines of a channel, or None."""
+        if not ch.get('url') or len(ch['url']) < 10:
+            return None
+
+        service_ref = ch.get('bouquet_sref')
+        if not service_ref:
+            service_ref = ch.get('sref', '')  # Fallback a sref
+
+        if not service_ref:
+            if epg_mapper:
+                service_ref = epg_mapper._generate_service_reference(
+                    ch['url'])
+            else:
+                service_ref = self._generate_basic_service_reference(
+                    ch['url'])
+
+        # Clean name for description
+        desc = ch.get('name', 'Unknown Channel')
+        desc = ''.join(
+            c for c in desc if c.isprintable() or c.isspace())
+        desc = transliterate_text(desc)
+        return f"#SERVICE {service_ref}\n#DESCRIPTION {desc}\n"
+
     def _generate_basic_service_reference(self, url):
         """Basic fallback - to be used ONLY if epg_mapper is not available"""
         if not url:
@@ -434,9 +443,415 @@ class CoreConverter:
             self._log_error(f"Cleanup failed: {str(e)}")
 
 
+class StreamingBouquetWriter(object):
+    """Write group bouquets while the channels are still being converted.
+
+    Every bouquet goes to its own temp file. At most max_open handles stay
+    open: the least recently used one is closed and reopened in append
+    mode when needed, so playlists with thousands of groups do not run out
+    of file descriptors. finish() moves the files in place, abort() drops
+    them.
+
+    The channels.xml records of the EPG stage are spooled to a temp file as
+    well and read back once by epg_entries(), so they never pile up in RAM.
+    """
+
+    BOUQUET_DIR = "/etc/enigma2"
+    EPG_SPOOL = "m3uconverter_epg.tmp"
+
+    def __init__(self, converter, epg_mapper=None, max_open=32):
+        self.converter = converter
+        self.epg_mapper = epg_mapper
+        self.max_open = max_open
+        self._handles = OrderedDict()
+        # safe_name -> written channels, in first-seen order
+        self.counts = OrderedDict()
+        self._epg_spool = None
+        self.epg_count = 0
+
+    def _path(self, safe_name):
+        return join(self.BOUQUET_DIR, "userbouquet." + safe_name + ".tv")
+
+    def _handle(self, safe_name):
+        handle = self._handles.get(safe_name)
+        if handle is not None:
+            self._handles.move_to_end(safe_name)
+            return handle
+
+        temp_file = self._path(safe_name) + ".tmp"
+        if safe_name in self.counts:
+            handle = open(temp_file, "a", encoding="utf-8", buffering=65536)
+        else:
+            if not exists(self.BOUQUET_DIR):
+                makedirs(self.BOUQUET_DIR, exist_ok=True)
+            handle = open(temp_file, "w", encoding="utf-8", buffering=65536)
+            handle.write(self.converter._bouquet_header(safe_name))
+            self.counts[safe_name] = 0
+
+        self._handles[safe_name] = handle
+        if len(self._handles) > self.max_open:
+            self._handles.popitem(last=False)[1].close()
+        return handle
+
+    def write(self, safe_name, channel):
+        """Append one channel to a bouquet; False if it has no usable URL."""
+        entry = self.converter._bouquet_entry(channel, self.epg_mapper)
+        if not entry:
+            return False
+        self._handle(safe_name).write(entry)
+        self.counts[safe_name] += 1
+        return True
+
+    def write_epg(self, name, tvg_id, sref, match_type):
+        """Spool one (name, tvg_id, sref, match_type) EPG record."""
+        if self._epg_spool is None:
+            if not exists(self.BOUQUET_DIR):
+                makedirs(self.BOUQUET_DIR, exist_ok=True)
+            self._epg_spool = open(
+                join(self.BOUQUET_DIR, self.EPG_SPOOL), "w",
+                encoding="utf-8", buffering=65536)
+        fields = (name, tvg_id, sref, match_type)
+        self._epg_spool.write("\t".join(
+            (field or "").replace("\t", " ").replace("\n", " ")
+            for field in fields) + "\n")
+        self.epg_count += 1
+
+    def epg_entries(self):
+        """Yield the spooled EPG records in order, then delete the spool."""
+        if self._epg_spool is None:
+            return
+        self._epg_spool.close()
+        self._epg_spool = None
+        spool = join(self.BOUQUET_DIR, self.EPG_SPOOL)
+        try:
+            with open(spool, "r", encoding="utf-8", buffering=65536) as f:
+                for line in f:
+                    yield tuple(line.rstrip("\n").split("\t"))
+        finally:
+            self._drop_epg()
+
+    def _drop_epg(self):
+        if self._epg_spool is not None:
+            self._epg_spool.close()
+            self._epg_spool = None
+        spool = join(self.BOUQUET_DIR, self.EPG_SPOOL)
+        if exists(spool):
+            try:
+                remove(spool)
+            except Exception:
+                pass
+        self.epg_count = 0
+
+    def _close_all(self):
+        while self._handles:
+            self._handles.popitem(last=False)[1].close()
+
+    def finish(self):
+        """Move every written bouquet in place and return their names."""
+        self._close_all()
+        written = []
+        for safe_name, count in self.counts.items():
+            filename = self._path(safe_name)
+            try:
+                if exists(filename):
+                    remove(filename)
+                replace(filename + ".tmp", filename)
+                chmod(filename, 0o644)
+                written.append(safe_name)
+                if config.plugins.m3uconverter.enable_debug.value:
+                    logger.info(
+                        "✅ Bouquet written: %s with %s channels",
+                        safe_name,
+                        count
+                    )
+            except Exception as e:
+                logger.error(
+                    "❌ Failed to write bouquet %s: %s",
+                    safe_name,
+                    e
+                )
+        self.counts.clear()
+        return written
+
+    def abort(self):
+        """Close and delete the temp files of an interrupted conversion."""
+        self._close_all()
+        for safe_name in self.counts:
+            temp_file = self._path(safe_name) + ".tmp"
+            if exists(temp_file):
+                try:
+                    remove(temp_file)
+                except Exception:
+                    pass
+        self.counts.clear()
+        self._drop_epg()
+
+
+class ConversionCancelled(Exception):
+    """Raised inside a conversion once its token has been cancelled."""
+
+    def __init__(self, message="Conversion cancelled"):
+        Exception.__init__(self, message)
+
+
+class ConversionToken(object):
+    """Progress and cancellation shared by the parse, match and write stages.
+
+    Worker loops call step() once per item: it raises ConversionCancelled
+    after cancel() and hands progress to the callback at most once every
+    ``interval`` seconds. The callback runs in the worker thread, so UI
+    callbacks must marshal themselves to the reactor (callFromThread).
+    """
+
+    def __init__(self, callback=None, interval=0.25):
+        self.callback = callback
+        self.interval = interval
+        self.cancelled = False
+        self.total = 0
+        self.done = 0
+        self.label = ""
+        self._next_report = 0.0
+
+    def begin(self, total, label):
+        """Start a stage; label may use {name}, {done}, {total}, {percent}."""
+        self.total = total
+        self.done = 0
+        self.label = label
+        self._next_report = 0.0
+
+    def cancel(self):
+        self.cancelled = True
+
+    def check(self):
+        """Raise ConversionCancelled if the conversion was cancelled."""
+        if self.cancelled:
+            raise ConversionCancelled()
+
+    def step(self, name=""):
+        """Count one item, then report progress if the interval elapsed."""
+        if self.cancelled:
+            raise ConversionCancelled()
+        self.done += 1
+        if self.callback is not None:
+            now = monotonic()
+            if now >= self._next_report:
+                self._next_report = now + self.interval
+                self.report(name)
+
+    def report(self, name=""):
+        """Send the current progress to the callback right away."""
+        if self.callback is None:
+            return
+        total = self.total
+        done = self.done
+        percent = int(done * 100 / total) if total else 0
+        self.callback(done, total, self.label.format(
+            name=name, done=done, total=total, percent=percent))
+
+
+class DVBService(object):
+    """Compact DVB service record with a read-mostly dict interface.
+
+    Used in low-memory mode in place of one dict per service: slots keep
+    a lamedb of tens of thousands of services several times smaller.
+    """
+
+    __slots__ = ("sref", "type", "source", "service_id",
+                 "ts_id", "on_id", "namespace", "origin")
+
+    def __init__(self, data):
+        for field in self.__slots__:
+            setattr(self, field, data.get(field))
+
+    def get(self, key, default=None):
+        if key in self.__slots__:
+            value = getattr(self, key)
+            return default if value is None else value
+        return default
+
+    def __getitem__(self, key):
+        if key not in self.__slots__ or getattr(self, key) is None:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.__slots__ and getattr(self, key) is not None
+
+    def keys(self):
+        return [field for field in self.__slots__
+                if getattr(self, field) is not None]
+
+    def items(self):
+        return [(field, getattr(self, field)) for field in self.keys()]
+
+    def copy(self):
+        return dict(self.items())
+
+
+class TrigramBloomFilter(object):
+    """Bloom filter over the character trigrams of database names.
+
+    Answers "could any database name share this gram?" with no false
+    negatives, in a fixed bytearray (64 KB by default).
+    """
+
+    def __init__(self, size_bits=1 << 19, hashes=3):
+        self.size_bits = size_bits
+        self.hashes = hashes
+        self.bits = bytearray(size_bits // 8)
+        self.count = 0
+
+    @staticmethod
+    def grams(text):
+        """Return the set of trigrams of the alphanumeric part of text."""
+        text = "".join(ch for ch in text.lower() if ch.isalnum())
+        return set(text[i:i + 3] for i in range(len(text) - 2))
+
+    def _positions(self, gram):
+        data = gram.encode("utf-8")
+        return [zlib.crc32(data, seed) % self.size_bits
+                for seed in range(self.hashes)]
+
+    def add(self, text):
+        for gram in self.grams(text):
+            for pos in self._positions(gram):
+                self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, gram):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7))
+                   for pos in self._positions(gram))
+
+    def shared_ratio(self, text):
+        """Fraction of the trigrams of text seen in any database name.
+
+        None when text is too short to have trigrams.
+        """
+        grams = self.grams(text)
+        if not grams:
+            return None
+        return sum(1 for gram in grams if gram in self) / float(len(grams))
+
+    def clear(self):
+        self.bits = bytearray(self.size_bits // 8)
+        self.count = 0
+
+
+class LazyExtendedMapping(object):
+    """Rytec extended info materialized on demand.
+
+    For rytec.channels.xml entries only byte offsets are kept; the variant
+    dicts are built by ``loader(f, channel_id, offsets)`` the first time an
+    id is read. Entries assigned directly (EPGShare, DVB fallback) are kept
+    as given. Reads behave like the defaultdict(list) this replaces.
+    """
+
+    def __init__(self):
+        self.loaded = {}        # channel_id -> [variants]
+        self.offsets = {}       # channel_id -> [byte offsets], not loaded yet
+        self.source_path = None
+        self.loader = None
+
+    def index(self, channel_id, offset):
+        """Record where an entry of channel_id starts in source_path."""
+        self.offsets.setdefault(channel_id, []).append(offset)
+
+    def _read(self, f, channel_id):
+        variants = []
+        if self.loader:
+            try:
+                variants = self.loader(f, channel_id, self.offsets[channel_id])
+            except Exception as e:
+                logger.error("Error loading extended info for %s: %s",
+                             channel_id, str(e))
+        del self.offsets[channel_id]
+        # Entries appended before loading stay after the file variants
+        self.loaded[channel_id] = variants + self.loaded.get(channel_id, [])
+
+    def _materialize(self, channel_ids):
+        pending = [cid for cid in channel_ids if cid in self.offsets]
+        if not pending:
+            return
+        if not self.source_path or not exists(self.source_path):
+            for channel_id in pending:
+                self.offsets.pop(channel_id, None)
+            return
+        with open(self.source_path, "rb") as f:
+            for channel_id in pending:
+                self._read(f, channel_id)
+
+    def peek(self, channel_id):
+        """Return the variants already in memory, without loading."""
+        return self.loaded.get(channel_id)
+
+    def loaded_items(self):
+        """Iterate materialized entries only."""
+        return self.loaded.items()
+
+    def loaded_variants(self, channel_id):
+        """Return the in-memory variant list of channel_id, created if
+        missing, without reading pending file variants (merged in front
+        when they are read)."""
+        return self.loaded.setdefault(channel_id, [])
+
+    def get(self, channel_id, default=None):
+        self._materialize((channel_id,))
+        return self.loaded.get(channel_id, default)
+
+    def __getitem__(self, channel_id):
+        self._materialize((channel_id,))
+        return self.loaded.setdefault(channel_id, [])
+
+    def __setitem__(self, channel_id, variants):
+        self.offsets.pop(channel_id, None)
+        self.loaded[channel_id] = variants
+
+    def __delitem__(self, channel_id):
+        found = self.offsets.pop(channel_id, None) is not None
+        if self.loaded.pop(channel_id, None) is None and not found:
+            raise KeyError(channel_id)
+
+    def pop(self, channel_id, default=None):
+        """Drop an entry; pending file variants are discarded unread."""
+        self.offsets.pop(channel_id, None)
+        return self.loaded.pop(channel_id, default)
+
+    def __contains__(self, channel_id):
+        return channel_id in self.loaded or channel_id in self.offsets
+
+    def __len__(self):
+        return len(self.loaded) + len(self.offsets)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        return list(self.loaded) + list(self.offsets)
+
+    def items(self):
+        """Iterate all entries, loading the pending ones in a single pass."""
+        self._materialize(list(self.offsets))
+        return self.loaded.items()
+
+    def values(self):
+        self._materialize(list(self.offsets))
+        return self.loaded.values()
+
+    def clear(self):
+        self.loaded.clear()
+        self.offsets.clear()
+
+
 class UnifiedChannelMapping:
     """Unified channel mapping structure to replace multiple redundant maps."""
 
+    DVB_PARTITIONS = ("satellite", "dvb-t", "dvb-c", "bouquet")
+
     def __init__(self):
         """Initialize unified channel mapping with empty structures."""
         # Rytec databases
@@ -444,8 +859,8 @@ class UnifiedChannelMapping:
             'basic': {},                    # Base Rytec mapping (id -> sref)
             # Clean names mapping (clean_name -> sref)
             'clean': {},
-            # Extended info with variants (id -> [variants])
-            'extended': defaultdict(list),
+            # Extended info with variants (id -> [variants]), lazy
+            'extended': LazyExtendedMapping(),
             'by_name': defaultdict(list)    # Rytec entries by channel name
         }
 
@@ -460,10 +875,26 @@ class UnifiedChannelMapping:
         self.reverse_mapping = {}
         # Auto-discovered references (channel_id -> sref)
         self.auto_discovered = {}
+        # Clean-name aliases in optimized (alias -> owning DVB name)
+        self.optimized_aliases = {}
+        # Compiled exact-match chain (clean_name -> (sref, match_type))
+        self.resolved = {}
+
+        # Change tracking for incremental optimization
+        self._dirty_dvb_names = set()       # DVB names changed since last pass
+        self._dvb_rebuild_needed = True     # Full rebuild pending
+        # Source file -> DVB names holding services loaded from it
+        self.dvb_origins = defaultdict(set)
+        # Partitions filled at ingestion (partition -> name -> [services]).
+        # They keep hidden services, self.dvb is the active view.
+        self.dvb_partitions = {key: {} for key in self.DVB_PARTITIONS}
+        self.hidden_dvb_types = set()
 
         # Caches
         self._clean_name_cache = {}         # Cache for cleaned names
         self._clean_cache_max_size = 10000  # Cache max size
+        # Store DVB services as DVBService records (low-memory mode)
+        self.compact_records = False
 
     def clear(self):
         """Clear all mappings."""
@@ -473,6 +904,161 @@ class UnifiedChannelMapping:
         self.rytec['by_name'].clear()
         self.dvb.clear()
         self.optimized.clear()
+        self.optimized_aliases.clear()
+        self.resolved.clear()
         self.reverse_mapping.clear()
         self.auto_discovered.clear()
         self._clean_name_cache.clear()
+        self._dirty_dvb_names.clear()
+        self._dvb_rebuild_needed = True
+        self.dvb_origins.clear()
+        for partition in self.dvb_partitions.values():
+            partition.clear()
+        self.hidden_dvb_types.clear()
+
+    def _partition_keys(self, service):
+        """Partitions a service belongs to: its type, plus bouquet source."""
+        keys = []
+        if service.get("type") in self.dvb_partitions:
+            keys.append(service.get("type"))
+        if service.get("source") == "bouquet":
+            keys.append("bouquet")
+        return keys
+
+    def add_dvb_service(self, name, service, origin=None):
+        """Append a DVB service under a name and mark the name as changed.
+
+        origin is the source file the service comes from, used to unload
+        that source alone when it changes.
+        """
+        if self.compact_records and isinstance(service, dict):
+            service = DVBService(service)
+        if origin:
+            service["origin"] = origin
+            self.dvb_origins[origin].add(name)
+        self.dvb[name].append(service)
+        for key in self._partition_keys(service):
+            self.dvb_partitions[key].setdefault(name, []).append(service)
+        self._dirty_dvb_names.add(name)
+
+    def set_compact_records(self, compact):
+        """Switch the DVB record type, converting the loaded services too.
+
+        A service shared by dvb, a partition and optimized is converted
+        once, so those views keep pointing at the same record. Return the
+        number of services converted.
+        """
+        if compact == self.compact_records:
+            return 0
+        self.compact_records = compact
+        # id -> (old, new); the old record stays alive so ids are not reused
+        converted = {}
+
+        def convert(service):
+            entry = converted.get(id(service))
+            if entry is None:
+                if compact and isinstance(service, dict):
+                    new = DVBService(service)
+                elif not compact and isinstance(service, DVBService):
+                    new = service.copy()
+                else:
+                    new = service
+                entry = converted[id(service)] = (service, new)
+            return entry[1]
+
+        for services in self.dvb.values():
+            services[:] = [convert(s) for s in services]
+        for partition in self.dvb_partitions.values():
+            for services in partition.values():
+                services[:] = [convert(s) for s in services]
+        for name, service in self.optimized.items():
+            self.optimized[name] = convert(service)
+        return sum(1 for old, new in converted.values() if old is not new)
+
+    def remove_dvb_origin(self, origin):
+        """Remove all DVB services loaded from a source, return touched names."""
+        names = self.dvb_origins.pop(origin, set())
+        for name in names:
+            # Partitions too, as they also hold the hidden services
+            for key, partition in self.dvb_partitions.items():
+                services = partition.get(name)
+                if services:
+                    self._set_partition(
+                        key, name, [s for s in services if s.get("origin") != origin])
+            services = self.dvb.get(name)
+            if services:
+                self._set_active(
+                    name, [s for s in services if s.get("origin") != origin])
+        return names
+
+    def set_dvb_services(self, name, services):
+        """Replace the DVB services of a name, dropping the name if empty.
+
+        Partitions follow the new list, except for hidden services: they
+        are not part of the active list and are kept as they are.
+        """
+        new_ids = set(id(s) for s in services)
+        for key, partition in self.dvb_partitions.items():
+            kept = [s for s in partition.get(name, ()) if id(s) not in new_ids and
+                    self.hidden_dvb_types.intersection(self._partition_keys(s))]
+            self._set_partition(
+                key, name,
+                [s for s in services if key in self._partition_keys(s)] + kept)
+        self._set_active(name, services)
+
+    def _set_partition(self, key, name, services):
+        if services:
+            self.dvb_partitions[key][name] = services
+        else:
+            self.dvb_partitions[key].pop(name, None)
+
+    def _set_active(self, name, services):
+        if services:
+            self.dvb[name] = services
+        else:
+            self.dvb.pop(name, None)
+        self._dirty_dvb_names.add(name)
+
+    def hide_dvb_type(self, service_type, names=None):
+        """Take a partition's services out of the active view, return count.
+
+        Only the partition entries are visited, and only the given names
+        when set; the services stay in the partition for restore_dvb_type.
+        """
+        self.hidden_dvb_types.add(service_type)
+        partition = self.dvb_partitions[service_type]
+        if names is None:
+            names = list(partition)
+        removed_count = 0
+        for name in names:
+            hidden = partition.get(name)
+            services = self.dvb.get(name)
+            if not hidden or not services:
+                continue
+            hidden_ids = set(id(s) for s in hidden)
+            visible = [s for s in services if id(s) not in hidden_ids]
+            if len(visible) != len(services):
+                removed_count += len(services) - len(visible)
+                self._set_active(name, visible)
+        return removed_count
+
+    def restore_dvb_type(self, service_type):
+        """Put the services of a hidden partition back, return count."""
+        if service_type not in self.hidden_dvb_types:
+            return 0
+        self.hidden_dvb_types.discard(service_type)
+        restored_count = 0
+        for name, hidden in self.dvb_partitions[service_type].items():
+            services = self.dvb.get(name, [])
+            present = set(id(s) for s in services)
+            missing = [s for s in hidden if id(s) not in present]
+            if missing:
+                restored_count += len(missing)
+                self._set_active(name, services + missing)
+        return restored_count
+
+    def pop_dirty_dvb_names(self):
+        """Return and reset the set of DVB names changed since last call."""
+        dirty = self._dirty_dvb_names
+        self._dirty_dvb_names = set()
+        return dirty
@@ -0,0 +1,726 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+from os import fstat
+from bz2 import BZ2File
+from gzip import GzipFile
+from zipfile import ZipFile
+from mmap import mmap, ACCESS_READ
+from itertools import chain
+from hashlib import blake2b
+from json import JSONDecoder, JSONDecodeError
+from queue import Queue, Full
+from threading import Thread, Event
+from re import compile, IGNORECASE
+from urllib.parse import unquote
+
+try:
+    from lzma import LZMAFile
+except ImportError:
+    # Some images ship Python without liblzma
+    LZMAFile = None
+
+
+"""
+#########################################################
+#                                                       #
+#  Archimede Universal Converter Plugin                 #
+#  Version: 3.0                                         #
+#  Created by Lululla (https://github.com/Belfagor2005) #
+#  License: CC BY-NC-SA 4.0                             #
+#  https://creativecommons.org/licenses/by-nc-sa/4.0    #
+#  Last Modified: "20:05 - 20251102"                    #
+#                                                       #
+#  Credits:                                             #
+#  - Original concept by Lululla                        #
+#  Usage of this code without proper attribution        #
+#  is strictly prohibited.                              #
+#  For modifications and redistribution,                #
+#  please maintain this credit header.                  #
+#########################################################
+"""
+__author__ = "Lululla"
+
+
+# Compressed playlist suffixes, read through the decompressor on the fly
+COMPRESSED_SUFFIXES = ('.gz', '.xz', '.bz2', '.zip')
+PLAYLIST_SUFFIXES = ('.m3u', '.m3u8')
+
+
+def is_compressed(path):
+    """Return True if path names a compressed playlist."""
+    return path.lower().endswith(COMPRESSED_SUFFIXES)
+
+
+def is_url(path):
+    """Return True if path is a remote http(s) playlist."""
+    return path.lower().startswith(('http://', 'https://'))
+
+
+class _PrefetchError(object):
+    """Carries a producer exception across the prefetch queue."""
+
+    def __init__(self, error):
+        self.error = error
+
+
+_PREFETCH_END = object()
+
+
+def prefetch(items, maxsize=16):
+    """Iterate items while a background thread reads ahead.
+
+    The producer thread fills a queue of at most ``maxsize`` items, so a
+    download keeps running while the consumer parses and matches, and is
+    throttled when the consumer falls behind. An exception raised by the
+    source is re-raised in the consumer. When the consumer stops early
+    (the generator is closed) the producer exits after the item it is
+    reading and closes the source, which ends a download.
+    """
+    buffer = Queue(maxsize)
+    stop = Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.5)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if stop.is_set() or not put(item):
+                    return
+            put(_PREFETCH_END)
+        except Exception as e:
+            put(_PrefetchError(e))
+        finally:
+            close = getattr(items, 'close', None)
+            if close is not None:
+                close()
+
+    Thread(target=produce, name="PlaylistPrefetch", daemon=True).start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _PREFETCH_END:
+                return
+            if isinstance(item, _PrefetchError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+
+
+def chunk_lines(chunks):
+    """Split a stream of byte chunks into lines (without the newline)."""
+    pending = b''
+    try:
+        for chunk in chunks:
+            lines = (pending + chunk).split(b'\n')
+            pending = lines.pop()
+            for line in lines:
+                yield line
+        if pending:
+            yield pending
+    finally:
+        # Stopping early must reach a prefetch() source and its thread
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+
+
+def open_playlist_source(path):
+    """Open path as a binary stream, decompressing .gz/.xz/.bz2/.zip.
+
+    Nothing is extracted to disk: the returned file object inflates the
+    data while it is read. A .zip yields its first .m3u/.m3u8 member, or
+    its first file if none has a playlist suffix.
+    """
+    lower = path.lower()
+    if lower.endswith('.gz'):
+        return GzipFile(path, 'rb')
+    if lower.endswith('.bz2'):
+        return BZ2File(path, 'rb')
+    if lower.endswith('.xz'):
+        if LZMAFile is None:
+            raise ValueError("xz playlists are not supported on this image")
+        return LZMAFile(path, 'rb')
+    if lower.endswith('.zip'):
+        with ZipFile(path) as archive:
+            members = [name for name in archive.namelist() if not name.endswith('/')]
+            if not members:
+                raise ValueError("Empty zip archive")
+            playlists = [name for name in members if name.lower().endswith(PLAYLIST_SUFFIXES)]
+            # The member stays readable after the archive handle is closed
+            return archive.open((playlists or members)[0])
+    return open(path, 'rb')
+
+
+class ChannelDeduplicator:
+    """Drop duplicate channels while a playlist is parsed.
+
+    Policies:
+      exact    same name and URL (the historical behaviour)
+      url      same URL, whatever the name
+      quality  same normalized name; the best quality copy is kept
+
+    Keys are 8-byte blake2b digests, so memory does not grow with the
+    length of tokenized URLs. Drops are counted in ``dropped`` under the
+    rule that caught them: a copy of any record already read, kept or not,
+    counts as 'exact' under every policy.
+
+    'quality' is a whole-list policy: a later, better copy takes the
+    position of the kept record, so the parsers read the whole playlist
+    through collect() before yielding anything. Only the name digest,
+    rank and position of each kept record are remembered, plus the better
+    copies waiting to be placed; records already read are never edited.
+    """
+
+    POLICIES = ('exact', 'url', 'quality')
+
+    # Resolution markers, best first; codec markers are only stripped
+    QUALITY_PATTERN = compile(
+        r'\b(?:(uhd|4k|2160p?)|(fhd|full ?hd|1080[pi]?)|(hd|720p?)|(sd|576[pi]?|480p?)|hevc|h\.?26[45])\b',
+        IGNORECASE)
+    QUALITY_RANKS = (4, 3, 2, 0)
+    UNKNOWN_QUALITY = 1
+    NAME_NOISE_PATTERN = compile(r'[\W_]+')
+
+    def __init__(self, policy='exact'):
+        if policy not in self.POLICIES:
+            raise ValueError("Unknown dedupe policy: {}".format(policy))
+        self.policy = policy
+        self.dropped = dict.fromkeys(self.POLICIES, 0)
+        # (name, url) of every record read; URL or name keys per policy
+        self._copies = set()
+        # 'quality': name key -> (rank, position among the kept records)
+        self._seen = {} if policy == 'quality' else set()
+        self._kept = 0
+        self._better = {}
+
+    @staticmethod
+    def digest(*parts):
+        """Fixed-size key of the given strings."""
+        return blake2b(
+            '\0'.join(parts).encode('utf-8', 'replace'), digest_size=8).digest()
+
+    def quality_key(self, name):
+        """Return (normalized name, quality rank) of a channel name."""
+        rank = None
+        for match in self.QUALITY_PATTERN.finditer(name):
+            for group, group_rank in zip(match.groups(), self.QUALITY_RANKS):
+                if group and (rank is None or group_rank > rank):
+                    rank = group_rank
+        normalized = self.NAME_NOISE_PATTERN.sub('', self.QUALITY_PATTERN.sub('', name).lower())
+        if rank is None:
+            rank = self.UNKNOWN_QUALITY
+        return normalized or name.lower(), rank
+
+    def accept(self, record):
+        """Return True if record is kept, False if it is a duplicate."""
+        name = record['name']
+        url = record['url']
+        seen = self._seen
+
+        copy_key = self.digest(name, url)
+        if copy_key in self._copies:
+            self.dropped['exact'] += 1
+            return False
+        self._copies.add(copy_key)
+
+        if self.policy == 'exact':
+            return True
+
+        if self.policy == 'url':
+            key = self.digest(url)
+            if key in seen:
+                self.dropped['url'] += 1
+                return False
+            seen.add(key)
+            return True
+
+        normalized, rank = self.quality_key(name)
+        key = self.digest(normalized)
+        kept = seen.get(key)
+        if kept is None:
+            seen[key] = (rank, self._kept)
+            self._kept += 1
+            return True
+        kept_rank, position = kept
+        self.dropped['quality'] += 1
+        if rank > kept_rank:
+            # Placed by collect(): the kept record may be in use already
+            self._better[position] = record
+            seen[key] = (rank, position)
+        return False
+
+    def collect(self, records):
+        """Return the accepted records as a list, better copies in place.
+
+        records are the ones accept() kept, in order; under 'quality' this
+        is the only way to get the final choice of each channel.
+        """
+        channels = list(records)
+        for position, record in self._better.items():
+            channels[position] = record
+        self._better.clear()
+        return channels
+
+    def filter(self, channels):
+        """Yield the channels kept by the policy."""
+        accept = self.accept
+        for channel in channels:
+            if accept(channel):
+                yield channel
+
+
+class M3UStreamParser:
+    """Streaming parser for M3U/M3U8 playlists.
+
+    Iterating yields one normalized channel dict per entry while the
+    source is read line by line. The playlist EPG URL (url-tvg / x-tvg-url
+    on #EXTM3U, #EXTEPGURL, #EXTVLCOPT:epg-url) is collected in the same
+    pass and exposed as ``epg_url``. A positive ``limit`` stops the
+    iteration after that many channels. An optional ``token`` (see
+    core_converter.ConversionToken) is stepped once per channel, which
+    reports progress and stops the parse when the conversion is cancelled.
+    An optional ``dedupe`` ChannelDeduplicator drops duplicate channels
+    before they are counted; its 'quality' policy reads the whole playlist
+    before the first channel is yielded.
+    """
+
+    # #EXTINF body in one match: duration, attribute part up to the first
+    # comma outside quotes (quoted values may contain commas), title
+    EXTINF_PATTERN = compile(r'(-?\d+)?([^,"]*(?:"[^"]*"[^,"]*)*),\s*(.*)')
+    ATTRIBUTE_PATTERN = compile(r'([^\s=",]+)="([^"]*)"')
+    HEADER_EPG_KEYS = ('url-tvg', 'x-tvg-url')
+
+    # M3U attribute -> channel record field
+    ATTRIBUTE_FIELDS = {
+        'tvg-id': 'tvg_id',
+        'tvg-name': 'tvg_name',
+        'tvg-logo': 'logo',
+        'group-title': 'group',
+        'tvg-language': 'language',
+        'program-id': 'program_id',
+        'user-agent': 'user_agent',
+        'http-user-agent': 'user_agent'
+    }
+    EMPTY_RECORD = {
+        'name': '',
+        'url': '',
+        'group': '',
+        'tvg_id': '',
+        'tvg_name': '',
+        'logo': '',
+        'duration': '-1',
+        'user_agent': '',
+        'language': '',
+        'program_id': ''
+    }
+
+    def __init__(self, source, url_processor=None, encoding='utf-8', limit=0,
+                 token=None, dedupe=None):
+        """source is a file path or any iterable of text/bytes lines."""
+        self.source = source
+        self.url_processor = url_processor
+        self.encoding = encoding
+        self.limit = limit
+        self.token = token
+        self.dedupe = dedupe
+        self.epg_url = None
+        self.count = 0
+
+    def __iter__(self):
+        if self.dedupe is not None and self.dedupe.policy == 'quality':
+            return iter(self.dedupe.collect(self._channels()))
+        return self._channels()
+
+    def _channels(self):
+        if isinstance(self.source, str) and is_compressed(self.source):
+            with open_playlist_source(self.source) as f:
+                for channel in self._parse(self._text_lines(f)):
+                    yield channel
+        elif isinstance(self.source, str):
+            with open(self.source, 'r', encoding=self.encoding, errors='replace') as f:
+                for channel in self._parse(self._text_lines(f)):
+                    yield channel
+        else:
+            try:
+                for channel in self._parse(self._text_lines(self.source)):
+                    yield channel
+            finally:
+                # A limit or a cancel must not leave a download running
+                close = getattr(self.source, 'close', None)
+                if close is not None:
+                    close()
+
+    def _text_lines(self, lines):
+        """Decode byte sources and drop a leading BOM, checked once."""
+        lines = iter(lines)
+        first = next(lines, None)
+        if first is None:
+            return iter(())
+        if isinstance(first, bytes):
+            encoding = self.encoding
+            first = first.decode(encoding, 'replace')
+            lines = (line.decode(encoding, 'replace') for line in lines)
+        return chain((first.lstrip('\ufeff'),), lines)
+
+    def count_entries(self):
+        """Count the #EXTINF entries of a file source without decoding it.
+
+        The file is memory-mapped and scanned with find() for markers at
+        line starts, so a playlist of hundreds of MB is counted without
+        building a single str. Entries lacking a URL are counted too: the
+        result is an upper bound of what iteration yields. Compressed
+        sources cannot be mapped and are scanned through the decompressor.
+        """
+        if is_compressed(self.source):
+            with open_playlist_source(self.source) as f:
+                count = sum(1 for line in f if line.startswith(b'#EXTINF:'))
+            return min(count, self.limit) if self.limit else count
+
+        with open(self.source, 'rb') as f:
+            if not fstat(f.fileno()).st_size:
+                return 0
+            data = mmap(f.fileno(), 0, access=ACCESS_READ)
+            try:
+                find = data.find
+                count = 1 if data[:8] == b'#EXTINF:' else 0
+                pos = find(b'\n#EXTINF:')
+                while pos >= 0:
+                    count += 1
+                    pos = find(b'\n#EXTINF:', pos + 9)
+            finally:
+                data.close()
+        if self.limit:
+            return min(count, self.limit)
+        return count
+
+    def _set_epg_url(self, value):
+        """Keep the first EPG URL found (first of a comma separated list)."""
+        if self.epg_url or not value:
+            return
+        value = value.split(',')[0].strip()
+        if value:
+            self.epg_url = value
+
+    def parse_extinf(self, content):
+        """Return a channel record filled from an #EXTINF body."""
+        record = self.EMPTY_RECORD.copy()
+        match = self.EXTINF_PATTERN.match(content)
+        if match is None:
+            # No title separator, or an unbalanced quote before it
+            record['name'] = content[content.rfind(',') + 1:].strip()
+            return record
+
+        length, attributes_part, record['name'] = match.groups()
+        if length:
+            record['duration'] = length
+        if '=' in attributes_part:
+            fields = self.ATTRIBUTE_FIELDS
+            for key, value in self.ATTRIBUTE_PATTERN.findall(attributes_part):
+                field = fields.get(key) or fields.get(key.lower())
+                if field:
+                    record[field] = value
+        return record
+
+    def _parse(self, lines):
+        record = None
+        url_processor = self.url_processor
+        token = self.token
+        dedupe = self.dedupe
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            if line[0] != '#':
+                if record is not None:
+                    if record['name']:
+                        record['url'] = url_processor(line) if url_processor else line
+                        if dedupe is not None and not dedupe.accept(record):
+                            record = None
+                            continue
+                        self.count += 1
+                        if token is not None:
+                            token.step(record['name'])
+                        yield record
+                        if self.count == self.limit:
+                            return
+                    record = None
+
+            elif line.startswith('#EXTINF:'):
+                record = self.parse_extinf(line[8:].lstrip())
+
+            elif line.startswith('#EXTGRP:'):
+                if record is not None:
+                    record['group'] = line[8:].strip()
+
+            elif line.startswith('#EXTVLCOPT:'):
+                opt_line = line[11:].strip()
+                if '=' in opt_line:
+                    key, value = opt_line.split('=', 1)
+                    key = key.lower().strip()
+                    if key == 'http-user-agent':
+                        if record is not None:
+                            record['user_agent'] = value.strip()
+                    elif key == 'epg-url':
+                        self._set_epg_url(value)
+
+            elif line.startswith('#EXTM3U'):
+                for key, value in self.ATTRIBUTE_PATTERN.findall(line[7:]):
+                    if key.lower() in self.HEADER_EPG_KEYS:
+                        self._set_epg_url(value)
+
+            elif line.startswith('#EXTEPGURL'):
+                self._set_epg_url(line[10:].lstrip(':').strip())
+
+
+class _JSONTextBuffer:
+    """Sliding text window over a JSON file, decoded value by value."""
+
+    WHITESPACE_PATTERN = compile(r'[ \t\r\n\ufeff]*')
+    SEPARATOR_PATTERN = compile(r'[ \t\r\n]*([,\]])[ \t\r\n]*')
+    WHITESPACE_CHARS = ' \t\r\n\ufeff'
+    NUMBER_CHARS = '-+.eE0123456789'
+
+    def __init__(self, f, chunk_size):
+        self.read = f.read
+        self.chunk_size = chunk_size
+        self.decode = JSONDecoder().raw_decode
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size=0):
+        """Append at least one chunk (``size`` characters if larger),
+        dropping consumed text; False at end of file."""
+        if self.eof:
+            return False
+        chunks = []
+        wanted = max(size, self.chunk_size)
+        while wanted > 0:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                self.eof = True
+                break
+            chunks.append(chunk)
+            wanted -= len(chunk)
+        if not chunks:
+            return False
+        if self.pos:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        self.text += ''.join(chunks)
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character, '' at end of file."""
+        while True:
+            self.pos = self.WHITESPACE_PATTERN.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError("Malformed JSON: expected '{}'".format(char))
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        if self.pos >= len(self.text) or self.text[self.pos] in self.WHITESPACE_CHARS:
+            self.peek()
+        while True:
+            try:
+                value, end = self.decode(self.text, self.pos)
+            except JSONDecodeError:
+                # Value cut by the window end: read on, or give up at EOF.
+                # The pending text is at least doubled before retrying, so
+                # a long value is decoded O(1) times per byte, not per chunk
+                if self.fill(len(self.text) - self.pos):
+                    continue
+                raise
+            # A number may go on in the next chunk ("1" of "1.5")
+            if (end == len(self.text) or (
+                    self.text[end] in self.NUMBER_CHARS and
+                    self.text[self.pos] in self.NUMBER_CHARS)) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def array_values(self):
+        """Yield the values of the array starting at the next character."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        separator_match = self.SEPARATOR_PATTERN.match
+        while True:
+            yield self.value()
+            # Common case: separator and next value already in the window
+            match = separator_match(self.text, self.pos)
+            if match is not None and match.end() < len(self.text):
+                self.pos = match.end()
+                separator = match.group(1)
+            else:
+                separator = self.peek()
+                self.pos += 1
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError("Malformed JSON array")
+
+
+class JSONStreamParser:
+    """Incremental reader for JSON playlists.
+
+    Channel objects are decoded one at a time with raw_decode over a
+    sliding text window, so memory is bounded by the largest object rather
+    than by the file. The channel array is the top-level value or the
+    first list under one of CONTAINER_KEYS, found while scanning the
+    members; the key used is exposed as ``container``. Without such a key
+    the first list member holding objects is used, read in a second pass
+    so that no list is held in memory. Iterating yields records
+    with the same fields as M3UStreamParser, honouring ``limit``,
+    ``token`` and ``dedupe`` the same way.
+    """
+
+    CONTAINER_KEYS = ('channels', 'playlist', 'items', 'streams', 'data')
+    URL_PROTOCOLS = ('http://', 'https://', 'rtsp://', 'rtmp://', 'udp://', 'rtp://')
+    CHUNK_SIZE = 65536
+
+    def __init__(self, source, encoding='utf-8', limit=0, token=None, dedupe=None):
+        self.source = source
+        self.encoding = encoding
+        self.limit = limit
+        self.token = token
+        self.dedupe = dedupe
+        self.container = None
+        self.epg_url = None
+        self.count = 0
+        # Position of the first unknown member holding objects
+        self._fallback = None
+
+    def __iter__(self):
+        if self.dedupe is not None and self.dedupe.policy == 'quality':
+            return iter(self.dedupe.collect(self._channels()))
+        return self._channels()
+
+    def _channels(self):
+        self._fallback = None
+        with open(self.source, 'r', encoding=self.encoding, errors='replace') as f:
+            for channel in self._parse(_JSONTextBuffer(f, self.CHUNK_SIZE)):
+                yield channel
+        if self.container is None and self._fallback is not None:
+            with open(self.source, 'r', encoding=self.encoding, errors='replace') as f:
+                buffer = _JSONTextBuffer(f, self.CHUNK_SIZE)
+                for channel in self._parse(buffer, self._fallback):
+                    yield channel
+
+    def _channel_objects(self, buffer, member=None):
+        """Yield the raw items of the channel array.
+
+        A list under a CONTAINER_KEYS key is the channel array. Other list
+        members are passed over item by item, noting the position of the
+        first one holding objects in ``_fallback``. With ``member`` only
+        the list at that position is read.
+        """
+        first = buffer.peek()
+        if first == '[':
+            self.container = ''
+            for item in buffer.array_values():
+                yield item
+            return
+        if first != '{':
+            raise ValueError("Unsupported JSON structure")
+
+        buffer.pos += 1
+        if buffer.peek() == '}':
+            return
+        index = 0
+        while True:
+            key = buffer.value()
+            buffer.expect(':')
+            if buffer.peek() == '[':
+                if member is None:
+                    wanted = key in self.CONTAINER_KEYS
+                else:
+                    wanted = index == member
+                if wanted:
+                    self.container = key
+                    for item in buffer.array_values():
+                        yield item
+                    return
+                for item in buffer.array_values():
+                    if self._fallback is None and isinstance(item, dict):
+                        self._fallback = index
+            else:
+                buffer.value()
+            index += 1
+            separator = buffer.peek()
+            buffer.pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise ValueError("Malformed JSON object")
+
+    def normalize(self, channel):
+        """Map a JSON channel object to a record, None without a valid URL."""
+        url = (channel.get('url') or channel.get('link') or channel.get('stream') or
+               channel.get('source') or channel.get('address') or '')
+        if not url:
+            return None
+        if '%' in url:
+            url = unquote(url)
+        if not url.startswith(self.URL_PROTOCOLS):
+            # Possibly encoded twice
+            if '%' not in url:
+                return None
+            url = unquote(url)
+            if not url.startswith(self.URL_PROTOCOLS):
+                return None
+
+        name = (channel.get('name') or channel.get('title') or channel.get('channel') or
+                channel.get('channel_name') or 'Unknown')
+        record = M3UStreamParser.EMPTY_RECORD.copy()
+        record.update({
+            'name': name,
+            'url': url,
+            'group': (channel.get('group') or channel.get('category') or
+                      channel.get('group-title') or channel.get('group_title') or ''),
+            'logo': (channel.get('logo') or channel.get('icon') or
+                     channel.get('tvg-logo') or channel.get('tvg_logo') or ''),
+            'tvg_id': (channel.get('tvg-ID') or channel.get('tvg_id') or
+                       channel.get('id') or channel.get('channel_id') or ''),
+            'tvg_name': channel.get('tvg-name') or channel.get('tvg_name') or name,
+            'duration': channel.get('duration', '-1'),
+            'user_agent': channel.get('user-agent') or channel.get('user_agent') or '',
+            'program_id': channel.get('program-id') or channel.get('program_id') or ''
+        })
+        return record
+
+    def _parse(self, buffer, member=None):
+        dedupe = self.dedupe
+        token = self.token
+        for channel in self._channel_objects(buffer, member):
+            if not isinstance(channel, dict):
+                continue
+            record = self.normalize(channel)
+            if record is None:
+                continue
+            if dedupe is not None and not dedupe.accept(record):
+                continue
+            self.count += 1
+            if token is not None:
+                token.step(record['name'])
+            yield record
+            if self.count == self.limit:
+                return
+
@@ -8,12 +8,14 @@ import codecs
 import hashlib
 import threading
 import subprocess
+from sys import getsizeof
 from time import strftime
 from threading import Lock
-from urllib.parse import unquote
+from itertools import islice
+from urllib.parse import unquote, urlparse
 from collections import defaultdict
-from os import access, W_OK, listdir, remove, replace, chmod, mkdir, makedirs
-from re import compile, sub, findall, DOTALL, MULTILINE, IGNORECASE, search, escape
+from os import access, W_OK, listdir, remove, replace, chmod, mkdir, makedirs, stat, nice
+from re import compile, sub, findall, DOTALL, IGNORECASE, search, escape
 from os.path import exists, isdir, isfile, join, normpath, basename, dirname, getsize, getmtime
 
 from twisted.internet import threads
@@ -27,11 +29,12 @@ from Components.Sources.Progress import Progress
 from Components.Sources.StaticText import StaticText
 from Components.config import (
     config, ConfigSelection, ConfigSubsection, ConfigYesNo,
-    ConfigNumber, ConfigSelectionNumber
+    ConfigNumber, ConfigSelectionNumber, ConfigText
 )
 from Screens.Screen import Screen
 from Screens.ChoiceBox import ChoiceBox
 from Screens.MessageBox import MessageBox
+from Screens.VirtualKeyBoard import VirtualKeyBoard
 from Tools.Directories import fileExists
 
 from . import _, __version__
@@ -46,6 +49,7 @@ from .constants import (
     LOG_DIR,
     DEBUG_DIR,
     DB_PATCH,
+    EPG_CACHE_DIR,
     LANGUAGE_TO_COUNTRY
 )
 from .utils import (
@@ -54,11 +58,23 @@ from .utils import (
     _reload_services_after_delay,
     create_bouquets_backup,
     clean_group_name,
+    is_vod_entry,
     update_mounts_configuration,
     default_movie_path
 )
 from .plugin_info import PluginInfoScreen
-from .core_converter import CoreConverter, UnifiedChannelMapping
+from .playlist_parser import (
+    M3UStreamParser, JSONStreamParser, ChannelDeduplicator, is_compressed,
+    is_url, prefetch, chunk_lines
+)
+from .core_converter import (
+    CoreConverter,
+    UnifiedChannelMapping,
+    TrigramBloomFilter,
+    StreamingBouquetWriter,
+    ConversionToken,
+    ConversionCancelled
+)
 
 
 """
@@ -135,12 +151,34 @@ config.plugins.m3uconverter.lastdir = ConfigSelection(
     default=default_dir, choices=[])
 config.plugins.m3uconverter.large_file_threshold_mb = ConfigSelectionNumber(
     default=10, stepwidth=5, min=1, max=50)
+# Optional cap on converted channels per playlist (0 = all channels)
+config.plugins.m3uconverter.max_channels = ConfigSelectionNumber(
+    default=0, stepwidth=5000, min=0, max=100000)
+# Duplicate channels dropped while parsing
+config.plugins.m3uconverter.dedupe_policy = ConfigSelection(
+    default="exact", choices=[
+        ("exact", _("Same name and URL")),
+        ("url", _("Same URL")),
+        ("quality", _("Same name, keep best quality"))])
+# Last playlist URL entered for "Convert from URL"
+config.plugins.m3uconverter.last_url = ConfigText(
+    default="http://", fixed_size=False)
 
 # Bouquet Settings
 config.plugins.m3uconverter.bouquet_mode = ConfigSelection(
     default="single", choices=[
         ("single", _("Single Bouquet")), ("multi", _("Multiple Bouquets"))])
 
+# Movies/series entries: no EPG matching, optionally in their own bouquets
+config.plugins.m3uconverter.vod_handling = ConfigSelection(
+    default="skip_epg",
+    choices=[
+        ("match", _("Match EPG like live channels")),
+        ("skip_epg", _("Skip EPG matching")),
+        ("separate", _("Skip EPG, separate VOD bouquets"))
+    ]
+)
+
 config.plugins.m3uconverter.bouquet_position = ConfigSelection(
     default="bottom",
     choices=[("top", _("Top")), ("bottom", _("Bottom"))]
@@ -153,6 +191,12 @@ config.plugins.m3uconverter.hls_convert = ConfigYesNo(default=True)
 config.plugins.m3uconverter.backup_enable = ConfigYesNo(default=True)
 config.plugins.m3uconverter.max_backups = ConfigNumber(default=3)
 config.plugins.m3uconverter.enable_debug = ConfigYesNo(default=False)
+config.plugins.m3uconverter.preload_databases = ConfigYesNo(default=False)
+# Low-memory profile for 256/512 MB receivers: cache_budget caps the total
+# number of cached entries (match, clean-name and manual lookup caches)
+config.plugins.m3uconverter.low_memory_mode = ConfigYesNo(default=False)
+config.plugins.m3uconverter.cache_budget = ConfigSelectionNumber(
+    default=4000, stepwidth=1000, min=1000, max=20000)
 
 # EPG Settings
 config.plugins.m3uconverter.epg_enabled = ConfigYesNo(default=True)
@@ -200,6 +244,10 @@ config.plugins.m3uconverter.language = ConfigSelection({
     "all": "All Countries - IPTV"
 }, default="all")
 
+# Additional EPGShare feeds: comma separated language codes (e.g. "de,en")
+config.plugins.m3uconverter.extra_epg_languages = ConfigText(
+    default="", fixed_size=False)
+
 config.plugins.m3uconverter.epg_generation_mode = ConfigSelection(
     default="epgshare", choices=[
         ("epgshare", _("EPGShare Mode")), ("standard", _("Standard Mode"))])
@@ -246,12 +294,14 @@ aspect_manager = AspectManager()
 class EPGServiceMapper:
     """Service mapper for EPG data matching and conversion."""
 
-    def __init__(self, prefer_satellite=True):
+    def __init__(self, prefer_satellite=True, manual_db=None):
         self._match_cache = {}
         self._match_cache_hits = 0
         self._match_cache_misses = 0
         self._incompatible_matches = 0
         self._cache_max_size = 5000
+        self._epg_cache_max_size = 10000
+        self.low_memory = False
 
         self.epg_cache = {}
         self.epg_cache_hits = 0
@@ -269,6 +319,23 @@ class EPGServiceMapper:
 
         self._rytec_lock = Lock()
 
+        # Loaded source files: path -> (kind, mtime, size, md5 or None)
+        self._source_fingerprints = {}
+        # Only files up to this size are hashed (bouquets, lamedb)
+        self._source_hash_limit = 4 * 1024 * 1024
+        # Cached EPGShare bodies: path -> feed URL
+        self._epgshare_feeds = {}
+        self._bouquet_dir = None
+        # Set when Rytec/EPGShare names change: recompile mapping.resolved
+        self._resolution_stale = False
+
+        # Trigram prefilter over database names (rebuilt with the table)
+        self._name_prefilter = TrigramBloomFilter()
+        self._prefilter_checks = 0
+        self._prefilter_skips = 0
+        # ConversionToken of the running conversion, checked by long scans
+        self.token = None
+
         # non utilizzata
         # self.enigma_config = self._load_enigma2_configuration()
 
@@ -282,7 +349,9 @@ class EPGServiceMapper:
 
         # REPLACED: Multiple separate mappings with UnifiedChannelMapping
         self.mapping = UnifiedChannelMapping()
-        self.manual_db = ManualDatabaseManager()
+        self.manual_db = manual_db or ManualDatabaseManager()
+        self.manual_db.add_change_listener(self.on_manual_db_changed)
+        self._apply_memory_profile()
         if config.plugins.m3uconverter.enable_debug.value:
             logger.info("✅ Manual database integrated into EPG mapper")
 
@@ -402,7 +471,8 @@ class EPGServiceMapper:
                     if config.plugins.m3uconverter.enable_debug.value:
                         logger.info(
                             f"🌐 Downloading EPGShare data for language: {language}")
-                    self._download_and_parse_epgshare(language)
+                    self._download_and_parse_epgshare(
+                        language, self._get_extra_epg_languages())
 
             # 4. Fallback only if needed
             if (self.database_mode == "both" and
@@ -438,6 +508,73 @@ class EPGServiceMapper:
             logger.error(f"❌ Initialization failed: {str(e)}")
             return False
 
+    def load_databases(self):
+        """Load lamedb, bouquets and Rytec for the shared mapper (UI path)."""
+        # LOAD ALL DATABASES SEQUENTIALLY - ONLY ONCE
+        if config.plugins.m3uconverter.enable_debug.value:
+            logger.info("📥 Loading all databases...")
+
+        # 1. First local databases (essential)
+        self._parse_lamedb()
+        if config.plugins.m3uconverter.enable_debug.value:
+            logger.info(
+                "✅ Lamedb loaded: %s channels",
+                len(self.mapping.dvb)
+            )
+
+        self._parse_existing_bouquets()
+        if config.plugins.m3uconverter.enable_debug.value:
+            logger.info("✅ Existing bouquets loaded")
+
+        # 2. FORCE Rytec loading with debug
+        if config.plugins.m3uconverter.enable_debug.value:
+            logger.info("🔍 LOADING RYTEC DATABASE...")
+        rytec_paths = [
+            "/etc/epgimport/rytec.channels.xml",
+            "/usr/lib/enigma2/python/Plugins/Extensions/EPGImport/rytec.channels.xml",
+        ]
+
+        for rytec_path in rytec_paths:
+            if fileExists(rytec_path):
+                if config.plugins.m3uconverter.enable_debug.value:
+                    logger.info(f"📁 Rytec file found: {rytec_path}")
+                self._parse_rytec_channels(rytec_path)
+
+                # check 'basic' instead of 'extended'
+                rytec_count = len(self.mapping.rytec['basic'])
+                if rytec_count > 0:
+                    if config.plugins.m3uconverter.enable_debug.value:
+                        logger.info(
+                            "✅ Rytec database loaded: %s channels",
+                            rytec_count
+                        )
+                    break
+                else:
+                    logger.error(
+                        "❌ Rytec file exists but 0 channels loaded from: %s", rytec_path)
+            else:
+                logger.warning(f"📁 File not found: {rytec_path}")
+        # 3. Channel mapping and optimizations
+        self._load_channel_mapping()
+        if config.plugins.m3uconverter.ignore_dvbt.value:
+            self._clear_dvbt_services()
+
+        self.optimize_matching()
+
+        # clean csv < 20mb
+        self._cleanup_smart()
+
+        # FINAL CHECK
+        final_rytec = len(self.mapping.rytec.get('basic', {}))
+        final_dvb = len(self.mapping.dvb)
+        if config.plugins.m3uconverter.enable_debug.value:
+            logger.info(
+                "🎯 FINAL DATABASE STATUS: Rytec=%s, DVB=%s",
+                final_rytec,
+                final_dvb
+            )
+        return self
+
     def _load_channel_mapping(
             self,
             mapping_path="/usr/lib/enigma2/python/Plugins/Extensions/M3UConverter/channel_mapping.conf"):
@@ -515,12 +652,62 @@ class EPGServiceMapper:
                     self.database_mode
                 )
             self.reset_caches(clear_match_cache=True)
+            if self._source_fingerprints:
+                self.compile_resolution_table()
+
+        self._apply_memory_profile()
+
+        # DVB-T toggle and dtt mode switch the partition, no rescan
+        if self._source_fingerprints and self._apply_dvbt_filter():
+            self.optimize_matching()
+
+        # Pick up channel list updates made since the databases were loaded
+        if self._source_fingerprints:
+            self.reload_changed_sources()
 
         logger.info(
             "🔄 Config refreshed - Database mode: %s",
             self.database_mode
         )
 
+    def _apply_memory_profile(self):
+        """Size the caches from the low-memory settings.
+
+        In low-memory mode cache_budget is split between the match cache
+        (1/2), the EPG cache (1/5) and the clean-name cache (the rest), and
+        the manual DB lookup cache gets the same share as the EPG cache.
+        """
+        self.low_memory = config.plugins.m3uconverter.low_memory_mode.value
+        if self.low_memory:
+            budget = config.plugins.m3uconverter.cache_budget.value
+            self._cache_max_size = budget // 2
+            self._epg_cache_max_size = budget // 5
+            self.mapping._clean_cache_max_size = (
+                budget - self._cache_max_size - self._epg_cache_max_size)
+            self.manual_db._manual_cache_max_size = self._epg_cache_max_size
+        else:
+            self._cache_max_size = 5000
+            self._epg_cache_max_size = 10000
+            self.mapping._clean_cache_max_size = 10000
+            self.manual_db._manual_cache_max_size = 5000
+        # Services loaded before the switch are converted as well
+        converted = self.mapping.set_compact_records(self.low_memory)
+
+        # Shrink caches that already exceed the new limits
+        if len(self._match_cache) > self._cache_max_size:
+            self._clean_match_cache_lru()
+        self._clean_epg_cache()
+        if len(self.mapping._clean_name_cache) > self.mapping._clean_cache_max_size:
+            self.mapping._clean_name_cache.clear()
+
+        if config.plugins.m3uconverter.enable_debug.value:
+            logger.info(
+                "🧠 Memory profile: %s (match cache %s, clean-name cache %s, %s services converted)",
+                "low" if self.low_memory else "normal",
+                self._cache_max_size,
+                self.mapping._clean_cache_max_size,
+                converted)
+
     def _optimize_memory_usage(self):
         """Periodic memory cleanup with LRU strategy"""
         try:
@@ -563,6 +750,7 @@ class EPGServiceMapper:
             excess = current_size - int(self._cache_max_size * 0.75)
 
             # Sort by timestamp to remove oldest entries
+            keys_to_remove = []
             entries_with_times = []
             for key, value in self._match_cache.items():
                 if isinstance(value, dict) and 'timestamp' in value:
@@ -585,8 +773,8 @@ class EPGServiceMapper:
 
     def _clean_epg_cache(self):
         """Clean EPG cache"""
-        if len(self.epg_cache) > 10000:
-            excess = len(self.epg_cache) - 8000
+        if len(self.epg_cache) > self._epg_cache_max_size:
+            excess = len(self.epg_cache) - int(self._epg_cache_max_size * 0.8)
             # Remove random entries (simpler than tracking usage)
             keys_to_remove = list(self.epg_cache.keys())[:excess]
             for key in keys_to_remove:
@@ -671,7 +859,12 @@ class EPGServiceMapper:
             # STEP 9: Minimal normalization
             cleaned = sub(r'[\\/_,;:]', '', cleaned).strip()
 
-            self.mapping._clean_name_cache[cache_key] = cleaned
+            clean_cache = self.mapping._clean_name_cache
+            if len(clean_cache) >= self.mapping._clean_cache_max_size:
+                # Names repeat within one load/conversion pass, so a full
+                # reset is cheaper than tracking usage order
+                clean_cache.clear()
+            clean_cache[cache_key] = cleaned
             return cleaned
 
         except Exception as e:
@@ -683,6 +876,11 @@ class EPGServiceMapper:
                 ')', '') if name else ""
             return fallback
 
+    def _check_cancelled(self):
+        """Raise ConversionCancelled if the running conversion was cancelled."""
+        if self.token is not None:
+            self.token.check()
+
     def _search_case_insensitive_matches(
             self, channel_name, clean_name, tvg_id):
         """Search for matches with case-insensitive and number variations"""
@@ -737,6 +935,7 @@ class EPGServiceMapper:
 
         # Search each variant in the Rytec database
         for variant in variants:
+            self._check_cancelled()
             # Search in Rytec basic
             for rytec_id, service_ref in self.mapping.rytec['basic'].items():
                 if not service_ref:
@@ -806,53 +1005,254 @@ class EPGServiceMapper:
 
         return ':'.join(parts)
 
-    def optimize_matching(self):
-        """Optimize channel map structures for faster matching."""
-        self.mapping.optimized.clear()
+    # Parallel EPGShare downloads (kept low for receiver bandwidth/RAM)
+    EPG_FETCH_WORKERS = 3
+    # Names sharing fewer of their trigrams with the databases skip fuzzy search
+    PREFILTER_MIN_SHARED = 0.34
+    # One rytec.channels.xml entry with its optional comment
+    RYTEC_ENTRY_PATTERN = compile(
+        rb'(<!--\s*([^>]+)\s*-->)?\s*<channel id="([^"]+)">([^<]+)</channel>\s*(?:<!--\s*([^>]+)\s*-->)?')
+    # Comment holding only a satellite position, e.g. "19.2E"
+    RYTEC_POSITION_PATTERN = compile(r'^\d+(\.\d+)?\s*[EW]$', IGNORECASE)
+
+    # Ranking used to pick the main service of a DVB name: lower wins
+    DVB_SOURCE_PRIORITY = {"bouquet": 0, "lamedb": 1, "lamedb5": 1}
+    DVB_TYPE_PRIORITY = {"satellite": 0, "dvb-c": 1, "dvb-t": 2}
+
+    def optimize_matching(self, force=False):
+        """Optimize channel map structures for faster matching.
+
+        A full rebuild runs only the first time or when forced; afterwards
+        only the DVB names changed since the previous call are refreshed.
+        """
+        mapping = self.mapping
+        if not force and not mapping._dvb_rebuild_needed:
+            dirty_names = mapping.pop_dirty_dvb_names()
+            if dirty_names:
+                self.update_optimized(dirty_names)
+            if self._resolution_stale:
+                self.compile_resolution_table()
+            elif dirty_names:
+                self.update_resolution_table(
+                    set(dirty_names) | set(
+                        self.clean_channel_name(name) for name in dirty_names))
+            elif config.plugins.m3uconverter.enable_debug.value:
+                logger.debug("Optimized channel map already up to date")
+            return len(dirty_names)
+
+        mapping.optimized.clear()
+        mapping.optimized_aliases.clear()
+        mapping.pop_dirty_dvb_names()
 
         if config.plugins.m3uconverter.enable_debug.value:
             logger.info(
                 "Debug DVB mapping keys: %s", list(
-                    self.mapping.dvb.keys())[
-                    :10] if self.mapping.dvb else 'EMPTY')
+                    mapping.dvb.keys())[
+                    :10] if mapping.dvb else 'EMPTY')
             logger.info(
                 "Total DVB channels: %s",
-                len(self.mapping.dvb) if self.mapping.dvb else 0
+                len(mapping.dvb) if mapping.dvb else 0
             )
 
-        for name, services in self.mapping.dvb.items():
-            if not services:
-                continue
+        for name, services in mapping.dvb.items():
+            main_service = self._select_main_service(services)
+            if main_service:
+                self._store_optimized(name, main_service)
 
-            bouquet_services = [
-                s for s in services if s["source"] == "bouquet"]
+        mapping._dvb_rebuild_needed = False
+        self.compile_resolution_table()
 
-            satellite_services = [
-                s for s in services if s["type"] == "satellite" and s["source"] == "lamedb"]
+        if config.plugins.m3uconverter.enable_debug.value:
+            logger.info(
+                "Optimized channel map built: %s entries",
+                len(mapping.optimized)
+            )
+        return len(mapping.dvb)
+
+    def _resolve_exact(self, clean_name):
+        """Run the exact-match chain for one clean name.
+
+        Manual DB -> Rytec/EPGShare display name -> optimized DVB -> DVB-T,
+        as enabled by the database mode. Returns (sref, match_type) or None.
+        """
+        manual = self.manual_db.get_clean_name_index().get(clean_name)
+        if manual and manual.get('assigned_sref'):
+            return manual['assigned_sref'], 'manual_db'
+
+        if self.database_mode in ["full", "both", "rytec"]:
+            service_ref = self._find_rytec_by_name(clean_name)
+            if service_ref:
+                return service_ref, 'rytec_name_exact'
+
+        if self.database_mode in ["full", "both", "dvb"]:
+            dvb_service = self.mapping.optimized.get(clean_name)
+            if dvb_service:
+                service_ref = dvb_service['sref']
+                if self._is_dvb_t_service(service_ref):
+                    return service_ref, 'dvb_t'
+                return service_ref, 'dvb_s'
+
+        if self.database_mode in ["full", "dtt"]:
+            service_ref = self._find_dvbt_match(clean_name)
+            if service_ref:
+                return service_ref, 'dvb_t'
+        return None
+
+    def compile_resolution_table(self):
+        """Build mapping.resolved for every name the exact chain can match."""
+        resolved = self.mapping.resolved
+        resolved.clear()
+        self._resolution_stale = False
+        keys = set(self.manual_db.get_clean_name_index())
+        if self.database_mode in ["full", "both", "rytec"]:
+            keys.update(self.mapping.rytec['by_name'])
+        if self.database_mode in ["full", "both", "dvb"]:
+            keys.update(self.mapping.optimized)
+        if self.database_mode in ["full", "dtt"]:
+            keys.update(self.mapping.dvb_partitions['dvb-t'])
+
+        for clean_name in keys:
+            result = self._resolve_exact(clean_name)
+            if result:
+                resolved[clean_name] = result
 
-            other_services = [
-                s for s in services if s not in bouquet_services +
-                satellite_services]
+        self._build_name_prefilter(keys)
 
-            if bouquet_services:
-                main_service = bouquet_services[0]
-            elif satellite_services:
-                main_service = satellite_services[0]
-            elif other_services:
-                main_service = other_services[0]
+        if config.plugins.m3uconverter.enable_debug.value:
+            logger.info("Resolution table compiled: %s names", len(resolved))
+
+    def _build_name_prefilter(self, names):
+        """Fill the trigram prefilter with every name fuzzy search compares."""
+        prefilter = self._name_prefilter
+        prefilter.clear()
+        for name in names:
+            prefilter.add(name)
+        # Fuzzy stages also compare against the Rytec ids themselves
+        if self.database_mode in ["full", "both", "rytec"]:
+            for channel_id in self.mapping.rytec['basic']:
+                prefilter.add(channel_id.split('.')[0])
+            for clean_id in self.mapping.rytec['clean']:
+                prefilter.add(clean_id)
+        if config.plugins.m3uconverter.enable_debug.value:
+            logger.info("Name prefilter built from %s names", prefilter.count)
+
+    def _is_hopeless_name(self, clean_name):
+        """True when too few trigrams of the name exist in any database."""
+        if not self._name_prefilter.count:
+            return False
+        ratio = self._name_prefilter.shared_ratio(clean_name)
+        if ratio is None:
+            return False
+        self._prefilter_checks += 1
+        if ratio < self.PREFILTER_MIN_SHARED:
+            self._prefilter_skips += 1
+            return True
+        return False
+
+    def update_resolution_table(self, clean_names):
+        """Recompute mapping.resolved for the given names only."""
+        resolved = self.mapping.resolved
+        for clean_name in clean_names:
+            result = self._resolve_exact(clean_name) if clean_name else None
+            if result:
+                resolved[clean_name] = result
+                # Bits are never removed: stale names only let more through
+                self._name_prefilter.add(clean_name)
             else:
-                continue
+                resolved.pop(clean_name, None)
+
+    def update_optimized(self, names):
+        """Refresh the optimized map for the given DVB names only."""
+        for name in names:
+            services = self.mapping.dvb.get(name)
+            main_service = self._select_main_service(services) if services else None
+            if main_service:
+                self._store_optimized(name, main_service)
+            else:
+                self._drop_optimized(name)
+        self._reassign_aliases(set(self.clean_channel_name(name) for name in names))
 
-            clean_name = self.clean_channel_name(name)
-            self.mapping.optimized[name] = main_service
-            if clean_name not in self.mapping.optimized:
-                self.mapping.optimized[clean_name] = main_service
+        # Matches cached for these names may point to stale services
+        self.invalidate_match_cache(names)
 
         if config.plugins.m3uconverter.enable_debug.value:
             logger.info(
-                "Optimized channel map built: %s entries",
-                len(self.mapping.optimized)
+                "Optimized channel map updated: %s names refreshed",
+                len(names))
+
+    def _select_main_service(self, services):
+        """Pick the best service in a single pass using source/type ranking."""
+        best_service = None
+        best_rank = None
+        for service in services:
+            rank = (
+                self.DVB_SOURCE_PRIORITY.get(service.get("source"), 2),
+                self.DVB_TYPE_PRIORITY.get(service.get("type"), 3)
             )
+            if best_rank is None or rank < best_rank:
+                best_service = service
+                best_rank = rank
+        return best_service
+
+    def _store_optimized(self, name, main_service):
+        """Store the main service under its name and its clean alias."""
+        optimized = self.mapping.optimized
+        aliases = self.mapping.optimized_aliases
+
+        # A real name always wins over an alias previously stored under it
+        optimized[name] = main_service
+        aliases.pop(name, None)
+
+        clean_name = self.clean_channel_name(name)
+        if clean_name == name:
+            return
+        if clean_name not in optimized or aliases.get(clean_name) == name:
+            optimized[clean_name] = main_service
+            aliases[clean_name] = name
+
+    def _drop_optimized(self, name):
+        """Remove a name and the clean alias it owns from the optimized map."""
+        optimized = self.mapping.optimized
+        aliases = self.mapping.optimized_aliases
+
+        if name not in aliases:
+            optimized.pop(name, None)
+
+        clean_name = self.clean_channel_name(name)
+        if clean_name != name and aliases.get(clean_name) == name:
+            del aliases[clean_name]
+            optimized.pop(clean_name, None)
+
+    def _reassign_aliases(self, clean_names):
+        """Give each clean alias to the owner a full rebuild would pick.
+
+        That is the first DVB name, in map order, with this clean form,
+        unless a DVB name is the clean form itself.
+        """
+        optimized = self.mapping.optimized
+        aliases = self.mapping.optimized_aliases
+        pending = set()
+        for clean_name in clean_names:
+            if clean_name in aliases:
+                del aliases[clean_name]
+                optimized.pop(clean_name, None)
+                pending.add(clean_name)
+            elif clean_name and clean_name not in optimized:
+                pending.add(clean_name)
+        if not pending:
+            return
+
+        for name in self.mapping.dvb:
+            clean_name = self.clean_channel_name(name)
+            if clean_name == name or clean_name not in pending:
+                continue
+            main_service = optimized.get(name)
+            if main_service is not None:
+                optimized[clean_name] = main_service
+                aliases[clean_name] = name
+                pending.discard(clean_name)
+                if not pending:
+                    break
 
     def classify_service_type(self, service_ref=None):
         """Classify service type based on service reference."""
@@ -1026,9 +1426,34 @@ class EPGServiceMapper:
             'compatible': self._is_service_compatible(result)
         }
 
-    def _parse_lamedb(self, lamedb_path="/etc/enigma2/lamedb"):
+    def invalidate_match_cache(self, names):
+        """Drop cached matches for the given clean names only."""
+        prefixes = tuple("{0}_".format(name) for name in names if name)
+        if not prefixes:
+            return 0
+
+        stale_keys = [
+            key for key in self._match_cache if key.startswith(prefixes)]
+        for key in stale_keys:
+            del self._match_cache[key]
+
+        if stale_keys and config.plugins.m3uconverter.enable_debug.value:
+            logger.debug(
+                "Match cache: %s entries invalidated", len(stale_keys))
+        return len(stale_keys)
+
+    def on_manual_db_changed(self, clean_names=None):
+        """Manual database listener: forget matches for the changed names."""
+        if clean_names is None:
+            self._match_cache.clear()
+            self.compile_resolution_table()
+        else:
+            self.invalidate_match_cache(clean_names)
+            self.update_resolution_table(clean_names)
+
+    def _parse_lamedb(self, lamedb_path=None):
         """Parse both lamedb and lamedb5 using unified mapping."""
-        paths_to_try = [
+        paths_to_try = [lamedb_path] if lamedb_path else [
             "/etc/enigma2/lamedb5",
             "/etc/enigma2/lamedb"
         ]
@@ -1054,18 +1479,20 @@ class EPGServiceMapper:
 
                 # Identify the file format
                 if content.startswith("eDVB services /5/"):
-                    self._parse_lamedb5_format(content)
+                    self._parse_lamedb5_format(content, lamedb_path)
                 else:
-                    self._parse_legacy_lamedb_format(content)
+                    self._parse_legacy_lamedb_format(content, lamedb_path)
 
                 # Filter incompatible services
-                for name in list(self.mapping.dvb.keys()):
+                for name in list(self.mapping.dvb_origins.get(lamedb_path, ())):
+                    services = self.mapping.dvb.get(name)
+                    if not services:
+                        continue
                     compatible_services = self.filter_compatible_services(
-                        self.mapping.dvb[name])
-                    if compatible_services:
-                        self.mapping.dvb[name] = compatible_services
-                    else:
-                        del self.mapping.dvb[name]
+                        services)
+                    if len(compatible_services) != len(services):
+                        self.mapping.set_dvb_services(
+                            name, compatible_services)
 
                 if config.plugins.m3uconverter.enable_debug.value:
                     logger.info("Parsed {0} unique compatible DVB channel names from {1}".format(
@@ -1082,6 +1509,7 @@ class EPGServiceMapper:
                         logger.info(
                             "Found namespaces: {0}".format(
                                 dict(namespaces)))
+                self._remember_source(lamedb_path, "lamedb")
                 return True
 
             except Exception as e:
@@ -1093,7 +1521,7 @@ class EPGServiceMapper:
             logger.error("Could not find or parse any lamedb file")
         return False
 
-    def _parse_lamedb5_format(self, content):
+    def _parse_lamedb5_format(self, content, origin=None):
         """Parse lamedb5 file format."""
         lines = content.split("\n")
         dvbt_count = 0
@@ -1132,7 +1560,7 @@ class EPGServiceMapper:
 
                         clean_name = self.clean_channel_name(channel_name)
 
-                        self.mapping.dvb[clean_name].append({
+                        self.mapping.add_dvb_service(clean_name, {
                             "sref": service_ref,
                             "type": self.classify_service_type(service_ref),
                             "source": "lamedb5",
@@ -1140,7 +1568,7 @@ class EPGServiceMapper:
                             "ts_id": ts_id,
                             "on_id": on_id,
                             "namespace": namespace
-                        })
+                        }, origin)
         if config.plugins.m3uconverter.enable_debug.value:
             logger.info(
                 "🔍 PARSED: %s services, %s DVB-T services",
@@ -1148,7 +1576,7 @@ class EPGServiceMapper:
                 dvbt_count
             )
 
-    def _parse_legacy_lamedb_format(self, content):
+    def _parse_legacy_lamedb_format(self, content, origin=None):
         """Parse traditional lamedb file format."""
         lines = content.split("\n")
         for line in lines:
@@ -1169,14 +1597,14 @@ class EPGServiceMapper:
                         service_ref = "1:0:{0}:{1}:{2}:{3}:820000:0:0:0:".format(
                             service_type, service_id, ts_id, on_id)
                         clean_name = self.clean_channel_name(channel_name)
-                        self.mapping.dvb[clean_name].append({
+                        self.mapping.add_dvb_service(clean_name, {
                             "sref": service_ref,
                             "type": self.classify_service_type(service_ref),
                             "source": "lamedb",
                             "service_id": service_id,
                             "ts_id": ts_id,
                             "on_id": on_id
-                        })
+                        }, origin)
 
     def _parse_rytec_channels(self, rytec_path=None):
         """Parse rytec.channels.xml using unified mapping."""
@@ -1206,39 +1634,35 @@ class EPGServiceMapper:
             return
 
         try:
-            with open(final_path, "r", encoding="utf-8") as f:
+            # Bytes, so match positions are file offsets for lazy loading
+            with open(final_path, "rb") as f:
                 content = f.read()
 
             if config.plugins.m3uconverter.enable_debug.value:
                 logger.info("Rytec file found, size: %d bytes", len(content))
 
-            pattern = r'(<!--\s*([^>]+)\s*-->)?\s*<channel id="([^"]+)">([^<]+)</channel>\s*(?:<!--\s*([^>]+)\s*-->)?'
-            matches = findall(pattern, content)
-            if config.plugins.m3uconverter.enable_debug.value:
-                logger.info(
-                    "Found %d channel entries in rytec file",
-                    len(matches))
+            extended = self.mapping.rytec['extended']
+            extended.source_path = final_path
+            extended.loader = self._load_rytec_variants
+            count = 0
 
             with self._rytec_lock:
-                for match in matches:
-                    comment_before, source_info, channel_id, service_ref, comment_after = match
-                    comment = comment_before or comment_after or ""
-
-                    # Extract the real channel name
-                    channel_name = self._extract_real_channel_name(comment)
+                for match in self.RYTEC_ENTRY_PATTERN.finditer(content):
+                    channel_id = match.group(3).decode("utf-8", "replace")
+                    service_ref = match.group(4).decode("utf-8", "replace")
+                    count += 1
 
                     normalized_ref = self.normalize_service_reference(
                         service_ref, for_epg=True)
 
                     if self._is_service_compatible(normalized_ref):
-                        # Extended database with all info
-                        self.mapping.rytec['extended'][channel_id].append({
-                            'sref': normalized_ref,
-                            'comment': comment.strip(),
-                            'channel_name': channel_name,
-                            'source_type': self._get_source_type(comment),
-                            'sat_position': self._extract_satellite_position(comment)
-                        })
+                        # Extended info is read back from the file when
+                        # first needed (low-memory mode does not index it)
+                        if not self.low_memory:
+                            extended.index(channel_id, match.start())
+
+                        self._index_rytec_name(
+                            self._rytec_display_name(match), channel_id)
 
                         # KEEP COMPATIBILITY
                         if channel_id not in self.mapping.rytec['basic']:
@@ -1248,64 +1672,135 @@ class EPGServiceMapper:
                             channel_id.split('.')[0])
                         self.mapping.rytec['clean'][clean_base_id] = normalized_ref
 
+            del content
+            self._remember_source(final_path, "rytec")
+
             if config.plugins.m3uconverter.enable_debug.value:
                 logger.info(
-                    "Parsed %d Rytec channels with extended info", len(
+                    "Found %d channel entries in rytec file", count)
+                logger.info(
+                    "Indexed %d Rytec channels with extended info", len(
                         self.mapping.rytec['extended']))
 
         except Exception as e:
             logger.error("Error parsing rytec.channels.xml: %s", str(e))
 
-    def _parse_with_lxml(self, epg_path):
-        """Parse with lxml library."""
-        try:
-            parser = etree.XMLParser(encoding='utf-8', recover=True)
-            tree = etree.parse(epg_path, parser)
-            root = tree.getroot()
+    def _rytec_display_name(self, match):
+        """Channel name of a rytec.channels.xml entry, from its comments.
 
-            if root is None:
-                if config.plugins.m3uconverter.enable_debug.value:
-                    logger.error("Failed to get root element")
-                return False
+        The trailing comment holds the name; the leading one usually only
+        the satellite position.
+        """
+        name = (match.group(5) or b"").decode("utf-8", "replace").strip()
+        if not name:
+            comment = (match.group(1) or b"").decode("utf-8", "replace")
+            name = self._extract_real_channel_name(comment)
+        if not name or self.RYTEC_POSITION_PATTERN.match(name):
+            return ""
+        return name
 
-            # Find all channel elements
-            channels = root.findall('.//channel')
-            if config.plugins.m3uconverter.enable_debug.value:
-                logger.info(
-                    "Found %s channel elements with lxml",
-                    len(channels)
-                )
-            added_count = 0
-            for channel in channels:
-                try:
-                    channel_id = channel.get('id')
-                    if not channel_id:
-                        continue
+    def _index_rytec_name(self, display_name, channel_id):
+        """Add a display name -> channel id entry to rytec['by_name']."""
+        if not display_name:
+            return
+        clean_name = self.clean_channel_name(display_name)
+        if not clean_name:
+            return
+        ids = self.mapping.rytec['by_name'][clean_name]
+        if channel_id not in ids:
+            ids.append(channel_id)
+            self._resolution_stale = True
+
+    def _unindex_rytec_names(self, channel_ids):
+        """Remove channel ids from rytec['by_name']."""
+        removed = set(channel_ids)
+        if not removed:
+            return
+        by_name = self.mapping.rytec['by_name']
+        for clean_name in list(by_name):
+            ids = [cid for cid in by_name[clean_name] if cid not in removed]
+            if ids:
+                by_name[clean_name] = ids
+            else:
+                del by_name[clean_name]
+        self._resolution_stale = True
+
+    def _find_rytec_by_name(self, clean_name):
+        """Exact display-name lookup, return the first compatible sref."""
+        for channel_id in self.mapping.rytec['by_name'].get(clean_name, ()):
+            service_ref = self.mapping.rytec['basic'].get(channel_id)
+            if service_ref and self._is_service_compatible(service_ref):
+                return service_ref
+        return None
 
-                    # Find display name
-                    display_name_elem = channel.find('display-name')
-                    if display_name_elem is None or not display_name_elem.text:
-                        continue
+    def _rytec_variant(self, match):
+        """Build the extended info dict of one rytec.channels.xml entry."""
+        comment_before = match.group(1) or b""
+        comment_after = match.group(5) or b""
+        comment = (comment_before or comment_after).decode("utf-8", "replace")
+        service_ref = match.group(4).decode("utf-8", "replace")
+        return {
+            'sref': self.normalize_service_reference(service_ref, for_epg=True),
+            'comment': comment.strip(),
+            'channel_name': self._rytec_display_name(match),
+            'source_type': self._get_source_type(comment),
+            'sat_position': self._extract_satellite_position(comment)
+        }
+
+    def _load_rytec_variants(self, f, channel_id, offsets):
+        """Re-read the entries of channel_id at the indexed offsets."""
+        variants = []
+        for offset in offsets:
+            f.seek(offset)
+            match = self.RYTEC_ENTRY_PATTERN.match(f.read(4096))
+            # Skip offsets left stale by a file not yet reloaded
+            if match and match.group(3).decode("utf-8", "replace") == channel_id:
+                variants.append(self._rytec_variant(match))
+        return variants
+
+    def get_rytec_variants(self, channel_id):
+        """Return the extended Rytec info of an id, loading it on demand."""
+        return self.mapping.rytec['extended'].get(channel_id) or []
+
+    def _iter_xmltv_channels(self, epg_path, iterparse, **options):
+        """Yield (channel_id, display_name) from the channel section of an XMLTV file.
+
+        Uses iterparse: each <channel> is cleared once read and parsing
+        stops at the first <programme>, so memory does not depend on the
+        number of programmes.
+        """
+        with open(epg_path, 'rb') as f:
+            context = iterparse(f, events=("start", "end"), **options)
+            for event, elem in context:
+                if event == "start":
+                    # XMLTV lists every channel before the programmes
+                    if elem.tag == "programme":
+                        break
+                    continue
 
+                if elem.tag != "channel":
+                    continue
+
+                channel_id = elem.get('id')
+                display_name_elem = elem.find('display-name')
+                display_name = None
+                if display_name_elem is not None and display_name_elem.text:
                     display_name = display_name_elem.text.strip()
+                elem.clear()
 
-                    # Add to mapping
-                    clean_name = self.clean_channel_name(
-                        display_name, preserve_variants=True)
-                    self.mapping.rytec['extended'][channel_id] = [{
-                        'channel_name': display_name,
-                        'sref': None,
-                        'source_type': 'epgshare',
-                        'original_id': channel_id,
-                        'clean_name': clean_name
-                    }]
+                if channel_id and display_name:
+                    yield channel_id, display_name
 
-                    self.mapping.rytec['basic'][channel_id] = None
-                    added_count += 1
+    def _parse_with_lxml(self, epg_path, feed=None):
+        """Parse with lxml library."""
+        try:
+            added_count = 0
+            for channel_id, display_name in self._iter_xmltv_channels(epg_path, etree.iterparse, recover=True):
+                # Add to mapping
+                self._store_epgshare_channel(
+                    channel_id, display_name, None, feed)
+                added_count += 1
 
-                except Exception as e:
-                    logger.warning(f"Error parsing channel: {str(e)}")
-                    continue
             if config.plugins.m3uconverter.enable_debug.value:
                 logger.info(f"Added {added_count} channels with lxml parsing")
             return added_count > 0
@@ -1314,51 +1809,17 @@ class EPGServiceMapper:
             logger.error(f"lxml parsing failed: {str(e)}")
             return False
 
-    def _parse_with_elementtree(self, epg_path):
+    def _parse_with_elementtree(self, epg_path, feed=None):
         """Parse with ElementTree fallback."""
         try:
-            tree = ET.parse(epg_path)
-            root = tree.getroot()
-
-            channels = root.findall('.//channel')
-            if config.plugins.m3uconverter.enable_debug.value:
-                logger.info(
-                    "Found %s channel elements with ElementTree",
-                    len(channels)
-                )
-
             added_count = 0
-            for channel in channels:
-                try:
-                    channel_id = channel.get('id')
-                    if not channel_id:
-                        continue
-
-                    display_name_elem = channel.find('display-name')
-                    if display_name_elem is None or not display_name_elem.text:
-                        continue
-
-                    display_name = display_name_elem.text.strip()
-                    clean_name = self.clean_channel_name(
-                        display_name, preserve_variants=True)
-
-                    service_ref = self._generate_dvb_service_ref(
-                        display_name, channel_id)
+            for channel_id, display_name in self._iter_xmltv_channels(epg_path, ET.iterparse):
+                service_ref = self._generate_dvb_service_ref(
+                    display_name, channel_id)
 
-                    self.mapping.rytec['extended'][channel_id].append({
-                        'channel_name': display_name,
-                        'sref': service_ref,
-                        'source_type': 'epgshare',
-                        'original_id': channel_id,
-                        'clean_name': clean_name
-                    })
-
-                    self.mapping.rytec['basic'][channel_id] = service_ref
-                    added_count += 1
-
-                except Exception as e:
-                    logger.warning(f"Error parsing channel: {str(e)}")
-                    continue
+                self._store_epgshare_channel(
+                    channel_id, display_name, service_ref, feed)
+                added_count += 1
 
             if config.plugins.m3uconverter.enable_debug.value:
                 logger.info(
@@ -1371,8 +1832,8 @@ class EPGServiceMapper:
             logger.error(f"ElementTree parsing failed: {str(e)}")
             return False
 
-    def _parse_existing_bouquets(self, bouquet_dir="/etc/enigma2"):
-        """Parse all existing bouquets for current service references."""
+    def _list_bouquet_files(self, bouquet_dir="/etc/enigma2"):
+        """Return the bouquet files to parse, without duplicates."""
         bouquet_files = []
 
         # First read the main bouquets.tv file
@@ -1392,49 +1853,100 @@ class EPGServiceMapper:
                     'userbouquet.') and filename.endswith('.tv'):
                 bouquet_files.append(join(bouquet_dir, filename))
 
-        # Parse each bouquet
-        for bouquet_file in bouquet_files:
-            if not fileExists(bouquet_file):
-                continue
+        seen = set()
+        return [f for f in bouquet_files if not (f in seen or seen.add(f))]
 
-            try:
-                with open(bouquet_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+    def _store_epgshare_channel(self, channel_id, display_name, service_ref, feed=None):
+        """Store one EPGShare channel in the Rytec mapping.
 
-                    service_pattern = r'#SERVICE (\d+:\d+:\d+:[^:]+:[^:]+:[^:]+:[^:]+:[^:]+:[^:]+:[^:]+:)'
-                    matches = findall(service_pattern, content)
+        feed is the URL the channel comes from, so that a single feed can
+        be dropped without touching the others. Each feed keeps one variant
+        per channel id next to the Rytec and other feed variants; the basic
+        sref is left alone when Rytec provides the id.
+        """
+        clean_name = self.clean_channel_name(
+            display_name, preserve_variants=True)
+        variant = {
+            'channel_name': display_name,
+            'sref': service_ref,
+            'source_type': 'epgshare',
+            'feed': feed,
+            'original_id': channel_id,
+            'clean_name': clean_name
+        }
+        extended = self.mapping.rytec['extended']
+        variants = extended.loaded_variants(channel_id)
+        for index, existing in enumerate(variants):
+            if existing.get('source_type') == 'epgshare' and existing.get('feed') == feed:
+                variants[index] = variant
+                break
+        else:
+            variants.append(variant)
 
-                    for service_ref in matches:
-                        if not service_ref.startswith(
-                                '4097:'):  # Ignore IPTV services
-                            desc_pattern = r'#DESCRIPTION (.+)\n'
-                            desc_match = search(
-                                desc_pattern, content[content.find(service_ref):])
-                            channel_name = desc_match.group(
-                                1).strip() if desc_match else "Unknown"
+        if channel_id not in extended.offsets:
+            self._set_epgshare_basic(channel_id, variants)
+        self._index_rytec_name(display_name, channel_id)
 
-                            clean_name = self.clean_channel_name(channel_name)
+    def _set_epgshare_basic(self, channel_id, variants):
+        """Point basic at the first EPGShare sref, unless another source owns the id."""
+        if any(variant.get('source_type') != 'epgshare' for variant in variants):
+            return
+        self.mapping.rytec['basic'][channel_id] = next(
+            (variant['sref'] for variant in variants if variant.get('sref')), None)
 
-                            self.mapping.dvb[clean_name].append({
-                                "sref": service_ref,
-                                "type": self.classify_service_type(service_ref),
-                                "source": "bouquet",
-                                "service_id": service_ref.split(':')[3],
-                                "ts_id": service_ref.split(':')[4],
-                                "on_id": service_ref.split(':')[5]
-                            })
+    def _parse_existing_bouquets(self, bouquet_dir="/etc/enigma2"):
+        """Parse all existing bouquets for current service references."""
+        self._bouquet_dir = bouquet_dir
+        for bouquet_file in self._list_bouquet_files(bouquet_dir):
+            self._parse_bouquet_file(bouquet_file)
 
-            except Exception as e:
-                logger.error(f"Error parsing bouquet {bouquet_file}: {str(e)}")
+    def _parse_bouquet_file(self, bouquet_file):
+        """Parse the DVB service references of a single bouquet file."""
+        if not fileExists(bouquet_file):
+            return False
+
+        try:
+            with open(bouquet_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+            service_pattern = r'#SERVICE (\d+:\d+:\d+:[^:]+:[^:]+:[^:]+:[^:]+:[^:]+:[^:]+:[^:]+:)'
+            matches = findall(service_pattern, content)
+
+            for service_ref in matches:
+                if not service_ref.startswith(
+                        '4097:'):  # Ignore IPTV services
+                    desc_pattern = r'#DESCRIPTION (.+)\n'
+                    desc_match = search(
+                        desc_pattern, content[content.find(service_ref):])
+                    channel_name = desc_match.group(
+                        1).strip() if desc_match else "Unknown"
+
+                    clean_name = self.clean_channel_name(channel_name)
+
+                    self.mapping.add_dvb_service(clean_name, {
+                        "sref": service_ref,
+                        "type": self.classify_service_type(service_ref),
+                        "source": "bouquet",
+                        "service_id": service_ref.split(':')[3],
+                        "ts_id": service_ref.split(':')[4],
+                        "on_id": service_ref.split(':')[5]
+                    }, bouquet_file)
+
+            self._remember_source(bouquet_file, "bouquet")
+            return True
 
-    def _parse_epgshare_for_mapping(self, epg_path):
+        except Exception as e:
+            logger.error(f"Error parsing bouquet {bouquet_file}: {str(e)}")
+            return False
+
+    def _parse_epgshare_for_mapping(self, epg_path, feed=None):
         """Robust EPGShare parsing with lxml."""
         try:
             if config.plugins.m3uconverter.enable_debug.value:
                 logger.info(f"Parsing EPGShare file: {epg_path}")
 
-            # Clear existing EPGShare entries
-            self._clear_epgshare_entries()
+            # Clear existing EPGShare entries of this feed
+            self._clear_epgshare_entries(feed)
 
             # Check file exists and has content
             if not fileExists(epg_path):
@@ -1452,9 +1964,13 @@ class EPGServiceMapper:
 
             # Parse with lxml
             if LXML_AVAILABLE:
-                return self._parse_with_lxml(epg_path)
+                parsed = self._parse_with_lxml(epg_path, feed)
             else:
-                return self._parse_with_elementtree(epg_path)
+                parsed = self._parse_with_elementtree(epg_path, feed)
+
+            if parsed:
+                self._remember_source(epg_path, "epgshare")
+            return parsed
 
         except Exception as e:
             logger.error(f"EPGShare parsing error: {str(e)}")
@@ -1483,6 +1999,8 @@ class EPGServiceMapper:
             self.epg_cache_misses = 0
             # Other statistics
             self._incompatible_matches = 0
+            self._prefilter_checks = 0
+            self._prefilter_skips = 0
             if config.plugins.m3uconverter.enable_debug.value:
                 logger.info("🔄 Statistics counters RESET for new conversion")
         else:
@@ -1497,42 +2015,240 @@ class EPGServiceMapper:
                 logger.info(
                     f"Match cache cleared: {match_cache_size} entries removed")
 
-    def _clear_epgshare_entries(self):
-        """Clear all EPGShare entries."""
+    def _clear_epgshare_entries(self, feed=None):
+        """Clear EPGShare entries, only those of one feed URL if given.
+
+        Only the matching variants go; a channel id is dropped when no
+        variant of any source is left.
+        """
+        extended = self.mapping.rytec['extended']
         keys_to_remove = []
-        for channel_id, variants in self.mapping.rytec['extended'].items():
-            for variant in variants:
-                if variant.get('source_type') == 'epgshare':
-                    keys_to_remove.append(channel_id)
-                    break
+        cleared = 0
+        # EPGShare entries are always in memory, pending ones are Rytec
+        for channel_id, variants in list(extended.loaded_items()):
+            kept = [
+                variant for variant in variants
+                if not (variant.get('source_type') == 'epgshare' and (
+                    feed is None or variant.get('feed') == feed))]
+            if len(kept) == len(variants):
+                continue
+            cleared += 1
+            variants[:] = kept
+            if channel_id in extended.offsets:
+                # Rytec variants not read yet own the basic sref
+                continue
+            if kept:
+                self._set_epgshare_basic(channel_id, kept)
+            else:
+                keys_to_remove.append(channel_id)
+
+        for channel_id in keys_to_remove:
+            del extended[channel_id]
+            self.mapping.rytec['basic'].pop(channel_id, None)
+        self._unindex_rytec_names(keys_to_remove)
+        if config.plugins.m3uconverter.enable_debug.value:
+            logger.info(f"Cleared {cleared} EPGShare entries")
+
+    def _clear_rytec_entries(self):
+        """Clear all entries loaded from rytec.channels.xml.
+
+        Walks the basic ids rather than the extended info, which low-memory
+        mode does not keep. EPGShare variants of an id survive and take
+        over its basic sref; ids without any are dropped.
+        """
+        extended = self.mapping.rytec['extended']
+        keys_to_remove = []
+        for channel_id in list(self.mapping.rytec['basic']):
+            # Not-yet-loaded entries are Rytec ones, no need to read them
+            variants = extended.peek(channel_id) or ()
+            epgshare = [
+                variant for variant in variants
+                if variant.get('source_type') == 'epgshare']
+            if not epgshare:
+                keys_to_remove.append(channel_id)
+                continue
+            if len(epgshare) < len(variants) or channel_id in extended.offsets:
+                extended[channel_id] = epgshare
+                self._set_epgshare_basic(channel_id, epgshare)
+                self.mapping.rytec['clean'].pop(
+                    self.clean_channel_name(channel_id.split('.')[0]), None)
 
         for channel_id in keys_to_remove:
-            del self.mapping.rytec['extended'][channel_id]
-            if channel_id in self.mapping.rytec['basic']:
-                del self.mapping.rytec['basic'][channel_id]
+            extended.pop(channel_id, None)
+            self.mapping.rytec['basic'].pop(channel_id, None)
+            self.mapping.rytec['clean'].pop(
+                self.clean_channel_name(channel_id.split('.')[0]), None)
+        self._unindex_rytec_names(keys_to_remove)
         if config.plugins.m3uconverter.enable_debug.value:
-            logger.info(f"Cleared {len(keys_to_remove)} EPGShare entries")
+            logger.info(f"Cleared {len(keys_to_remove)} Rytec entries")
 
-    def _clear_dvbt_services(self):
-        """Remove DVB-T services based on database mode."""
+    def _file_fingerprint(self, path):
+        """Return (mtime, size, md5) of a file, or None if it is missing.
+
+        Files above the hash limit (Rytec, EPGShare XML) get no md5: a
+        full read of hundreds of MB is not worth saving a reload.
+        """
+        try:
+            file_stat = stat(path)
+            if file_stat.st_size > self._source_hash_limit:
+                return (file_stat.st_mtime, file_stat.st_size, None)
+            digest = hashlib.md5()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(65536), b''):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        return (file_stat.st_mtime, file_stat.st_size, digest.hexdigest())
+
+    def _remember_source(self, path, kind):
+        """Record the fingerprint of a source file just loaded."""
+        fingerprint = self._file_fingerprint(path)
+        if fingerprint:
+            self._source_fingerprints[path] = (kind,) + fingerprint
+
+    def _source_changed(self, path):
+        """Check mtime/size first, hash the file only when they differ.
+
+        A file loaded without md5 counts as changed on any stat change.
+        """
+        kind, mtime, size, digest = self._source_fingerprints[path]
+        try:
+            file_stat = stat(path)
+        except OSError:
+            return True
+        if file_stat.st_mtime == mtime and file_stat.st_size == size:
+            return False
+        if digest is None or file_stat.st_size != size:
+            return True
+
+        fingerprint = self._file_fingerprint(path)
+        if fingerprint and fingerprint[2] == digest:
+            # Touched but identical: just refresh the stored stat
+            self._source_fingerprints[path] = (kind,) + fingerprint
+            return False
+        return True
+
+    def _unload_source(self, path, kind):
+        """Remove what a source contributed, return the touched DVB names."""
+        self._source_fingerprints.pop(path, None)
+        if kind in ("lamedb", "bouquet"):
+            return self.mapping.remove_dvb_origin(path)
+        if kind == "rytec":
+            with self._rytec_lock:
+                self._clear_rytec_entries()
+        elif kind == "epgshare":
+            feed = self._epgshare_feeds.get(path)
+            if feed:
+                self._clear_epgshare_entries(feed)
+        return set()
+
+    def _load_source(self, path, kind):
+        """Ingest a single source file, return the touched DVB names."""
+        if kind == "lamedb":
+            self._parse_lamedb(path)
+        elif kind == "bouquet":
+            self._parse_bouquet_file(path)
+        elif kind == "rytec":
+            self._parse_rytec_channels(path)
+        elif kind == "epgshare":
+            self._parse_epgshare_for_mapping(path, self._epgshare_feeds.get(path))
+        return set(self.mapping.dvb_origins.get(path, ()))
+
+    def reload_changed_sources(self):
+        """Re-ingest only the channel sources changed since they were loaded.
+
+        lamedb, every bouquet file, rytec.channels.xml and the EPGShare
+        download are tracked separately, so the work done is proportional
+        to what changed. Returns the changed, added and removed paths.
+        """
+        result = {'changed': [], 'added': [], 'removed': []}
+        tracked = self._source_fingerprints
+
+        for path in list(tracked):
+            if not fileExists(path):
+                result['removed'].append(path)
+            elif self._source_changed(path):
+                result['changed'].append(path)
+
+        # New or dropped bouquet files
+        if self._bouquet_dir:
+            current = self._list_bouquet_files(self._bouquet_dir)
+            result['added'] = [f for f in current if f not in tracked]
+            current = set(current)
+            result['removed'].extend(
+                path for path, fingerprint in tracked.items()
+                if fingerprint[0] == "bouquet" and path not in current and
+                path not in result['removed'])
+
+        if not any(result.values()):
+            if config.plugins.m3uconverter.enable_debug.value:
+                logger.info("🔄 Channel databases unchanged - nothing to reload")
+            return result
+
+        touched_names = set()
+        epg_changed = False
+        for path in result['removed']:
+            kind = tracked[path][0]
+            epg_changed = epg_changed or kind in ("rytec", "epgshare")
+            touched_names |= self._unload_source(path, kind)
+
+        for path in result['changed']:
+            kind = tracked[path][0]
+            epg_changed = epg_changed or kind in ("rytec", "epgshare")
+            touched_names |= self._unload_source(path, kind)
+            touched_names |= self._load_source(path, kind)
+
+        for path in result['added']:
+            touched_names |= self._load_source(path, "bouquet")
+
+        if touched_names and config.plugins.m3uconverter.ignore_dvbt.value:
+            self._clear_dvbt_services(touched_names)
+
+        # Rytec/EPGShare ids feed every stage of matching
+        if epg_changed:
+            self._match_cache.clear()
+        self.optimize_matching()
+
+        if config.plugins.m3uconverter.enable_debug.value:
+            logger.info(
+                "🔄 Reloaded sources - changed: %s, added: %s, removed: %s, DVB names touched: %s",
+                len(result['changed']),
+                len(result['added']),
+                len(result['removed']),
+                len(touched_names))
+        return result
+
+    def _apply_dvbt_filter(self):
+        """Hide or restore the DVB-T partition after a config change.
+
+        Returns True when the active DVB view changed.
+        """
+        hide = (config.plugins.m3uconverter.ignore_dvbt.value and
+                self.database_mode not in ["full", "dtt"])
+        hidden = "dvb-t" in self.mapping.hidden_dvb_types
+        if hide and not hidden:
+            self._clear_dvbt_services()
+            return True
+        if hidden and not hide:
+            restored = self.mapping.restore_dvb_type("dvb-t")
+            if config.plugins.m3uconverter.enable_debug.value:
+                logger.info("🔧 Restored %s DVB-T services", restored)
+            return True
+        return False
+
+    def _clear_dvbt_services(self, names=None):
+        """Remove DVB-T services based on database mode.
+
+        Only the given channel names are checked when names is set.
+        """
         # KEEP DVB-T for full and dtt modes
         if self.database_mode in ["full", "dtt"]:
             if config.plugins.m3uconverter.enable_debug.value:
                 logger.info("🔧 Keeping DVB-T services (mode: full/dtt)")
             return 0
 
-        removed_count = 0
-        for channel_name in list(self.mapping.dvb.keys()):
-            filtered_services = [
-                service for service in self.mapping.dvb[channel_name]
-                if not service.get('sref', '').split(':')[6] == 'EEEE'
-            ]
-            removed_count += (len(self.mapping.dvb[channel_name]
-                                  ) - len(filtered_services))
-            if filtered_services:
-                self.mapping.dvb[channel_name] = filtered_services
-            else:
-                del self.mapping.dvb[channel_name]
+        # Hidden, not dropped: the DVB-T partition keeps them for restore
+        removed_count = self.mapping.hide_dvb_type("dvb-t", names)
         if config.plugins.m3uconverter.enable_debug.value:
             logger.info(
                 "🔧 Removed %s DVB-T (EEEE) services (mode: %s)",
@@ -1599,6 +2315,7 @@ class EPGServiceMapper:
 
         # Search each variant in the Rytec database
         for variant in variants:
+            self._check_cancelled()
             # Search in Rytec basic
             for rytec_id, service_ref in self.mapping.rytec['basic'].items():
                 if not service_ref:
@@ -1669,6 +2386,7 @@ class EPGServiceMapper:
             return matches
 
         clean_lower = clean_name.lower()
+        self._check_cancelled()
 
         for rytec_id, service_ref in self.mapping.rytec['basic'].items():
             if not service_ref:
@@ -1696,7 +2414,7 @@ class EPGServiceMapper:
 
         return matches
 
-    def match_with_manual_database(self, channel_name, clean_name):
+    def match_with_manual_database(self, channel_name, clean_name, tvg_id=None):
         """Wrapper for manual database matching"""
         if config.plugins.m3uconverter.enable_debug.value:
             logger.debug(
@@ -1705,9 +2423,10 @@ class EPGServiceMapper:
                 clean_name
             )
 
+        result = None
         if hasattr(self, 'manual_db') and self.manual_db:
             result = self.manual_db.find_mapping(
-                channel_name, clean_name=clean_name
+                channel_name, tvg_id=tvg_id, clean_name=clean_name
             )
 
             if config.plugins.m3uconverter.enable_debug.value:
@@ -1755,9 +2474,17 @@ class EPGServiceMapper:
 
         cache_key = f"{clean_name}_{tvg_id}"
 
+        # 0. Compiled exact-match chain: one lookup for most channels
+        resolved = self.mapping.resolved.get(clean_name)
+        if resolved and resolved[1] == 'manual_db':
+            self._add_to_cache(cache_key, resolved[0], resolved[1])
+            return resolved
+
         # 1. FIRST: Manual Database (highest priority) - SOLO QUESTA!
+        # The table covers clean names only: the raw name and tvg-id keys
+        # must still beat any DVB/Rytec hit from the table
         service_ref, match_type = self.match_with_manual_database(
-            original_name, clean_name)
+            original_name, clean_name, tvg_id)
         if service_ref:
             # Save to cache
             self._add_to_cache(cache_key, service_ref, match_type)
@@ -1775,8 +2502,20 @@ class EPGServiceMapper:
                 )
             return cached['sref'], cached['match_type']
 
+        # 2.1 EXACT MATCHES (display name, DVB, DVB-T) from the table skip
+        # the fuzzy stages below; an exact tvg-id hit still wins. Short and
+        # numbered names keep the enhanced search first, as before the table
+        short_or_numbered = len(clean_name) <= 5 or any(
+            char.isdigit() for char in clean_name)
+        if resolved and not short_or_numbered:
+            service_ref, match_type = resolved
+
+        # 2.2 PREFILTER: names (VOD, 24/7 loops...) sharing too few
+        # trigrams with any database name skip the fuzzy stages
+        hopeless = not service_ref and not resolved and self._is_hopeless_name(clean_name)
+
         # 3. ENHANCED: Special handling for short names and numbered channels
-        if len(clean_name) <= 5 or any(char.isdigit() for char in clean_name):
+        if not service_ref and not hopeless and short_or_numbered:
             # Try enhanced search first for short names
             enhanced_matches = self._enhanced_search_short_names(
                 clean_name, original_name)
@@ -1811,6 +2550,9 @@ class EPGServiceMapper:
                 self._add_to_cache(cache_key, service_ref, match_type)
                 return service_ref, match_type
 
+        if not service_ref and resolved:
+            service_ref, match_type = resolved
+
         # 4. ENHANCED RYTEC SEARCH - Multiple format variants
         if self.database_mode in [
             "full",
@@ -1821,14 +2563,15 @@ class EPGServiceMapper:
 
             for variant in rytec_variants:
                 if variant in self.mapping.rytec['basic']:
-                    service_ref = self.mapping.rytec['basic'][variant]
-                    if service_ref and self._is_service_compatible(
-                            service_ref):
+                    variant_ref = self.mapping.rytec['basic'][variant]
+                    if variant_ref and self._is_service_compatible(
+                            variant_ref):
+                        service_ref = variant_ref
                         match_type = 'rytec_exact'
                         break  # Use first valid match
 
         # 4.1 ENHANCED RYTEC NAME SEARCH
-        if (not service_ref and
+        if (not service_ref and not hopeless and
                 self.database_mode in ["full", "both", "rytec"] and
                 clean_name and len(clean_name) >= 2):
 
@@ -1847,7 +2590,7 @@ class EPGServiceMapper:
                         )
 
         # 5. RYTEC KEYWORD SEARCH - Use configurable similarity threshold
-        if (not service_ref and
+        if (not service_ref and not hopeless and
                 self.database_mode in ["full", "both", "rytec"] and
                 clean_name and len(clean_name) >= 2):
 
@@ -1930,18 +2673,14 @@ class EPGServiceMapper:
         """Fast DVB-T matching"""
         try:
             # Use existing optimized mapping first
-            if clean_name in self.mapping.optimized:
-                service = self.mapping.optimized[clean_name]
-                if service.get('sref', '').split(':')[6] == 'EEEE':
-                    return service['sref']
-
-            # Limited direct search
-            for service_name, services in list(self.mapping.dvb.items()):
-                for service in services:
-                    if service.get('sref', '').split(':')[6] == 'EEEE':
-                        service_clean = self.clean_channel_name(service_name)
-                        if service_clean == clean_name:
-                            return service['sref']
+            service = self.mapping.optimized.get(clean_name)
+            if service and service.get('type') == 'dvb-t':
+                return service['sref']
+
+            # DVB names are already clean: one lookup in the DVB-T partition
+            services = self.mapping.dvb_partitions['dvb-t'].get(clean_name)
+            if services:
+                return services[0]['sref']
             return None
         except Exception as e:
             logger.error(f"Error in DVB-T matching: {str(e)}")
@@ -1956,6 +2695,7 @@ class EPGServiceMapper:
             return matches
 
         keyword_lower = keyword.lower()
+        self._check_cancelled()
 
         for rytec_id, service_ref in rytec_data.items():
             if not service_ref:
@@ -1998,26 +2738,6 @@ class EPGServiceMapper:
         position_match = search(r'(\d+\.\d+[EW])', comment)
         return position_match.group(1) if position_match else None
 
-    def _extract_epg_url_from_m3u(self, m3u_path):
-        """Search for an EPG URL in M3U file comments."""
-        try:
-            with open(m3u_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
-            # Look for EPG URL in comments
-            epg_match = search(r'#EXTEPGURL:?(.*)$', content, MULTILINE)
-            if epg_match:
-                return epg_match.group(1).strip()
-
-            # Also check other common formats
-            epg_match = search(r'#EXTVLCOPT:epg-url=(.*)$', content, MULTILINE)
-            if epg_match:
-                return epg_match.group(1).strip()
-
-            return None
-        except BaseException:
-            return None
-
     def _convert_to_rytec_format(self, tvg_id):
         """Convert M3U channel IDs to Rytec format using LANGUAGE_TO_COUNTRY mapping."""
         if not tvg_id:
@@ -2078,126 +2798,115 @@ class EPGServiceMapper:
             return clean_name
 
     def _generate_epg_channels_file(self, epg_data, bouquet_name):
-        """Generate channels.xml file with correct service references."""
+        """Generate channels.xml file with correct service references.
+
+        epg_data is any iterable of (name, tvg_id, sref, match_type) tuples;
+        entries are written as they come, so a spooled iterator keeps the
+        whole stage at constant memory.
+        """
         epgimport_path = "/etc/epgimport"
         epg_filename = f"{bouquet_name}.channels.xml"
         epg_path = join(epgimport_path, epg_filename)
-        if config.plugins.m3uconverter.enable_debug.value:
-            logger.info(
-                "Generating EPG channels file with %s entries",
-                len(epg_data)
-            )
+        temp_path = epg_path + ".tmp"
 
         try:
-            if config.plugins.m3uconverter.enable_debug.value:
-                logger.info(
-                    "EPG_DATA DEBUG: %s entries received",
-                    len(epg_data)
-                )
-            if epg_data:
-                logger.info(
-                    "First entry: %s",
-                    epg_data[0]
-                )
-
-            channel_entries = []
             cache_stats = {'rytec': 0, 'dvb': 0, 'dvbt': 0, 'fallback': 0}
+            received_count = 0
             processed_count = 0
 
-            for channel in epg_data:
-                channel_name = channel.get('name', 'Unknown')
-                tvg_id = channel.get('tvg_id', '')
-                service_ref = channel.get('sref', '')
-                match_type = channel.get('match_type', 'iptv_fallback')
+            with open(temp_path, 'w', encoding="utf-8", buffering=65536) as f:
+                f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+                f.write('<channels>\n')
 
-                # DEBUG: log every 10 processed channels
-                if processed_count % 10 == 0:
-                    if config.plugins.m3uconverter.enable_debug.value:
-                        logger.debug(
-                            "Processing channel %s: %s -> %s",
-                            processed_count,
-                            channel_name,
-                            match_type
+                for channel_name, tvg_id, service_ref, match_type in epg_data:
+                    channel_name = channel_name or 'Unknown'
+                    match_type = match_type or 'iptv_fallback'
+                    if received_count == 0 and config.plugins.m3uconverter.enable_debug.value:
+                        logger.info(
+                            "First entry: %s",
+                            (channel_name, tvg_id, service_ref, match_type)
                         )
+                    received_count += 1
 
-                # Ensure service_ref is not empty
-                if not service_ref:
-                    if config.plugins.m3uconverter.enable_debug.value:
-                        logger.warning(
-                            "Skipping channel without service_ref: %s",
-                            channel_name
-                        )
-                    continue
+                    # DEBUG: log every 10 processed channels
+                    if processed_count % 10 == 0:
+                        if config.plugins.m3uconverter.enable_debug.value:
+                            logger.debug(
+                                "Processing channel %s: %s -> %s",
+                                processed_count,
+                                channel_name,
+                                match_type
+                            )
 
-                # Use the correct EPG ID method
-                channel_id = self._get_correct_epg_id(
-                    channel_name, tvg_id, service_ref)
+                    # Ensure service_ref is not empty
+                    if not service_ref:
+                        if config.plugins.m3uconverter.enable_debug.value:
+                            logger.warning(
+                                "Skipping channel without service_ref: %s",
+                                channel_name
+                            )
+                        continue
 
-                # Count match_type correctly
-                if 'rytec' in match_type:
-                    cache_stats['rytec'] += 1
-                elif 'dvb' in match_type:
-                    if self._is_dvb_t_service(service_ref):
-                        cache_stats['dvbt'] += 1
+                    # Use the correct EPG ID method
+                    channel_id = self._get_correct_epg_id(
+                        channel_name, tvg_id, service_ref)
+
+                    # Count match_type correctly
+                    if 'rytec' in match_type:
+                        cache_stats['rytec'] += 1
+                    elif 'dvb' in match_type:
+                        if self._is_dvb_t_service(service_ref):
+                            cache_stats['dvbt'] += 1
+                        else:
+                            cache_stats['dvb'] += 1
                     else:
-                        cache_stats['dvb'] += 1
-                else:
-                    cache_stats['fallback'] += 1
+                        cache_stats['fallback'] += 1
+
+                    # Create the correct XML entry
+                    f.write('  <!-- {} [{}] --><channel id="{}">{}</channel>\n'.format(
+                        channel_name, match_type, channel_id, service_ref))
+                    processed_count += 1
 
-                # Create the correct XML entry
-                entry = '  <!-- {} [{}] --><channel id="{}">{}</channel>\n'.format(
-                    channel_name, match_type, channel_id, service_ref)
-                channel_entries.append(entry)
-                processed_count += 1
+                f.write('</channels>\n')
 
-            # Write the file only if we have entries
-            if not channel_entries:
+            # Keep the previous file if nothing was written
+            if not processed_count:
+                remove(temp_path)
                 if config.plugins.m3uconverter.enable_debug.value:
                     logger.error("NO CHANNEL ENTRIES TO WRITE!")
                     logger.error(
                         "EPG data had %s entries but 0 were processed",
-                        len(epg_data)
+                        received_count
                     )
                 return False
 
-            # SINGLE WRITE
-            with open(epg_path, 'w', encoding="utf-8", buffering=65536) as f:
-                f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-                f.write('<channels>\n')
-                f.writelines(channel_entries)
-                f.write('</channels>\n')
+            replace(temp_path, epg_path)
 
             # VERIFY: Check that the file has been written
             file_size = getsize(epg_path) if exists(epg_path) else 0
             if config.plugins.m3uconverter.enable_debug.value:
                 logger.info(
-                    "EPG file written: %s (%s bytes, %s entries)",
+                    "EPG file written: %s (%s bytes, %s of %s entries)",
                     epg_path,
                     file_size,
-                    len(channel_entries)
-                )
-                logger.info(
-                    "Optimized EPG channels file created: %s entries",
-                    len(channel_entries)
+                    processed_count,
+                    received_count
                 )
                 logger.info(
                     "EPG Match stats - Rytec: %s, DVB-S: %s, DVB-T: %s, Fallback: %s",
-                    cache_stats.get(
-                        'rytec',
-                        0),
-                    cache_stats.get(
-                        'dvb',
-                        0),
-                    cache_stats.get(
-                        'dvbt',
-                        0),
-                    cache_stats.get(
-                        'fallback',
-                        0))
+                    cache_stats['rytec'],
+                    cache_stats['dvb'],
+                    cache_stats['dvbt'],
+                    cache_stats['fallback'])
                 logger.info("========= debug_epg_mapping =========")
             return True
 
         except Exception as e:
+            if exists(temp_path):
+                try:
+                    remove(temp_path)
+                except Exception:
+                    pass
             logger.error(f"Error generating EPG channels file: {str(e)}")
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
@@ -2622,6 +3331,45 @@ class EPGServiceMapper:
 
         return self._generate_clean_rytec_id(channel_name, service_ref)
 
+    def _estimate_container_size(self, container, sample_size=50):
+        """Estimate the deep size of a dict from a sample of its entries."""
+        if not container:
+            return getsizeof(container)
+
+        sampled = 0
+        sample_bytes = 0
+        for key, value in islice(container.items(), sample_size):
+            sample_bytes += getsizeof(key) + getsizeof(value)
+            if isinstance(value, (list, tuple)):
+                for item in value:
+                    sample_bytes += getsizeof(item)
+                    if isinstance(item, dict):
+                        sample_bytes += sum(
+                            getsizeof(v) for v in item.values())
+            elif isinstance(value, dict):
+                sample_bytes += sum(getsizeof(v) for v in value.values())
+            sampled += 1
+
+        return getsizeof(container) + sample_bytes * len(container) // sampled
+
+    def _estimate_memory_footprint(self):
+        """Estimate memory held by the loaded databases and caches, in KB."""
+        containers = (
+            self.mapping.rytec['basic'],
+            self.mapping.rytec['clean'],
+            self.mapping.rytec['extended'].loaded,
+            self.mapping.rytec['extended'].offsets,
+            self.mapping.dvb,
+            self.mapping.optimized,
+            self.mapping._clean_name_cache,
+            self._match_cache,
+            self.epg_cache,
+            self.manual_db._manual_cache if hasattr(
+                self.manual_db, '_manual_cache') else {},
+        )
+        total = sum(self._estimate_container_size(c) for c in containers)
+        return total // 1024
+
     def _get_cache_statistics(self):
         """Return accurate cache statistics with proper reset handling"""
         try:
@@ -2703,7 +3451,18 @@ class EPGServiceMapper:
 
                 # Additional info for debugging
                 'database_mode': self.database_mode,
-                'total_processed': total_processed
+                'total_processed': total_processed,
+
+                # Fuzzy-search prefilter
+                'prefilter_checks': self._prefilter_checks,
+                'prefilter_skips': self._prefilter_skips,
+                'prefilter_hit_rate': (
+                    self._prefilter_skips / self._prefilter_checks * 100
+                    if self._prefilter_checks else 0),
+
+                # Memory profile
+                'low_memory_mode': self.low_memory,
+                'memory_footprint_kb': self._estimate_memory_footprint()
             }
         except Exception as e:
             logger.error(f"Error in cache statistics: {str(e)}")
@@ -3045,101 +3804,303 @@ class EPGServiceMapper:
 
         return epg_urls.get(country_code, epg_urls['ALL'])
 
-    def _download_epg_file(self, url, output_path):
-        """Download and decompress EPG file."""
+    def _download_epg_file(self, url, output_path, chunk_size=65536, validators=None, session=None):
+        """Download and decompress EPG file in fixed-size chunks.
+
+        The body is streamed through an incremental gzip decompressor into
+        a temporary file, then renamed, so the feed is never held in memory.
+        validators (etag/last_modified) make the request conditional;
+        session is an optional requests.Session with pooled connections.
+
+        Returns (status, validators) where status is "downloaded",
+        "not_modified" or "failed".
+        """
+        temp_path = output_path + ".part"
         try:
             import requests
-            import gzip
-            from io import BytesIO
+            import zlib
             headers = {
                 "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
                 "Accept": "application/xml, */*"}
+            if validators:
+                if validators.get('etag'):
+                    headers["If-None-Match"] = validators['etag']
+                if validators.get('last_modified'):
+                    headers["If-Modified-Since"] = validators['last_modified']
+
+            compressed = None
+            pending = b''
+            written = 0
+            decompressor = None
 
             # Download the file
-            response = requests.get(
-                url, headers=headers, timeout=30, verify=False)
-            response.raise_for_status()
+            http = session or requests
+            with http.get(url, headers=headers, timeout=30, verify=False, stream=True) as response:
+                if response.status_code == 304:
+                    if config.plugins.m3uconverter.enable_debug.value:
+                        logger.info("EPG file not modified: %s", url)
+                    return "not_modified", validators
+
+                response.raise_for_status()
+                new_validators = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified')
+                }
+
+                with open(temp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if not chunk:
+                            continue
 
-            # Check if it's a gzipped file
-            if url.endswith('.gz') or response.headers.get(
-                    'content-type') == 'application/gzip':
-                # Decompress gzip file
-                with gzip.GzipFile(fileobj=BytesIO(response.content)) as gz_file:
-                    decompressed_content = gz_file.read()
+                        # Detect gzip from the magic bytes: the server may
+                        # already have removed a Content-Encoding layer
+                        if compressed is None:
+                            pending += chunk
+                            if len(pending) < 2:
+                                continue
+                            compressed = pending[:2] == b'\x1f\x8b'
+                            if compressed:
+                                decompressor = zlib.decompressobj(
+                                    16 + zlib.MAX_WBITS)
+                            chunk, pending = pending, b''
+
+                        if compressed:
+                            data = decompressor.decompress(chunk)
+                            # Concatenated gzip members
+                            while decompressor.eof and decompressor.unused_data:
+                                rest = decompressor.unused_data
+                                decompressor = zlib.decompressobj(
+                                    16 + zlib.MAX_WBITS)
+                                data += decompressor.decompress(rest)
+                            chunk = data
+
+                        f.write(chunk)
+                        written += len(chunk)
+
+                    if pending:
+                        f.write(pending)
+                        written += len(pending)
+                    if compressed:
+                        tail = decompressor.flush()
+                        f.write(tail)
+                        written += len(tail)
+                        # Dropped connection or cut body: keep the cached feed
+                        if not decompressor.eof:
+                            raise EOFError("Truncated gzip stream")
+
+            replace(temp_path, output_path)
 
-                # Write decompressed content
-                with open(output_path, 'wb') as f:
-                    f.write(decompressed_content)
+            if config.plugins.m3uconverter.enable_debug.value:
+                logger.info(
+                    "Downloaded EPG file to %s (%s bytes, gzip: %s)",
+                    output_path,
+                    written,
+                    bool(compressed)
+                )
+            return "downloaded", new_validators
 
-                if config.plugins.m3uconverter.enable_debug.value:
-                    logger.info(
-                        "Downloaded and decompressed EPG file to %s",
-                        output_path
-                    )
+        except Exception as e:
+            logger.error(f"EPG download failed: {str(e)}")
+            if exists(temp_path):
+                try:
+                    remove(temp_path)
+                except OSError:
+                    pass
+            return "failed", None
 
-            else:
-                # Write directly if not compressed
-                with open(output_path, 'wb') as f:
-                    f.write(response.content)
-                if config.plugins.m3uconverter.enable_debug.value:
-                    logger.info(f"Downloaded EPG file to {output_path}")
+    def _epg_cache_paths(self, url):
+        """Return the (body, meta, channel index) cache paths of an EPG URL."""
+        base = join(EPG_CACHE_DIR, hashlib.md5(url.encode('utf-8')).hexdigest())
+        return base + ".xml", base + ".json", base + ".channels.json"
 
-            return True
+    def _fetch_epg_feed(self, url, session=None):
+        """Fetch an EPG URL through the local conditional HTTP cache.
+
+        The cached body is revalidated with If-None-Match/If-Modified-Since.
+        Returns (body_path, status) with the status of _download_epg_file.
+        """
+        if not exists(EPG_CACHE_DIR):
+            makedirs(EPG_CACHE_DIR, exist_ok=True)
 
+        body_path, meta_path, index_path = self._epg_cache_paths(url)
+        validators = None
+        if exists(body_path) and exists(meta_path):
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    validators = json.load(f)
+            except (OSError, ValueError):
+                validators = None
+
+        status, new_validators = self._download_epg_file(
+            url, body_path, validators=validators, session=session)
+
+        if status == "downloaded":
+            # The parsed channel index belongs to the previous body
+            if exists(index_path):
+                remove(index_path)
+            meta = dict(new_validators or {})
+            meta['url'] = url
+            meta['fetched'] = strftime("%Y-%m-%d %H:%M:%S")
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, indent=2)
+
+        return body_path, status
+
+    def _save_epgshare_index(self, index_path, feed=None):
+        """Save the parsed channels of a feed next to its cached body."""
+        channels = []
+        with self._rytec_lock:
+            # An id may also hold Rytec variants and other feeds' variants
+            for channel_id, variants in self.mapping.rytec['extended'].loaded_items():
+                for variant in variants or ():
+                    if variant.get('source_type') == 'epgshare' and variant.get('feed') == feed:
+                        channels.append(
+                            [channel_id, variant.get('channel_name'), variant.get('sref')])
+                        break
+
+        try:
+            temp_path = index_path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(channels, f, ensure_ascii=False)
+            replace(temp_path, index_path)
         except Exception as e:
-            logger.error(f"EPG download failed: {str(e)}")
-            return False
+            logger.error(f"Error saving EPGShare index: {str(e)}")
+        return len(channels)
 
-    def _download_and_parse_epgshare(self, language_code="all"):
-        """Download and parse EPGShare data with extensive debugging."""
+    def _load_epgshare_index(self, index_path, feed=None):
+        """Load the channels of a feed from a saved index, return the count."""
+        if not exists(index_path):
+            return 0
         try:
-            country_code = LANGUAGE_TO_COUNTRY.get(language_code, 'ALL')
-            epg_url = "https://epgshare01.online/epgshare01/epg_ripper_{}1.xml.gz".format(
-                country_code)
+            with open(index_path, 'r', encoding='utf-8') as f:
+                channels = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading EPGShare index: {str(e)}")
+            return 0
 
+        self._clear_epgshare_entries(feed)
+        with self._rytec_lock:
+            for channel_id, display_name, service_ref in channels:
+                self._store_epgshare_channel(
+                    channel_id, display_name, service_ref, feed)
+        return len(channels)
+
+    def _get_extra_epg_languages(self):
+        """Return the valid language codes of the extra EPGShare feeds."""
+        codes = []
+        for code in config.plugins.m3uconverter.extra_epg_languages.value.split(','):
+            code = code.strip().lower()
+            if not code:
+                continue
+            # Unknown codes would silently fall back to the huge ALL feed
+            if code not in LANGUAGE_TO_COUNTRY:
+                logger.warning(f"⚠️ Unknown EPG language code ignored: {code}")
+                continue
+            codes.append(code)
+        return codes
+
+    def _download_and_parse_epgshare(self, language_code="all", extra_languages=None):
+        """Download (or revalidate) and parse one or more EPGShare feeds.
+
+        Feeds are fetched concurrently by a small thread pool sharing one
+        keep-alive session, and each one is parsed as soon as it arrives.
+        """
+        urls = []
+        for code in [language_code] + list(extra_languages or []):
+            url = self._get_epg_url_for_language(code)
+            if url not in urls:
+                urls.append(url)
+
+        if len(urls) == 1:
+            return self._ingest_epgshare_feed(
+                urls[0], *self._fetch_epg_feed(urls[0]))
+
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+        except ImportError as e:
+            logger.error(f"EPG Share error: {str(e)}")
+            return False
+
+        workers = min(self.EPG_FETCH_WORKERS, len(urls))
+        loaded = 0
+        with requests.Session() as session:
+            adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._fetch_epg_feed, url, session): url
+                    for url in urls
+                }
+                for future in as_completed(futures):
+                    url = futures[future]
+                    try:
+                        epg_path, status = future.result()
+                    except Exception as e:
+                        logger.error(f"EPG Share error for {url}: {str(e)}")
+                        continue
+                    if self._ingest_epgshare_feed(url, epg_path, status):
+                        loaded += 1
+
+        if config.plugins.m3uconverter.enable_debug.value:
+            logger.info(
+                "EPGShare feeds loaded: %s/%s",
+                loaded,
+                len(urls)
+            )
+        return loaded > 0
+
+    def _ingest_epgshare_feed(self, epg_url, epg_path, status):
+        """Merge one fetched EPGShare feed into the Rytec mapping."""
+        try:
             if config.plugins.m3uconverter.enable_debug.value:
                 logger.info(
-                    "Downloading EPG from: %s",
-                    epg_url
+                    "Loading EPG feed: %s (%s)",
+                    epg_url,
+                    status
                 )
 
-            # Download the file
-            temp_path = join(LOG_DIR, "epgshare_download.xml")
-            success = self._download_epg_file(epg_url, temp_path)
+            index_path = self._epg_cache_paths(epg_url)[2]
+            self._epgshare_feeds[epg_path] = epg_url
 
-            if not success:
-                if config.plugins.m3uconverter.enable_debug.value:
-                    logger.error("EPGShare download failed")
-                return False
+            if status == "failed":
+                if not exists(epg_path):
+                    if config.plugins.m3uconverter.enable_debug.value:
+                        logger.error("EPGShare download failed")
+                    return False
+                logger.warning("⚠️ EPGShare download failed, using cached copy")
+
+            elif status == "not_modified":
+                # Reuse the channels parsed from this body last time
+                cached_count = self._load_epgshare_index(index_path, epg_url)
+                if cached_count > 0:
+                    self._remember_source(epg_path, "epgshare")
+                    if config.plugins.m3uconverter.enable_debug.value:
+                        logger.info(
+                            "EPGShare unchanged: %s channels from cached index",
+                            cached_count
+                        )
+                    return True
 
             # Parse the file
-            parse_success = self._parse_epgshare_for_mapping(temp_path)
-
-            if parse_success:
-                # Verify results
-                epgshare_count = 0
-                with self._rytec_lock:
-                    for channel_id, variants in self.mapping.rytec['extended'].items(
-                    ):
-                        for variant in variants:
-                            if variant.get('source_type') == 'epgshare':
-                                epgshare_count += 1
-                                break
+            if not self._parse_epgshare_for_mapping(epg_path, epg_url):
+                logger.error("EPGShare parsing failed")
+                return False
+
+            epgshare_count = self._save_epgshare_index(index_path, epg_url)
             if config.plugins.m3uconverter.enable_debug.value:
                 logger.info(
                     "EPGShare parsing completed: %s channels",
                     epgshare_count
                 )
 
-                if epgshare_count > 0:
-                    return True
-                else:
-                    logger.error(
-                        "Parsing succeeded but no channels were added!")
-                    return False
-            else:
-                logger.error("EPGShare parsing failed")
-                return False
+            if epgshare_count > 0:
+                return True
+            logger.error("Parsing succeeded but no channels were added!")
+            return False
 
         except Exception as e:
             logger.error(f"EPG Share error: {str(e)}")
@@ -4145,12 +5106,20 @@ class UniversalConverter(Screen):
         title_text = title_mapping.get(conversion_type, PLUGIN_TITLE)
         self.setTitle(title_text)
         self.m3u_channels_list = []
+        # Playlist read on the fly at conversion time (low-memory mode)
+        self.m3u_streamed_file = None
+        self.m3u_channel_count = 0
+        # EPG URL declared by the loaded playlist header
+        self.m3u_epg_url = None
+        # Duplicates dropped per dedupe policy by the last complete parse
+        self.m3u_duplicates_dropped = {}
         # self.bouquet_list = []
         self.aspect_manager = AspectManager()
         self.core_converter = core_converter
         self.progress = None
         self.is_converting = False
-        self.cancel_conversion = False
+        # Progress/cancel token of the running conversion
+        self.conversion_token = ConversionToken()
         self.epg_mapper = None
         self.last_conversion_stats = None
         self.last_cache_stats = None
@@ -4195,10 +5164,10 @@ class UniversalConverter(Screen):
             self["status"].setText(_("Press RED to select file"))
             self.file_loaded = False
 
-        self.epg_mapper = self._initialize_epg_mapper()
+        self.epg_mapper = self._initialize_epg_mapper(wait=False)
 
-    def _initialize_epg_mapper(self):
-        """Initialize EPG mapper"""
+    def _initialize_epg_mapper(self, wait=True):
+        """Initialize EPG mapper; without wait, never block on a preload"""
 
         # CHECK IF ALREADY EXISTS to avoid double initialization
         if hasattr(self, 'epg_mapper') and self.epg_mapper is not None:
@@ -4206,75 +5175,16 @@ class UniversalConverter(Screen):
                 logger.info("✅ EPG_MAPPER already initialized, reusing")
             return self.epg_mapper
 
-        try:
-            if config.plugins.m3uconverter.enable_debug.value:
-                logger.info("🔄 Creating EPGServiceMapper...")
-            self.epg_mapper = EPGServiceMapper(prefer_satellite=True)
-
-            # LOAD ALL DATABASES SEQUENTIALLY - ONLY ONCE
-            if config.plugins.m3uconverter.enable_debug.value:
-                logger.info("📥 Loading all databases...")
-
-            # 1. First local databases (essential)
-            self.epg_mapper._parse_lamedb()
-            if config.plugins.m3uconverter.enable_debug.value:
-                logger.info(
-                    "✅ Lamedb loaded: %s channels",
-                    len(self.epg_mapper.mapping.dvb)
-                )
-
-            self.epg_mapper._parse_existing_bouquets()
-            if config.plugins.m3uconverter.enable_debug.value:
-                logger.info("✅ Existing bouquets loaded")
-
-            # 2. FORCE Rytec loading with debug
-            if config.plugins.m3uconverter.enable_debug.value:
-                logger.info("🔍 LOADING RYTEC DATABASE...")
-            rytec_paths = [
-                "/etc/epgimport/rytec.channels.xml",
-                "/usr/lib/enigma2/python/Plugins/Extensions/EPGImport/rytec.channels.xml",
-            ]
-
-            for rytec_path in rytec_paths:
-                if fileExists(rytec_path):
-                    if config.plugins.m3uconverter.enable_debug.value:
-                        logger.info(f"📁 Rytec file found: {rytec_path}")
-                    self.epg_mapper._parse_rytec_channels(rytec_path)
-
-                    # check 'basic' instead of 'extended'
-                    rytec_count = len(self.epg_mapper.mapping.rytec['basic'])
-                    if rytec_count > 0:
-                        if config.plugins.m3uconverter.enable_debug.value:
-                            logger.info(
-                                "✅ Rytec database loaded: %s channels",
-                                rytec_count
-                            )
-                        break
-                    else:
-                        logger.error(
-                            "❌ Rytec file exists but 0 channels loaded from: %s", rytec_path)
-                else:
-                    logger.warning(f"📁 File not found: {rytec_path}")
-            # 3. Channel mapping and optimizations
-            self.epg_mapper._load_channel_mapping()
-            if config.plugins.m3uconverter.ignore_dvbt.value:
-                self.epg_mapper._clear_dvbt_services()
-
-            self.epg_mapper.optimize_matching()
-
-            # clean csv < 20mb
-            self.epg_mapper._cleanup_smart()
-
-            # FINAL CHECK
-            final_rytec = len(self.epg_mapper.mapping.rytec.get('basic', {}))
-            final_dvb = len(self.epg_mapper.mapping.dvb)
-            if config.plugins.m3uconverter.enable_debug.value:
-                logger.info(
-                    "🎯 FINAL DATABASE STATUS: Rytec=%s, DVB=%s",
-                    final_rytec,
-                    final_dvb
-                )
-
+        try:
+            # Borrow the session-wide mapper, loaded only once
+            if wait:
+                self.epg_mapper = database_registry.get_epg_mapper()
+                return self.epg_mapper
+
+            self.epg_mapper = database_registry.request_epg_mapper(
+                self._on_shared_mapper_ready)
+            if self.epg_mapper is None:
+                self["status"].setText(_("Loading channel databases..."))
             return self.epg_mapper
 
         except Exception as e:
@@ -4288,9 +5198,33 @@ class UniversalConverter(Screen):
                 traceback.format_exc()
             )
             # Still create a fallback instance
-            self.epg_mapper = EPGServiceMapper(prefer_satellite=True)
+            self.epg_mapper = EPGServiceMapper(
+                prefer_satellite=True,
+                manual_db=database_registry.get_manual_db())
             return self.epg_mapper
 
+    def _on_shared_mapper_ready(self, mapper):
+        """Registry callback from the loading thread."""
+        callFromThread(self._adopt_shared_mapper, mapper)
+
+    def _adopt_shared_mapper(self, mapper):
+        """Take the mapper the preload finished while this screen was open."""
+        if self.epg_mapper is not None:
+            return
+        if mapper is None:
+            # The preload failed; the next conversion loads it again
+            if config.plugins.m3uconverter.enable_debug.value:
+                logger.warning("⚠️ Shared EPG mapper not available yet")
+            return
+        self.epg_mapper = mapper
+        if self["status"].getText() != _("Loading channel databases..."):
+            return
+        if self.selected_file:
+            self["status"].setText(
+                _("File loaded: {}").format(basename(self.selected_file)))
+        else:
+            self["status"].setText(_("Press RED to select file"))
+
     def _open_file_browser(self):
         """Open file browser for file selection."""
         if config.plugins.m3uconverter.enable_debug.value:
@@ -4309,6 +5243,9 @@ class UniversalConverter(Screen):
                 path = config.plugins.m3uconverter.lastdir.value
 
             pattern = r"(?i)^.*\.(tv|m3u|m3u8|json|xspf)$"
+            if self.conversion_type in ("m3u_to_tv", "m3u_to_json"):
+                # Compressed playlists are streamed through the decompressor
+                pattern += r"|^.*\.(m3u|m3u8)\.(gz|xz|bz2)$|^.*\.zip$"
 
             if not path or not isdir(path):
                 path = "/media/hdd" if isdir("/media/hdd") else "/tmp"
@@ -4395,7 +5332,7 @@ class UniversalConverter(Screen):
 
         bouquet_name = ""
         if hasattr(self, 'selected_file') and self.selected_file:
-            bouquet_name = basename(self.selected_file).split('.')[0]
+            bouquet_name = self._playlist_base_name(self.selected_file)
 
         def editor_closed(result=None):
             """Callback when the manual editor closes - return to UniversalConverter"""
@@ -4576,6 +5513,8 @@ class UniversalConverter(Screen):
             (_("📥 Import Manual Database"), "import_manual_db"),
             (_("🧹 Clean Manual Database"), "clean_manual_db"),
         ]
+        if self.conversion_type in ("m3u_to_tv", "m3u_to_json"):
+            menu_items.insert(0, (_("🌐 Convert from URL"), "open_url"))
 
         def tool_selection_handler(choice):
             """Handle tool selection from menu."""
@@ -4613,6 +5552,8 @@ class UniversalConverter(Screen):
                     self._import_manual_database()
                 elif action == "clear_log":
                     self._clear_log_file()
+                elif action == "open_url":
+                    self._open_url_input()
 
         self.session.openWithCallback(
             tool_selection_handler,
@@ -4760,6 +5701,26 @@ class UniversalConverter(Screen):
                 _("• Mode: {}").format(stats.get('database_mode', 'N/A'))
             ])
 
+            if stats.get('prefilter_checks'):
+                message_lines.extend([
+                    "",
+                    _("⚡ FUZZY PREFILTER:"),
+                    _("• Checked: {}").format(stats['prefilter_checks']),
+                    _("• Skipped to fallback: {} ({:.1f}%)").format(
+                        stats.get('prefilter_skips', 0),
+                        stats.get('prefilter_hit_rate', 0))
+                ])
+
+            if 'memory_footprint_kb' in stats:
+                message_lines.extend([
+                    "",
+                    _("🧠 MEMORY:"),
+                    _("• Profile: {}").format(
+                        _("Low memory") if stats.get('low_memory_mode') else _("Normal")),
+                    _("• Estimated footprint: {:.1f} MB").format(
+                        stats['memory_footprint_kb'] / 1024.0)
+                ])
+
             def stats_closed(result=None):
                 self._show_enhanced_tools_menu()
 
@@ -4778,12 +5739,28 @@ class UniversalConverter(Screen):
     def _reload_epg_database(self):
         """Reload EPG database."""
         try:
+            # Loaded mapper: re-ingest only the changed sources
+            if self.epg_mapper and self.epg_mapper._source_fingerprints:
+                result = self.epg_mapper.reload_changed_sources()
+                updated = sum(len(paths) for paths in result.values())
+                self.session.openWithCallback(
+                    lambda result=None: self._show_enhanced_tools_menu(),
+                    MessageBox,
+                    _("EPG database reloaded: {} sources updated").format(updated),
+                    MessageBox.TYPE_INFO,
+                    timeout=6
+                )
+                return
+
             if config.plugins.m3uconverter.enable_debug.value:
                 logger.info("Starting EPG mapper reinitialization...")
-            self.epg_mapper = EPGServiceMapper(prefer_satellite=True)
+            self.epg_mapper = EPGServiceMapper(
+                prefer_satellite=True,
+                manual_db=database_registry.get_manual_db())
             self.epg_mapper._refresh_config()
 
             if self.epg_mapper.initialize():
+                database_registry.replace_epg_mapper(self.epg_mapper)
                 if config.plugins.m3uconverter.enable_debug.value:
                     logger.info("EPG mapper reinitialized successfully")
                 self.session.openWithCallback(
@@ -4916,7 +5893,7 @@ class UniversalConverter(Screen):
 
         bouquet_name = ""
         if hasattr(self, 'selected_file') and self.selected_file:
-            bouquet_name = basename(self.selected_file).split('.')[0]
+            bouquet_name = self._playlist_base_name(self.selected_file)
 
         def editor_closed(result=None):
             """Callback when editor closes - RE-open the Tools menu"""
@@ -5722,6 +6699,8 @@ class UniversalConverter(Screen):
             # Reset all states
             self.file_loaded = False
             self.m3u_channels_list = []
+            self.m3u_streamed_file = None
+            self.m3u_epg_url = None
             self["status"].setText(_("Processing selection..."))
 
             # Validate input
@@ -5872,71 +6851,104 @@ class UniversalConverter(Screen):
         timestamp = strftime("%Y%m%d_%H%M%S")
         return f"{ARCHIMEDE_M3U_PATH}/archimede_export_{timestamp}.m3u"
 
-    def handle_very_large_file(self, filename):
-        """Handle extremely large M3U files with higher limits."""
-        file_size_mb = getsize(filename) / (1024 * 1024)
-
-        # Higher limits for large files:
-        if file_size_mb > 100:  # Very large files > 100MB
-            max_channels = 20000
-        elif file_size_mb > 50:   # Large files 50-100MB
-            max_channels = 15000
-        elif file_size_mb > 20:   # Medium files 20-50MB
-            max_channels = 10000
-        else:                     # Small files but above threshold
-            max_channels = 5000
-
-        self["status"].setText(
-            _("Large file detected: {:.1f}MB. Processing first {} channels...").format(
-                file_size_mb, max_channels))
-
-        entries = []
-        count = 0
-
-        try:
-            with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
-                current_params = {}
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    if count >= max_channels:
-                        if config.plugins.m3uconverter.enable_debug.value:
-                            logger.info(
-                                "Reached maximum channel limit: {}".format(max_channels))
-                        break
-
-                    if line.startswith('#EXTINF:'):
-                        current_params = {
-                            'f_type': 'inf', 'title': '', 'uri': ''}
-                        parts = line[8:].split(',', 1)
-                        if len(parts) > 1:
-                            current_params['title'] = parts[1].strip()
-
-                    elif line.startswith('#EXTGRP:'):
-                        current_params['group-title'] = line[8:].strip()
-
-                    elif line.startswith('#'):
-                        continue
+    def _open_playlist(self, filename, token=None):
+        """Return a streaming parser honouring the max channels setting.
 
-                    else:
-                        if current_params and line:
-                            current_params['uri'] = line.strip()
-                            if current_params.get('title'):
-                                entries.append(current_params.copy())
-                                count += 1
-                            current_params = {}
+        A http(s) URL is downloaded by a prefetch thread while the parser
+        consumes the lines, through a bounded buffer. JSON playlists get
+        the incremental JSON reader, yielding the same records.
+        """
+        dedupe = ChannelDeduplicator(self._dedupe_policy())
+        if filename.lower().endswith('.json'):
+            return JSONStreamParser(
+                filename,
+                limit=config.plugins.m3uconverter.max_channels.value,
+                token=token,
+                dedupe=dedupe)
+
+        source = filename
+        if is_url(filename):
+            source = chunk_lines(prefetch(self._iter_url_chunks(filename)))
+        return M3UStreamParser(
+            source,
+            self._process_url,
+            limit=config.plugins.m3uconverter.max_channels.value,
+            token=token,
+            dedupe=dedupe)
+
+    def _dedupe_policy(self):
+        """Return the dedupe policy to parse with.
+
+        'quality' holds the whole playlist before yielding a channel, so
+        low memory mode falls back to 'exact'.
+        """
+        policy = config.plugins.m3uconverter.dedupe_policy.value
+        if policy == "quality" and config.plugins.m3uconverter.low_memory_mode.value:
+            logger.info("🧬 Low memory mode: 'quality' duplicate check replaced by 'exact'")
+            return "exact"
+        return policy
+
+    def _log_duplicates(self, parser):
+        """Keep the per-policy duplicate counts of a completed parse."""
+        self.m3u_duplicates_dropped = parser.dedupe.dropped
+        if config.plugins.m3uconverter.enable_debug.value and any(parser.dedupe.dropped.values()):
+            logger.info(f"🧬 Duplicates dropped: {parser.dedupe.dropped}")
+
+    def _iter_url_chunks(self, url, chunk_size=65536):
+        """Yield the body of a remote playlist in fixed-size chunks."""
+        import requests
+        headers = {
+            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
+            "Accept": "*/*"}
+        with requests.get(url, headers=headers, timeout=30, verify=False, stream=True) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size):
+                if chunk:
+                    yield chunk
+
+    def _playlist_base_name(self, path):
+        """Playlist name without extensions; host name for bare URLs."""
+        if is_url(path):
+            parsed = urlparse(path)
+            return basename(parsed.path).split('.')[0] or parsed.hostname or "playlist"
+        return basename(path).split('.')[0]
+
+    def _open_url_input(self):
+        """Ask for a playlist URL to convert without downloading it first."""
+        self.session.openWithCallback(
+            self._handle_url_input,
+            VirtualKeyBoard,
+            title=_("Enter playlist URL"),
+            text=config.plugins.m3uconverter.last_url.value
+        )
 
-            if config.plugins.m3uconverter.enable_debug.value:
-                logger.info(
-                    "Large file processing completed: {} channels from {:.1f}MB file".format(
-                        len(entries), file_size_mb))
+    def _handle_url_input(self, url=None):
+        """Select a remote playlist: it is streamed at conversion time."""
+        url = (url or "").strip()
+        if not url:
+            return
+        if not is_url(url):
+            self._show_error_message(_("Invalid URL: only http:// and https:// are supported"))
+            return
 
-        except Exception as e:
-            logger.error(f"Large file processing error: {str(e)}")
+        config.plugins.m3uconverter.last_url.value = url
+        config.plugins.m3uconverter.last_url.save()
 
-        return entries
+        # Nothing is read now: download, parse and matching run together
+        # in the conversion, so the channel count is unknown until then
+        self.selected_file = url
+        self.m3u_streamed_file = url
+        self.m3u_channels_list = []
+        self.m3u_channel_count = 0
+        self.m3u_epg_url = None
+        self.m3u_duplicates_dropped = {}
+        self["list"].setList([])
+        self.file_loaded = True
+        self._last_channel_count = None
+        self._update_ui_success(0)
+        self["status"].setText(_("URL ready: press GREEN to convert"))
+        if config.plugins.m3uconverter.enable_debug.value:
+            logger.info(f"🌐 Remote playlist selected: {url}")
 
     def _parse_m3u_file(self, filename=None):
         """Parse M3U file with configurable large file handling."""
@@ -5945,56 +6957,37 @@ class UniversalConverter(Screen):
             if not file_to_parse:
                 raise ValueError(_("No file selected"))
 
+            self.m3u_streamed_file = None
+            self.m3u_duplicates_dropped = {}
+            parser = self._open_playlist(file_to_parse)
             file_size = getsize(file_to_parse)
             threshold_bytes = config.plugins.m3uconverter.large_file_threshold_mb.value * 1024 * 1024
+            compressed = is_compressed(file_to_parse)
+            # The unpacked size of a compressed playlist is unknown: stream it
+            large_file = compressed or file_size > threshold_bytes
+            low_memory = config.plugins.m3uconverter.low_memory_mode.value
+
+            if large_file or low_memory:
+                # Keep only the preview: the conversion streams the file again.
+                # The rest is counted on the raw bytes, nothing else decoded
+                self.m3u_channels_list = list(islice(parser, 100))
+                count = max(parser.count_entries(), len(self.m3u_channels_list))
+                self.m3u_epg_url = parser.epg_url
+                self.m3u_channel_count = count
+                self.m3u_streamed_file = file_to_parse
+                self._show_m3u_preview()
+                if config.plugins.m3uconverter.enable_debug.value:
+                    logger.info(
+                        "✅ STREAMED: {} channels ({:.1f}MB) will be read at conversion".format(
+                            count, file_size / (1024 * 1024)))
+                self._update_ui_success(count)
+                return
 
-            # Use appropriate parsing method based on file size
-            if file_size > threshold_bytes:  # > configured MB
-                self.m3u_channels_list = self.handle_very_large_file(
-                    file_to_parse)
-            elif file_size > 1 * 1024 * 1024:  # > 1MB
-                self.m3u_channels_list = self._parse_m3u_incremental(
-                    file_to_parse)
-            else:
-                with open(file_to_parse, 'r', encoding='utf-8', errors='replace') as f:
-                    data = f.read()
-                self.m3u_channels_list = self._parse_m3u_content(data)
-
-            # Filter and process channels with proper attribute mapping
-            filtered_channels = []
-            for channel in self.m3u_channels_list:
-                if channel.get('uri'):
-                    # Map attributes to consistent names
-                    filtered_channels.append({
-                        'name': channel.get('title', ''),
-                        'url': self._process_url(channel['uri']),
-                        'group': channel.get('group-title', ''),
-                        'tvg_id': channel.get('tvg-id', ''),
-                        'tvg_name': channel.get('tvg-name', ''),
-                        'logo': channel.get('tvg-logo', ''),
-                        'duration': channel.get('length', '-1'),
-                        'user_agent': channel.get('user-agent', ''),
-                        'language': channel.get('tvg-language', '')
-                    })
-
-            self.m3u_channels_list = filtered_channels
-
-            # Update UI
-            display_list = []
-            for idx, channel in enumerate(
-                    self.m3u_channels_list[:100]):  # Show only first 100
-                name = sub(r'\[.*?\]', '', channel['name']).strip()
-                group = channel.get('group', 'Default')
-                group = clean_group_name(group)
-                display_text = "{:03d}. {}{}".format(
-                    idx + 1,
-                    group + ' - ' if group else '',
-                    name
-                )
-                display_list.append(display_text)
+            self.m3u_channels_list = list(parser)
+            self.m3u_epg_url = parser.epg_url
+            self._log_duplicates(parser)
 
-            self["list"].setList(display_list)
-            self.file_loaded = True
+            self._show_m3u_preview()
 
             if config.plugins.m3uconverter.enable_debug.value:
                 logger.info("✅ FINAL COUNT: {} channels ready for conversion".format(
@@ -6008,171 +7001,43 @@ class UniversalConverter(Screen):
             self.file_loaded = False
             self.m3u_channels_list = []
 
-    def _parse_m3u_content(self, data):
-        """Advanced parser for M3U content with support for extended attributes."""
-        entries = []
-        current_params = {}
-        attributes = {}
-        lines_processed = 0
-        lines = data.split('\n')
-        for line in lines:
-            lines_processed += 1
-            line = line.strip()
-            if not line:
-                continue
-
-            if lines_processed % 100 == 0:
-                eTimer().start(10, True)
-
-            if line.startswith('#EXTM3U'):
-                continue
-
-            elif line.startswith('#EXTINF:'):
-                current_params = {'f_type': 'inf', 'title': '', 'uri': ''}
-                extinf_content = line[8:].strip()
-
-                if ',' in extinf_content:
-                    last_comma_index = extinf_content.rfind(',')
-                    attributes_part = extinf_content[:last_comma_index].strip()
-                    title_part = extinf_content[last_comma_index + 1:].strip()
-                    current_params['title'] = title_part
-                    attr_matches = findall(
-                        r'(\S+?)="([^"]*)"', attributes_part)
-                    for key, value in attr_matches:
-                        attributes[key.lower()] = value
-
-                    duration_match = search(r'^(-?\d+)', attributes_part)
-                    if duration_match:
-                        attributes['length'] = duration_match.group(1)
-
-                    current_params.update(attributes)
-
-                else:
-                    current_params['title'] = extinf_content
-
-                common_attributes = [
-                    'tvg-id',
-                    'tvg-name',
-                    'tvg-logo',
-                    'group-title',
-                    'tvg-language']
-                for attr in common_attributes:
-                    if attr in attributes:
-                        current_params[attr] = attributes[attr]
-
-            elif line.startswith('#EXTGRP:'):
-                current_params['group-title'] = str(line[8:].strip())
-
-            elif line.startswith('#EXTVLCOPT:'):
-                opt_line = line[11:].strip()
-                if '=' in opt_line:
-                    key, value = opt_line.split('=', 1)
-                    key = key.lower().strip()
-                    if key == 'http-user-agent':
-                        current_params['user-agent'] = str(value.strip())
-
-            elif line.startswith('#'):
-                continue
-
-            elif not line.startswith('#'):
-                if current_params and line:
-                    current_params['uri'] = str(line.strip())
-                    if current_params.get('title'):
-                        for key in list(current_params.keys()):
-                            if isinstance(current_params[key], list):
-                                current_params[key] = str(
-                                    current_params[key][0]) if current_params[key] else ''
-
-                        entries.append(current_params.copy())
-                    current_params = {}
-        if config.plugins.m3uconverter.enable_debug.value:
-            logger.info(
-                "Parsing completed: %s channels found",
-                len(entries)
+    def _show_m3u_preview(self):
+        """Show the first 100 loaded channels in the list."""
+        display_list = []
+        for idx, channel in enumerate(self.m3u_channels_list[:100]):
+            name = sub(r'\[.*?\]', '', channel['name']).strip()
+            group = channel.get('group', 'Default')
+            group = clean_group_name(group)
+            display_text = "{:03d}. {}{}".format(
+                idx + 1,
+                group + ' - ' if group else '',
+                name
             )
-        return entries
-
-    def _parse_m3u_incremental(self, filename, chunk_size=65536):
-        """Parse M3U file incrementally with better performance for large files."""
-        entries = []
-        current_params = {}
-        buffer = ""
-        count = 0
-        max_channels = 50000  # Very high limit for incremental parsing
-
-        try:
-            with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
-                while True:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
-                        break
-
-                    buffer += chunk
-                    lines = buffer.split('\n')
+            display_list.append(display_text)
 
-                    # Keep last incomplete line in buffer
-                    if buffer and not buffer.endswith('\n'):
-                        buffer = lines.pop()
-                    else:
-                        buffer = ""
-
-                    for line in lines:
-                        if count >= max_channels:
-                            break
-
-                        line = line.strip()
-                        if not line:
-                            continue
-
-                        # Yield control periodically
-                        if len(entries) % 50 == 0:
-                            eTimer().start(5, True)
-
-                        if line.startswith('#EXTINF:'):
-                            current_params = {
-                                'f_type': 'inf', 'title': '', 'uri': ''}
-                            extinf_content = line[8:].strip()
-
-                            if ',' in extinf_content:
-                                last_comma_index = extinf_content.rfind(',')
-                                attributes_part = extinf_content[:last_comma_index].strip(
-                                )
-                                title_part = extinf_content[last_comma_index + 1:].strip()
-
-                                current_params['title'] = title_part
-
-                                # Parse attributes
-                                attr_matches = findall(
-                                    r'(\S+?)="([^"]*)"', attributes_part)
-                                for key, value in attr_matches:
-                                    current_params[key.lower()] = value
-
-                                # Get duration
-                                duration_match = search(
-                                    r'^(-?\d+)', attributes_part)
-                                if duration_match:
-                                    current_params['length'] = duration_match.group(
-                                        1)
-                            else:
-                                current_params['title'] = extinf_content
+        self["list"].setList(display_list)
+        self.file_loaded = True
 
-                        elif line.startswith('#EXTGRP:'):
-                            current_params['group-title'] = line[8:].strip()
+    def _iter_valid_channels(self, channels):
+        """Yield channels with a usable URL.
 
-                        elif line.startswith('#'):
-                            continue
-
-                        else:
-                            if current_params and line:
-                                current_params['uri'] = line.strip()
-                                if current_params.get('title'):
-                                    entries.append(current_params.copy())
-                                current_params = {}
-
-        except Exception as e:
-            logger.error(f"Incremental parsing error: {str(e)}")
-
-        return entries
+        Duplicates are already dropped by the parser (dedupe policy).
+        """
+        for ch in channels:
+            url = ch.get('url', '')
+            if url and len(url) > 10:
+                yield ch
+
+    def _iter_batches(self, channels, batch_size):
+        """Yield (batch_start, batch) pairs from any channel iterable."""
+        channel_iter = iter(channels)
+        batch_start = 0
+        while True:
+            batch = list(islice(channel_iter, batch_size))
+            if not batch:
+                return
+            yield batch_start, batch
+            batch_start += len(batch)
 
     def _parse_tv_file(self, filename=None):
         """
@@ -6258,147 +7123,34 @@ class UniversalConverter(Screen):
             )
 
     def _parse_json_file(self, filename=None):
-        """Parse JSON file containing channel information."""
+        """Parse JSON file containing channel information.
+
+        Channel objects are read one at a time. Like M3U playlists, large
+        files and low memory mode keep only a preview: the conversion
+        reads the file again.
+        """
         file_to_parse = filename or self.selected_file
         try:
-            with open(file_to_parse, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            self.m3u_channels_list = []
-            channels = []
-            if config.plugins.m3uconverter.enable_debug.value:
-                logger.debug(f"JSON data type: {type(data)}")
-            if isinstance(data, dict):
-                logger.debug(f"JSON keys: {list(data.keys())}")
-
-            # Handle different JSON structures
-            if isinstance(data, dict):
-                # Try various common JSON structures
-                if 'channels' in data and isinstance(data['channels'], list):
-                    channels = data['channels']
-                    if config.plugins.m3uconverter.enable_debug.value:
-                        logger.debug("Found channels in 'channels' key")
-                elif 'playlist' in data and isinstance(data['playlist'], list):
-                    channels = data['playlist']
-                    if config.plugins.m3uconverter.enable_debug.value:
-                        logger.debug("Found channels in 'playlist' key")
-                elif 'items' in data and isinstance(data['items'], list):
-                    channels = data['items']
-                    if config.plugins.m3uconverter.enable_debug.value:
-                        logger.debug("Found channels in 'items' key")
-                elif 'streams' in data and isinstance(data['streams'], list):
-                    channels = data['streams']
-                    if config.plugins.m3uconverter.enable_debug.value:
-                        logger.debug("Found channels in 'streams' key")
-                elif 'data' in data and isinstance(data['data'], list):
-                    channels = data['data']
-                    if config.plugins.m3uconverter.enable_debug.value:
-                        logger.debug("Found channels in 'data' key")
-                else:
-                    # If no specific key found, try to use all values that are
-                    # lists
-                    for key, value in data.items():
-                        if isinstance(value, list):
-                            channels = value
-                            if config.plugins.m3uconverter.enable_debug.value:
-                                logger.debug(f"Using list from key: {key}")
-                            break
-
-            elif isinstance(data, list):
-                # Direct array of channels
-                channels = data
-                if config.plugins.m3uconverter.enable_debug.value:
-                    logger.debug("JSON is direct array of channels")
+            self.m3u_streamed_file = None
+            self.m3u_duplicates_dropped = {}
+            parser = self._open_playlist(file_to_parse)
+            threshold_bytes = config.plugins.m3uconverter.large_file_threshold_mb.value * 1024 * 1024
+            channels = iter(parser)
+            if getsize(file_to_parse) > threshold_bytes or config.plugins.m3uconverter.low_memory_mode.value:
+                self.m3u_channels_list = list(islice(channels, 100))
+                # Counting reads the rest without keeping any channel
+                channel_count = len(self.m3u_channels_list) + sum(1 for _ in channels)
+                self.m3u_channel_count = channel_count
+                self.m3u_streamed_file = file_to_parse
             else:
-                if config.plugins.m3uconverter.enable_debug.value:
-                    logger.error("Unsupported JSON structure")
-                raise ValueError("Unsupported JSON structure")
-
-            # Process channels
-            for channel in channels:
-                if not isinstance(channel, dict):
-                    if config.plugins.m3uconverter.enable_debug.value:
-                        logger.warning(f"Skipping non-dict channel: {channel}")
-                    continue
-
-                # Extract channel information with flexible field names
-                name = (channel.get('name') or channel.get('title') or channel.get(
-                    'channel') or channel.get('channel_name') or 'Unknown')
-
-                url = (channel.get('url') or channel.get('link') or channel.get(
-                    'stream') or channel.get('source') or channel.get('address') or '')
+                self.m3u_channels_list = list(channels)
+                channel_count = len(self.m3u_channels_list)
+            self._log_duplicates(parser)
 
-                # Decode URL if it's encoded (check for % encoding)
-                if url and '%' in url:
-                    try:
-                        url = unquote(url)
-                        if config.plugins.m3uconverter.enable_debug.value:
-                            logger.debug(f"Decoded URL: {url}")
-                    except Exception as e:
-                        logger.error(f"Error decoding URL: {str(e)}")
-
-                group = (channel.get('group') or channel.get('category') or channel.get(
-                    'group-title') or channel.get('group_title') or '')
-
-                logo = (channel.get('logo') or channel.get('icon') or
-                        channel.get('tvg-logo') or channel.get('tvg_logo') or '')
-
-                tvg_id = (channel.get('tvg-ID') or channel.get('tvg_id') or
-                          channel.get('id') or channel.get('channel_id') or '')
-
-                tvg_name = channel.get(
-                    'tvg-name') or channel.get('tvg_name') or name
-
-                # Check if URL is valid after decoding
-                is_valid_url = False
-                if url:
-                    # Check for various URL protocols
-                    url_protocols = (
-                        'http://',
-                        'https://',
-                        'rtsp://',
-                        'rtmp://',
-                        'udp://',
-                        'rtp://')
-                    is_valid_url = any(url.startswith(proto)
-                                       for proto in url_protocols)
-
-                    # Also check for encoded URLs that might become valid after
-                    # decoding
-                    if not is_valid_url and '%' in url:
-                        decoded_url = unquote(url)
-                        is_valid_url = any(
-                            decoded_url.startswith(proto) for proto in url_protocols)
-                        if is_valid_url:
-                            url = decoded_url
-
-                group = clean_group_name(group)
-                # Only add channels with a valid URL
-                if is_valid_url:
-                    self.m3u_channels_list.append({
-                        'name': name,
-                        'url': url,
-                        'group': group,
-                        'logo': logo,
-                        'tvg_id': tvg_id,
-                        'tvg_name': tvg_name,
-                        'duration': channel.get('duration', '-1'),
-                        'user_agent': channel.get('user-agent') or channel.get('user_agent') or '',
-                        'program_id': channel.get('program-id') or channel.get('program_id') or ''
-                    })
-                    if config.plugins.m3uconverter.enable_debug.value:
-                        logger.debug(
-                            "Added channel: %s - %s",
-                            name,
-                            url
-                        )
-                else:
-                    if config.plugins.m3uconverter.enable_debug.value:
-                        logger.warning(
-                            "Skipping channel without valid URL: %s - URL: %s",
-                            name,
-                            url
-                        )
+            if config.plugins.m3uconverter.enable_debug.value:
+                logger.debug(f"JSON channels read from key: '{parser.container}'")
+            for channel in self.m3u_channels_list:
+                channel['group'] = clean_group_name(channel['group'])
 
             # Update UI based on conversion type
             display_list = []
@@ -6411,13 +7163,13 @@ class UniversalConverter(Screen):
             self["list"].setList(display_list)
             self.file_loaded = True
 
-            self._update_ui_success(len(self.m3u_channels_list))
+            self._update_ui_success(channel_count)
 
             # Log results for debugging
             if config.plugins.m3uconverter.enable_debug.value:
                 logger.debug(
                     "Found %d channels in JSON file",
-                    len(self.m3u_channels_list)
+                    channel_count
                 )
             if len(self.m3u_channels_list) > 0:
                 if config.plugins.m3uconverter.enable_debug.value:
@@ -6463,7 +7215,8 @@ class UniversalConverter(Screen):
                 len(self.m3u_channels_list)
             )
 
-        if self.cancel_conversion:
+        token = self.conversion_token
+        if token.cancelled:
             if config.plugins.m3uconverter.enable_debug.value:
                 logger.info("🛑 Conversion cancelled before starting")
             return (False, "Conversion cancelled before start")
@@ -6509,6 +7262,9 @@ class UniversalConverter(Screen):
         # PRELOAD CACHES (only once)
         self.epg_mapper.optimize_matching()
 
+        writer = None
+        # Lets the matcher's long scans stop on cancellation
+        self.epg_mapper.token = token
         try:
             file_to_parse = m3u_path or self.selected_file
             if config.plugins.m3uconverter.enable_debug.value:
@@ -6518,78 +7274,78 @@ class UniversalConverter(Screen):
                     logger.error("No file selected for conversion")
                 return (False, "No file selected")
 
-            # Extract EPG URL from M3U file
-            epg_url = None
-            try:
-                epg_url = self.epg_mapper._extract_epg_url_from_m3u(
-                    file_to_parse)
-                if config.plugins.m3uconverter.enable_debug.value:
-                    logger.info(f"Extracted EPG URL: {epg_url}")
-            except Exception as e:
-                logger.warning(f"Error extracting EPG URL: {str(e)}")
-                epg_url = None
+            # EPG URL captured by the parser while the playlist was loaded
+            epg_url = self.m3u_epg_url
+
+            # Low-memory mode: read the playlist again while converting.
+            # A URL is always streamed and its size is known only at the end
+            streamed = bool(file_to_parse) and self.m3u_streamed_file == file_to_parse
+            remote = streamed and is_url(file_to_parse)
+            parser = self._open_playlist(file_to_parse)
 
             # Parse file if not already parsed
-            if file_to_parse and not self.m3u_channels_list:
+            if file_to_parse and not streamed and not self.m3u_channels_list:
                 if config.plugins.m3uconverter.enable_debug.value:
                     logger.info(f"Parsing file: {file_to_parse}")
-                with open(file_to_parse, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                self.m3u_channels_list = self._parse_m3u_content(content)
-
-                # Use the correct field mapping for M3U files
-                normalized_list = []
-                for ch in self.m3u_channels_list:
-                    # Map M3U attributes to consistent names - FIXED to use
-                    # 'title' and 'uri'
-                    if ch.get('uri'):
-                        normalized_list.append({
-                            'name': ch.get('title', ''),
-                            'url': ch.get('uri', ''),
-                            'group': ch.get('group-title', ''),
-                            'tvg_id': ch.get('tvg-id', ''),
-                            'tvg_name': ch.get('tvg-name', ''),
-                            'logo': ch.get('tvg-logo', ''),
-                            'user_agent': ch.get('user_agent', ''),
-                            'program_id': ch.get('program-id', '')
-                        })
-                self.m3u_channels_list = normalized_list
+                token.begin(0, _("Reading playlist: {done} channels"))
+                loader = self._open_playlist(file_to_parse, token)
+                self.m3u_channels_list = list(loader)
+                epg_url = epg_url or loader.epg_url
+                self._log_duplicates(loader)
 
-            total_original = len(self.m3u_channels_list)
-            if total_original == 0:
+            if config.plugins.m3uconverter.enable_debug.value:
+                logger.info(f"Extracted EPG URL: {epg_url}")
+
+            if streamed:
+                total_original = self.m3u_channel_count
+            else:
+                total_original = len(self.m3u_channels_list)
+            if total_original == 0 and not remote:
                 if config.plugins.m3uconverter.enable_debug.value:
                     logger.error("No valid channels found after parsing")
                 return (False, "No valid channels found")
 
             # VALID CHANNELS ONLY - FIXED COUNTING
             processed_count = 0
-            processed_channels = set()
-            valid_channels = []
-
-            for ch in self.m3u_channels_list:
-                url = ch.get('url', '')
-                if url and len(url) > 10:
-                    # Use channel name + URL as unique identifier
-                    channel_id = f"{ch.get('name', '')}_{url}"
-                    if channel_id not in processed_channels:
-                        processed_channels.add(channel_id)
-                        valid_channels.append(ch)
-
-            total_valid = len(valid_channels)
-            total_original = len(self.m3u_channels_list)
+            if streamed:
+                valid_channels = self._iter_valid_channels(parser)
+                # Upper bound until the stream is consumed
+                total_valid = total_original
+                converted_channels = []
+                if parser.dedupe.policy == "quality":
+                    # The best copy of a channel may come last: read the
+                    # whole playlist before matching any of them, with
+                    # progress and Cancel like the in-memory load
+                    token.begin(0, _("Reading playlist: {done} channels"))
+                    parser = self._open_playlist(file_to_parse, token)
+                    valid_channels = list(self._iter_valid_channels(parser))
+                    total_valid = len(valid_channels)
+            else:
+                valid_channels = list(
+                    self._iter_valid_channels(self.m3u_channels_list))
+                total_valid = len(valid_channels)
 
             # Store the REAL count for statistics
             if hasattr(self, 'epg_mapper') and self.epg_mapper:
                 self.epg_mapper._last_processed_count = total_valid
 
-            if total_valid == 0:
+            if total_valid == 0 and not remote:
                 logger.error("❌ No valid channels with URLs found")
                 return (False, "No valid channels with URLs")
 
             batch_size = 50
-            groups = {}
-            epg_data = []
+            # Channels go to their bouquet files as soon as they are matched
+            writer = StreamingBouquetWriter(
+                self.core_converter, self.epg_mapper)
+            single_mode = config.plugins.m3uconverter.bouquet_mode.value == "single"
+            playlist_name = self._playlist_base_name(file_to_parse)
+            bouquet_for_group = {}
+            vod_names = set()
+            vod_handling = config.plugins.m3uconverter.vod_handling.value
+            # channels.xml records are spooled by the writer, not kept in RAM
+            epg_enabled = config.plugins.m3uconverter.epg_enabled.value
             stats = {
+                'vod_entries': 0,
                 'total_channels': total_valid,
                 'total_original_channels': total_original,
                 'rytec_matches': 0,
@@ -6609,28 +7365,22 @@ class UniversalConverter(Screen):
                     batch_size)
 
             # USE ONLY VALID CHANNELS - FIXED COUNTING
-            for batch_start in range(0, total_valid, batch_size):
+            if remote:
+                token.begin(0, _("Downloading and converting: {done} channels"))
+            else:
+                token.begin(total_valid, _("Converting: {done}/{total} ({percent}%)"))
+            for batch_start, batch_channels in self._iter_batches(
+                    valid_channels, batch_size):
                 if config.plugins.m3uconverter.enable_debug.value:
                     logger.debug(
                         "=== STARTING BATCH %d ===",
                         batch_start // batch_size + 1
                     )
-                if self.cancel_conversion:
-                    logger.info(
-                        "🛑 Conversion cancelled during batch processing")
-                    return (False, "Conversion cancelled during processing")
-
-                batch_end = min(batch_start + batch_size, total_valid)
-                batch_channels = valid_channels[batch_start:batch_end]
 
                 # Process the batch with CORRECT counting
                 for idx, channel in enumerate(batch_channels):
-                    if self.cancel_conversion:
-                        if config.plugins.m3uconverter.enable_debug.value:
-                            logger.info(
-                                "🛑 Conversion cancelled during channel processing")
-                        return (
-                            False, "Conversion cancelled during channel processing")
+                    # Raises ConversionCancelled once Cancel was pressed
+                    token.step()
 
                     # CORRECT: processed_count starts from batch_start +
                     # current index
@@ -6642,39 +7392,28 @@ class UniversalConverter(Screen):
                     tvg_id = channel.get('tvg_id', '')
                     original_name = name
 
-                    # USE CONSISTENT MATCHING APPROACH
-                    clean_name = self.epg_mapper.clean_channel_name(
-                        name, preserve_variants=False)
-
-                    # ENHANCED: Special handling for short names and numbered
-                    # channels
-                    if len(clean_name) <= 5 or any(char.isdigit()
-                                                   for char in clean_name):
-                        # Try enhanced search first for short names
-                        enhanced_matches = self.epg_mapper._enhanced_search_short_names(
-                            clean_name, original_name)
-                        if enhanced_matches:
-                            # Use the best enhanced match
-                            best_enhanced = max(
-                                enhanced_matches,
-                                key=lambda x: (
-                                    x.get(
-                                        'priority',
-                                        0),
-                                    x['similarity']))
-                            service_ref = best_enhanced['sref']
-                            match_type = f"{best_enhanced['type']}_enhanced"
-                        else:
-                            # Fall back to normal matching
-                            service_ref, match_type = self.epg_mapper._find_best_service_match(
-                                clean_name, tvg_id, original_name, channel['url'])
+                    # VOD FAST PATH: movies/series have no EPG, go straight
+                    # to an IPTV reference without any matching
+                    is_vod = vod_handling != "match" and is_vod_entry(
+                        url, channel.get('group', ''))
+                    if is_vod:
+                        clean_name = ""
+                        service_ref = self.epg_mapper._generate_service_reference(url)
+                        match_type = 'vod'
+                        stats['vod_entries'] += 1
                     else:
-                        # Normal matching for longer names
+                        # USE CONSISTENT MATCHING APPROACH
+                        clean_name = self.epg_mapper.clean_channel_name(
+                            name, preserve_variants=False)
+
+                        # Exact matches resolve from the compiled table; short
+                        # names and numbered channels get the enhanced search
+                        # inside, after the manual DB and exact stages
                         service_ref, match_type = self.epg_mapper._find_best_service_match(
                             clean_name, tvg_id, original_name, channel['url'])
 
                     # DETAILED DEBUG
-                    if config.plugins.m3uconverter.enable_debug.value and idx < 10:  # Only first 10 channels
+                    if config.plugins.m3uconverter.enable_debug.value and idx < 10 and not is_vod:  # Only first 10 channels
                         self.epg_mapper._debug_matching_process(
                             original_name, clean_name, tvg_id, service_ref, match_type)
 
@@ -6697,15 +7436,10 @@ class UniversalConverter(Screen):
                     else:
                         epg_sref = bouquet_sref  # Fallback to IPTV
 
-                    epg_entry = {
-                        'tvg_id': tvg_id or name,
-                        'sref': epg_sref,
-                        'name': name,
-                        'url': url,
-                        'original_name': original_name,
-                        'match_type': match_type
-                    }
-                    epg_data.append(epg_entry)
+                    # VOD has no guide data: keep it out of the EPG files
+                    if epg_enabled and not is_vod:
+                        writer.write_epg(
+                            name, tvg_id or name, epg_sref, match_type)
 
                     # Count matches correctly
                     if 'rytec' in match_type:
@@ -6733,20 +7467,22 @@ class UniversalConverter(Screen):
                                 stats['fallback_matches'])
 
                     # Grouping
-                    if config.plugins.m3uconverter.bouquet_mode.value == "single":
-                        group = "All Channels"
+                    separate_vod = is_vod and vod_handling == "separate"
+                    if single_mode:
+                        group = playlist_name
                     else:
                         group = clean_group_name(
                             channel.get('group', 'Default'))
 
-                    groups.setdefault(group, []).append(channel)
-
-                    # processed_count E total_valid
-                    if processed_count % 10 == 0:
-                        progress = int((processed_count / total_valid) * 100)
-                        progress_message = _("Converting: %d/%d (%d%%)") % (
-                            processed_count, total_valid, progress)
-                        self.update_progress(processed_count, progress_message)
+                    bouquet_key = (separate_vod, group)
+                    safe_name = bouquet_for_group.get(bouquet_key)
+                    if safe_name is None:
+                        safe_name = self.get_safe_filename(
+                            "VOD " + group if separate_vod else group)
+                        bouquet_for_group[bouquet_key] = safe_name
+                        if separate_vod:
+                            vod_names.add(safe_name)
+                    writer.write(safe_name, channel)
 
                     # processed_count
                     if config.plugins.m3uconverter.enable_debug.value and processed_count % 20 == 0:
@@ -6759,26 +7495,33 @@ class UniversalConverter(Screen):
                         logger.debug(f"   match_type: {match_type}")
                         logger.info(f"   Bouquet SREF: {bouquet_sref}")
 
+                if streamed and len(converted_channels) < 100:
+                    # Only a preview stays in memory; the playlist is
+                    # streamed again for any later conversion
+                    converted_channels.extend(
+                        batch_channels[:100 - len(converted_channels)])
                 stats['batch_processed'] += 1
                 time.sleep(0.005)
 
-            # Phase 2: Write bouquets
-            bouquet_names = []
-
-            if config.plugins.m3uconverter.bouquet_mode.value == "single":
-                all_channels = []
-                for group_channels in groups.values():
-                    all_channels.extend(group_channels)
-
-                bouquet_name = self.get_safe_filename(
-                    basename(file_to_parse).split('.')[0])
-                if self.write_group_bouquet(bouquet_name, all_channels):
-                    bouquet_names.append(bouquet_name)
-            else:
-                for group_name, group_channels in groups.items():
-                    safe_name = self.get_safe_filename(group_name)
-                    if self.write_group_bouquet(safe_name, group_channels):
-                        bouquet_names.append(safe_name)
+            if streamed:
+                # Real count is known only now; keep the converted preview
+                # for the editor and statistics like the in-memory path
+                total_valid = processed_count
+                stats['total_channels'] = total_valid
+                self.epg_mapper._last_processed_count = total_valid
+                self.m3u_channels_list = converted_channels
+                epg_url = epg_url or parser.epg_url
+                self._log_duplicates(parser)
+                if total_valid == 0:
+                    writer.abort()
+                    logger.error("❌ No valid channels with URLs found")
+                    return (False, "No valid channels with URLs")
+
+            # Phase 2: Move the written bouquets in place, VOD ones last
+            token.check()
+            written = writer.finish()
+            bouquet_names = [name for name in written if name not in vod_names]
+            bouquet_names.extend(name for name in written if name in vod_names)
 
             # Update main bouquet
             if bouquet_names:
@@ -6787,19 +7530,23 @@ class UniversalConverter(Screen):
                     logger.info(
                         "Main bouquet updated with %d bouquets" %
                         len(bouquet_names))
+            if stats['vod_entries'] and config.plugins.m3uconverter.enable_debug.value:
+                logger.info(
+                    "🎬 %d VOD entries converted without EPG matching",
+                    stats['vod_entries'])
 
             # Phase 3: Optimized EPG generation
-            if config.plugins.m3uconverter.epg_enabled.value and epg_data:
+            if epg_enabled and writer.epg_count:
                 if config.plugins.m3uconverter.enable_debug.value:
                     logger.info(
                         "EPG enabled, generating optimized files for %d channels" %
-                        len(epg_data))
+                        writer.epg_count)
 
                 bouquet_name_for_epg = bouquet_names[0] if bouquet_names else "default_bouquet"
 
                 # USE OPTIMIZED EPG GENERATION
                 epg_success = self.epg_mapper._generate_epg_channels_file(
-                    epg_data, bouquet_name_for_epg)
+                    writer.epg_entries(), bouquet_name_for_epg)
 
                 if epg_success:
                     # Generate sources file
@@ -6925,12 +7672,23 @@ class UniversalConverter(Screen):
 
             return (True, total_valid, real_epg_matches, perf_stats, stats)
 
+        except ConversionCancelled as e:
+            if writer:
+                writer.abort()
+            logger.info("🛑 Conversion cancelled during processing")
+            return (False, str(e))
+
         except Exception as e:
+            if writer:
+                writer.abort()
             logger.error(f"Optimized conversion error: {str(e)}")
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
             return (False, str(e))
 
+        finally:
+            self.epg_mapper.token = None
+
     def _convert_m3u_to_tv(self):
         """Convert M3U to TV bouquet format - WITH BETTER CANCELLATION"""
 
@@ -6950,7 +7708,7 @@ class UniversalConverter(Screen):
         def conversion_task():
             try:
                 # Check cancellation immediately
-                if self.cancel_conversion:
+                if self.conversion_token.cancelled:
                     return (False, "Conversion cancelled before start")
                 if hasattr(self, 'epg_mapper') and self.epg_mapper:
                     self.epg_mapper._refresh_config()
@@ -6965,7 +7723,7 @@ class UniversalConverter(Screen):
         self.reset_conversion_buttons()
 
         self.is_converting = True
-        self.cancel_conversion = False
+        self.conversion_token = ConversionToken(self._report_progress)
         self["key_red"].setText("")
         self["key_green"].setText("")
         self["key_blue"].setText(_("Cancel"))
@@ -6995,31 +7753,23 @@ class UniversalConverter(Screen):
             try:
                 output_file = self.get_output_filename()
                 total_items = len(self.m3u_channels_list)
+                token = self.conversion_token
+                token.begin(total_items, _("Converting: {name} ({percent}%)"))
 
                 with open(output_file, 'w', encoding='utf-8') as f:
-                    if self.cancel_conversion:
-                        return (False, "Conversion cancelled")
+                    token.check()
 
                     f.write('#EXTM3U\n')
                     f.write('#EXTENC: UTF-8\n')
                     f.write(
                         f'#EXTARCHIMEDE: Generated by Archimede Converter {__version__}\n')
 
-                    for idx, (name, url) in enumerate(self.m3u_channels_list):
+                    for name, url in self.m3u_channels_list:
+                        token.step(name)
                         f.write(
                             f'#EXTINF:-1 tvg-id="{name}" tvg-name="{name}",{name}\n')
                         f.write(f'{url}\n')
 
-                        if idx % 10 == 0:
-                            progress = (idx + 1) / total_items * 100
-                            self.update_progress(
-                                idx + 1,
-                                _("Converting: {name} ({percent}%)").format(
-                                    name=name,
-                                    percent=int(progress)
-                                )
-                            )
-
                 return (True, output_file, total_items)
 
             except IOError as e:
@@ -7030,7 +7780,7 @@ class UniversalConverter(Screen):
         def conversion_task():
             try:
                 # Check cancellation immediately
-                if self.cancel_conversion:
+                if self.conversion_token.cancelled:
                     return (False, "Conversion cancelled before start")
 
                 if hasattr(self, 'epg_mapper') and self.epg_mapper:
@@ -7045,7 +7795,7 @@ class UniversalConverter(Screen):
         self.reset_conversion_buttons()
 
         self.is_converting = True
-        self.cancel_conversion = False
+        self.conversion_token = ConversionToken(self._report_progress)
         self["key_red"].setText("")
         self["key_green"].setText("")
         self["key_blue"].setText(_("Cancel"))
@@ -7177,10 +7927,10 @@ class UniversalConverter(Screen):
 
                 # Process channels with EPG matching
                 optimized_channels = []
+                token = self.conversion_token
+                token.begin(
+                    len(processed_channels), _("Converting: {name} ({percent}%)"))
                 for idx, channel in enumerate(processed_channels):
-                    if self.cancel_conversion:
-                        return (False, "Conversion cancelled")
-
                     # DEBUG: Check channel structure before processing
                     if not isinstance(channel, dict):
                         logger.error(
@@ -7189,6 +7939,7 @@ class UniversalConverter(Screen):
                         continue
 
                     name = channel.get('name', '')
+                    token.step(name)
                     url = channel.get('url', '')
 
                     if not name:
@@ -7226,25 +7977,8 @@ class UniversalConverter(Screen):
                     }
                     optimized_channels.append(optimized_channel)
 
-                    # Add to EPG data
-                    epg_entry = {
-                        'tvg_id': name,  # Use the name as TVG ID
-                        'sref': epg_sref,
-                        'name': name,
-                        'url': url,
-                        'original_name': name,
-                        'match_type': match_type
-                    }
-                    epg_data.append(epg_entry)
-
-                    # Update progress
-                    if idx % 10 == 0:
-                        progress = (idx + 1) / len(processed_channels) * 100
-                        self.update_progress(
-                            idx + 1,
-                            _("Converting: {} ({}%)").format(
-                                name,
-                                int(progress)))
+                    # Add to EPG data, using the name as TVG ID
+                    epg_data.append((name, name, epg_sref, match_type))
 
                 # Write optimized bouquet
                 if optimized_channels:
@@ -7295,7 +8029,7 @@ class UniversalConverter(Screen):
         def conversion_task():
             try:
                 # Check cancellation immediately
-                if self.cancel_conversion:
+                if self.conversion_token.cancelled:
                     return (False, "Conversion cancelled before start")
                 if hasattr(self, 'epg_mapper') and self.epg_mapper:
                     self.epg_mapper._refresh_config()
@@ -7309,7 +8043,7 @@ class UniversalConverter(Screen):
         self.reset_conversion_buttons()
 
         self.is_converting = True
-        self.cancel_conversion = False
+        self.conversion_token = ConversionToken(self._report_progress)
         self["key_red"].setText("")
         self["key_green"].setText("")
         self["key_blue"].setText(_("Cancel"))
@@ -7337,18 +8071,26 @@ class UniversalConverter(Screen):
 
         def conversion_task():
             try:
-                if self.cancel_conversion:
+                if self.conversion_token.cancelled:
                     return (False, "Conversion cancelled before start")
 
                 # MAIN CONVERSION LOGIC
-                if not self.m3u_channels_list:
+                streamed = self.m3u_streamed_file == self.selected_file
+                if not streamed and not self.m3u_channels_list:
                     self._parse_json_file(self.selected_file)
+                    streamed = self.m3u_streamed_file == self.selected_file
 
                 if not self.m3u_channels_list:
                     return (False, "No valid channels found in JSON file")
 
-                total_channels = len(self.m3u_channels_list)
-                base_name = basename(self.selected_file).split('.')[0]
+                if streamed:
+                    # Only a preview is loaded: read the file again
+                    channels = self._open_playlist(self.selected_file)
+                    total_channels = self.m3u_channel_count
+                else:
+                    channels = self.m3u_channels_list
+                    total_channels = len(self.m3u_channels_list)
+                base_name = self._playlist_base_name(self.selected_file)
                 output_dir = dirname(self.selected_file)
                 output_file = join(output_dir, f"{base_name}.m3u")
 
@@ -7358,24 +8100,13 @@ class UniversalConverter(Screen):
                     f.write(
                         f'#EXTARCHIMEDE: Generated by Archimede Converter {__version__}\n')
 
-                    for idx, channel in enumerate(self.m3u_channels_list):
+                    token = self.conversion_token
+                    token.begin(total_channels, _("Converting: {name} ({percent}%)"))
+                    for channel in channels:
+                        token.step(channel.get('name', 'Unknown'))
                         if not channel.get('url'):
                             continue
 
-                        if self.cancel_conversion:
-                            return (False, "Conversion cancelled")
-
-                        # Update progress
-                        if idx % 10 == 0:
-                            progress = (idx + 1) / total_channels * 100
-                            self.update_progress(
-                                idx + 1,
-                                _("Converting: {name} ({percent}%)").format(
-                                    name=channel.get('name', 'Unknown'),
-                                    percent=int(progress)
-                                )
-                            )
-
                         # Build EXTINF line
                         name = channel.get('name', '')
                         tvg_id = channel.get('tvg_id', '')
@@ -7406,7 +8137,7 @@ class UniversalConverter(Screen):
         # Reset UI and start conversion
         self.reset_conversion_buttons()
         self.is_converting = True
-        self.cancel_conversion = False
+        self.conversion_token = ConversionToken(self._report_progress)
         self["key_red"].setText("")
         self["key_green"].setText("")
         self["key_blue"].setText(_("Cancel"))
@@ -7430,31 +8161,19 @@ class UniversalConverter(Screen):
 
         def conversion_task():
             try:
-                if self.cancel_conversion:
+                if self.conversion_token.cancelled:
                     return (False, "Conversion cancelled before start")
 
-                # Parse the M3U file if not already parsed
-                if not self.m3u_channels_list:
-                    with open(self.selected_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    self.m3u_channels_list = self._parse_m3u_content(content)
-
-                    # Normalize M3U entries ⭐⭐
-                    normalized_list = []
-                    for ch in self.m3u_channels_list:
-                        if ch.get('uri'):
-                            normalized_list.append({
-                                # title → name
-                                'name': ch.get('title', ''),
-                                'url': ch.get('uri', ''),
-                                'group': ch.get('group-title', ''),
-                                'tvg_id': ch.get('tvg-id', ''),
-                                'tvg_name': ch.get('tvg-name', ''),
-                                'logo': ch.get('tvg-logo', ''),
-                                'user_agent': ch.get('user_agent', ''),
-                                'program_id': ch.get('program-id', '')
-                            })
-                    self.m3u_channels_list = normalized_list
+                # JSON output needs every channel: load a streamed playlist
+                # or parse the M3U file if not already parsed
+                token = self.conversion_token
+                if (self.m3u_streamed_file == self.selected_file or
+                        not self.m3u_channels_list):
+                    token.begin(0, _("Reading playlist: {done} channels"))
+                    loader = self._open_playlist(self.selected_file, token)
+                    self.m3u_channels_list = list(loader)
+                    self.m3u_streamed_file = None
+                    self._log_duplicates(loader)
 
                 if not self.m3u_channels_list:
                     return (False, "No valid channels found in M3U file")
@@ -7462,20 +8181,10 @@ class UniversalConverter(Screen):
                 # Create JSON structure
                 json_data = {"playlist": []}
                 total_channels = len(self.m3u_channels_list)
+                token.begin(total_channels, _("Converting: {name} ({percent}%)"))
                 for idx, channel in enumerate(self.m3u_channels_list):
-                    if self.cancel_conversion:
-                        return (False, "Conversion cancelled")
-
                     channel_name = channel.get('name', 'Unknown')
-                    # Update progress
-                    progress = (idx + 1) / total_channels * 100
-                    self.update_progress(
-                        idx + 1,
-                        _("Converting: {name} ({percent}%)").format(
-                            name=channel_name,
-                            percent=int(progress)
-                        )
-                    )
+                    token.step(channel_name)
 
                     # Copy all normalized attributes
                     channel_data = {
@@ -7484,8 +8193,11 @@ class UniversalConverter(Screen):
                     json_data["playlist"].append(channel_data)
 
                 # Generate output filename
-                base_name = basename(self.selected_file).split('.')[0]
-                output_dir = dirname(self.selected_file)
+                base_name = self._playlist_base_name(self.selected_file)
+                if is_url(self.selected_file):
+                    output_dir = config.plugins.m3uconverter.lastdir.value
+                else:
+                    output_dir = dirname(self.selected_file)
                 output_file = join(output_dir, f"{base_name}.json")
 
                 # Write JSON file
@@ -7500,7 +8212,7 @@ class UniversalConverter(Screen):
         # Reset UI and start conversion
         self.reset_conversion_buttons()
         self.is_converting = True
-        self.cancel_conversion = False
+        self.conversion_token = ConversionToken(self._report_progress)
         self["key_red"].setText("")
         self["key_green"].setText("")
         self["key_blue"].setText(_("Cancel"))
@@ -7539,7 +8251,7 @@ class UniversalConverter(Screen):
             """Task per il thread"""
             try:
                 # Check cancellation immediately
-                if self.cancel_conversion:
+                if self.conversion_token.cancelled:
                     return (False, "Conversion cancelled before start")
                 if hasattr(self, 'epg_mapper') and self.epg_mapper:
                     self.epg_mapper._refresh_config()
@@ -7554,7 +8266,7 @@ class UniversalConverter(Screen):
         self.reset_conversion_buttons()
 
         self.is_converting = True
-        self.cancel_conversion = False
+        self.conversion_token = ConversionToken(self._report_progress)
         self["key_red"].setText("")
         self["key_green"].setText("")
         self["key_blue"].setText(_("Cancel"))
@@ -7589,6 +8301,8 @@ class UniversalConverter(Screen):
 
                 tracks = root.findall('.//ns:track', ns)
                 total_items = len(tracks)
+                token = self.conversion_token
+                token.begin(total_items, _("Converting: {name} ({percent}%)"))
 
                 with open(output_file, 'w', encoding='utf-8') as f:
                     f.write('#EXTM3U\n')
@@ -7596,25 +8310,15 @@ class UniversalConverter(Screen):
                     f.write(
                         f'#EXTARCHIMEDE: Generated by Archimede Converter {__version__}\n')
 
-                    for track in root.findall('.//ns:track', ns):
+                    for track in tracks:
                         title = track.find('ns:title', ns)
                         location = track.find('ns:location', ns)
+                        token.step(title.text if title is not None else "")
 
                         if title is not None and location is not None:
-                            if self.cancel_conversion:
-                                return (False, "Conversion cancelled")
-
                             f.write(f'#EXTINF:-1,{title.text}\n')
                             f.write(f'{location.text}\n')
 
-                            if track % 10 == 0:
-                                progress = (track + 1) / total_items * 100
-                                self.update_progress(
-                                    track + 1,
-                                    _("Converting: {title} ({percent}%)").format(
-                                        title=title,
-                                        percent=int(progress)))
-
                 track_count = len(tracks)
 
                 return (True, output_file, track_count)
@@ -7625,7 +8329,7 @@ class UniversalConverter(Screen):
 
         def conversion_task():
             try:
-                if self.cancel_conversion:
+                if self.conversion_token.cancelled:
                     return (False, "Conversion cancelled before start")
                 if hasattr(self, 'epg_mapper') and self.epg_mapper:
                     self.epg_mapper._refresh_config()
@@ -7639,7 +8343,7 @@ class UniversalConverter(Screen):
         self.reset_conversion_buttons()
 
         self.is_converting = True
-        self.cancel_conversion = False
+        self.conversion_token = ConversionToken(self._report_progress)
         self["key_red"].setText("")
         self["key_green"].setText("")
         self["key_blue"].setText(_("Cancel"))
@@ -7669,7 +8373,7 @@ class UniversalConverter(Screen):
             # Use the bouquet name from the selected file
             bouquet_name = ""
             if hasattr(self, 'selected_file') and self.selected_file:
-                bouquet_name = basename(self.selected_file).split('.')[0]
+                bouquet_name = self._playlist_base_name(self.selected_file)
 
             def editor_closed_callback(result=None):
                 """Callback executed when the manual editor is closed."""
@@ -7724,7 +8428,6 @@ class UniversalConverter(Screen):
             self["progress_source"].setValue(0)
             self["progress_text"].setText("")
             self.is_converting = False
-            self.cancel_conversion = False
 
             # Reset UI buttons
             self._reset_conversion_ui()
@@ -7764,6 +8467,7 @@ class UniversalConverter(Screen):
                             'dvbt_matches': cache_stats.get('dvbt_matches', 0),
                             'fallback_matches': cache_stats.get('fallback_matches', 0),
                             'manual_db_matches': cache_stats.get('manual_db_matches', 0),
+                            'duplicates_dropped': self.m3u_duplicates_dropped,
                         }
 
                         self.last_conversion_stats = stats_data
@@ -7916,6 +8620,16 @@ class UniversalConverter(Screen):
                     _("🚫 Skipped channels: {}").format(
                         total_original - total_processed))
 
+            duplicates = stats_data.get('duplicates_dropped') or {}
+            duplicate_labels = (
+                ('exact', _("same name and URL")),
+                ('url', _("same URL")),
+                ('quality', _("lower quality copy")))
+            for policy, label in duplicate_labels:
+                if duplicates.get(policy):
+                    stats_message.append(
+                        _("🧬 Duplicates dropped ({}): {}").format(label, duplicates[policy]))
+
             stats_message.append(
                 _("🎯 Effective EPG matches: {}").format(effective_epg_matches))
             stats_message.append(
@@ -8051,7 +8765,7 @@ class UniversalConverter(Screen):
     def _cancel_conversion_process(self):
         """Cancel the ongoing conversion"""
         if self.is_converting:
-            self.cancel_conversion = True
+            self.conversion_token.cancel()
             self.is_converting = False  # IMMEDIATELY stop conversion state
             self["key_blue"].setText(_("Cancelling..."))
             self["key_green"].setText(_("Stopped"))
@@ -8080,7 +8794,6 @@ class UniversalConverter(Screen):
     def _reset_conversion_ui(self):
         """Completely reset conversion UI state"""
         self.is_converting = False
-        self.cancel_conversion = False
         self["key_red"].setText(_("Open File"))
         self["key_green"].setText(_("Convert"))
         self["key_yellow"].setText("")
@@ -8092,7 +8805,6 @@ class UniversalConverter(Screen):
     def _conversion_cancelled(self):
         """Handle conversion cancellation."""
         self.is_converting = False
-        self.cancel_conversion = False
         self["key_red"].setText(_("Open File"))
         self["key_green"].setText(_("Convert"))
         self["key_blue"].setText(_("Tools"))
@@ -8105,7 +8817,6 @@ class UniversalConverter(Screen):
     def _conversion_error(self, error_msg):
         """Handle conversion error."""
         self.is_converting = False
-        self.cancel_conversion = False
         self["key_red"].setText(_("Open File"))
         self["key_green"].setText(_("Convert"))
         self["key_blue"].setText(_("Tools"))
@@ -8116,20 +8827,26 @@ class UniversalConverter(Screen):
             MessageBox.TYPE_ERROR,
             timeout=6)
 
-    def update_progress(self, value, text):
-        """Update the progress bar safely."""
+    def update_progress(self, value, text, total=None):
+        """Update the progress bar safely from a worker thread."""
         try:
-            callFromThread(self._update_progress_ui, value, text)
+            callFromThread(self._update_progress_ui, value, text, total)
         except Exception as e:
             logger.error(f"Error updating progress: {str(e)}")
 
-    def _update_progress_ui(self, value, text):
-        """Update progress UI."""
+    def _report_progress(self, done, total, text):
+        """ConversionToken callback, rate-limited by the token."""
+        self.update_progress(done, text, total)
+
+    def _update_progress_ui(self, value, text, total=None):
+        """Update progress UI; with an unknown total only the text moves."""
         try:
-            total_items = len(
-                self.m3u_channels_list) if self.m3u_channels_list else 100
-            self.progress_source.setRange(total_items)
-            self.progress_source.setValue(value)
+            if total:
+                self.progress_source.setRange(total)
+                self.progress_source.setValue(value)
+            else:
+                # URL download or full read: the count alone is shown
+                self.progress_source.setValue(0)
             self["progress_text"].setText(str(text))
         except Exception as e:
             logger.error(f"Error in UI progress update: {str(e)}")
@@ -8210,7 +8927,7 @@ class UniversalConverter(Screen):
 
         bouquet_name = ""
         if hasattr(self, 'selected_file') and self.selected_file:
-            bouquet_name = basename(self.selected_file).split('.')[0]
+            bouquet_name = self._playlist_base_name(self.selected_file)
 
         if config.plugins.m3uconverter.enable_debug.value:
             logger.info(f"🎯 Opening editor for bouquet: {bouquet_name}")
@@ -8618,7 +9335,7 @@ class ManualMatchEditor(Screen):
         Screen.__init__(self, session)
         self.session = session
         logger.info("✅ Manual database match editor initialized")
-        self.manual_db = ManualDatabaseManager()
+        self.manual_db = database_registry.get_manual_db()
         self.core_converter = core_converter
         self.db_path = DB_PATCH
 
@@ -9605,10 +10322,13 @@ class ManualMatchEditor(Screen):
                 service_ref = self.epg_mapper.mapping.rytec['basic'][rytec_id]
                 if service_ref and self.epg_mapper._is_service_compatible(
                         service_ref):
+                    # Extended info is loaded only for this exact hit
+                    variants = self.epg_mapper.get_rytec_variants(rytec_id)
+                    channel_label = variants[0].get('channel_name') if variants else ""
                     matches.append({
                         'type': 'rytec',
                         'sref': service_ref,
-                        'name': f"Rytec: {rytec_id}",
+                        'name': f"Rytec: {rytec_id} ({channel_label})" if channel_label else f"Rytec: {rytec_id}",
                         'similarity': 1.0,
                         'priority': 100
                     })
@@ -10036,8 +10756,8 @@ class ManualDatabaseEditor(Screen):
     def __init__(self, session, epg_mapper=None):
         Screen.__init__(self, session)
         self.session = session
-        self.epg_mapper = epg_mapper
-        self.manual_db = ManualDatabaseManager()
+        self.epg_mapper = epg_mapper or database_registry.peek_epg_mapper()
+        self.manual_db = database_registry.get_manual_db()
         logger.info("✅ Manual database editor initialized")
 
         # Selection system
@@ -10741,6 +11461,10 @@ class ManualDatabaseManager:
         self._save_lock = threading.Lock()
         self._cached_db = None
         self._cache_timestamp = 0
+        self._manual_indexes_built = False
+        self._change_listeners = []
+        # Lookup cache cap, lowered by the mapper in low-memory mode
+        self._manual_cache_max_size = 5000
         self._ensure_db_directory()
         self._ensure_db_file()
         self.cleanup_inconsistent_data()
@@ -10916,9 +11640,12 @@ class ManualDatabaseManager:
             cache_key = f"{clean_name}_{tvg_id}"
             if cache_key in self._manual_cache:
                 return self._manual_cache[cache_key]
+            if len(self._manual_cache) >= getattr(
+                    self, '_manual_cache_max_size', 5000):
+                self._manual_cache.clear()
 
-            # BUILD INDEXES ON FIRST CALL
-            if not hasattr(self, '_manual_indexes_built'):
+            # BUILD INDEXES ON FIRST CALL (and after every save)
+            if not getattr(self, '_manual_indexes_built', False):
                 self._build_manual_indexes()
 
             # O(1) LOOKUPS
@@ -11020,7 +11747,8 @@ class ManualDatabaseManager:
                 data['last_updated'] = strftime("%Y-%m-%d %H:%M:%S")
 
                 # IMMEDIATE save with verification
-                success = self.save_database(data)
+                changed_names = {clean_name, mapping_data.get('clean_name', '')}
+                success = self.save_database(data, changed_names)
 
                 if success:
                     logger.info(
@@ -11073,7 +11801,32 @@ class ManualDatabaseManager:
         except Exception as e:
             logger.error("❌ Error enforcing DB size limit: {}".format(str(e)))
 
-    def save_database(self, data):
+    def add_change_listener(self, callback):
+        """Register a callback(clean_names) called after every save.
+
+        clean_names is the set of changed names, or None when unknown.
+        """
+        if callback not in self._change_listeners:
+            self._change_listeners.append(callback)
+
+    def remove_change_listener(self, callback):
+        """Unregister a callback added with add_change_listener."""
+        if callback in self._change_listeners:
+            self._change_listeners.remove(callback)
+
+    def _notify_change(self, clean_names=None):
+        """Invalidate lookup indexes and notify listeners of a change."""
+        self._manual_indexes_built = False
+        if hasattr(self, '_manual_cache'):
+            self._manual_cache.clear()
+
+        for callback in list(self._change_listeners):
+            try:
+                callback(clean_names)
+            except Exception as e:
+                logger.error(f"❌ Manual DB listener error: {str(e)}")
+
+    def save_database(self, data, changed_names=None):
         """Save database to file with enhanced debugging"""
         try:
             # DEBUG: Log what we're trying to save
@@ -11163,6 +11916,8 @@ class ManualDatabaseManager:
 
             # Replace original file
             replace(temp_path, self.db_path)
+            self._cached_db = data
+            self._notify_change(changed_names)
 
             # APPLY SIZE LIMIT AFTER SAVING
             # But only if we've actually saved data
@@ -11202,6 +11957,12 @@ class ManualDatabaseManager:
             logger.error(f"❌ Backup creation error: {str(e)}")
             return False
 
+    def get_clean_name_index(self):
+        """Return the clean_name -> mapping index, building it if needed."""
+        if not getattr(self, '_manual_indexes_built', False):
+            self._build_manual_indexes()
+        return self._clean_name_index
+
     def _build_manual_indexes(self):
         """Build fast lookup indexes for manual database"""
         data = self.load_database()
@@ -11582,6 +12343,112 @@ class ManualDatabaseManager:
             return 0
 
 
+class DatabaseRegistry:
+    """Session-wide owner of the loaded EPG mapper and manual database.
+
+    Screens borrow the same instances instead of reloading lamedb,
+    bouquets, Rytec and the manual JSON each time they open.
+    """
+
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls):
+        """Singleton pattern implementation."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance.__initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self.__initialized:
+            self._build_lock = threading.RLock()
+            self._waiters_lock = Lock()
+            self._waiters = []
+            self._manual_db = None
+            self._epg_mapper = None
+            self.__initialized = True
+
+    def get_manual_db(self):
+        """Return the shared manual database manager."""
+        if self._manual_db is not None:
+            # Do not wait for a load in progress just to read this
+            return self._manual_db
+        with self._build_lock:
+            if self._manual_db is None:
+                self._manual_db = ManualDatabaseManager()
+            return self._manual_db
+
+    def get_epg_mapper(self, refresh=True, mapper=None):
+        """Return the shared mapper, loading it on first use.
+
+        With refresh, sources changed since they were loaded are
+        re-ingested first (a cheap stat check when nothing changed).
+        mapper is an empty instance to load, for callers that must create
+        it on the main thread (it owns an eTimer).
+        """
+        self._build_lock.acquire()
+        return self._load_and_release(refresh, mapper)
+
+    def request_epg_mapper(self, callback, refresh=True):
+        """Return the shared mapper without waiting for another thread.
+
+        While another thread is loading or refreshing it (the session
+        start preload), return None and call callback(mapper) from that
+        thread once it is done; mapper is None if the load failed.
+        """
+        with self._waiters_lock:
+            if not self._build_lock.acquire(blocking=False):
+                self._waiters.append(callback)
+                return None
+        return self._load_and_release(refresh, None)
+
+    def _load_and_release(self, refresh, mapper):
+        """Load or refresh with _build_lock held, then wake the waiters."""
+        try:
+            if self._epg_mapper is None:
+                if config.plugins.m3uconverter.enable_debug.value:
+                    logger.info("🔄 Creating shared EPGServiceMapper...")
+                if mapper is None:
+                    mapper = EPGServiceMapper(
+                        prefer_satellite=True, manual_db=self.get_manual_db())
+                self._epg_mapper = mapper.load_databases()
+                return self._epg_mapper
+
+            if mapper is not None:
+                # Someone else loaded the shared mapper first
+                mapper.manual_db.remove_change_listener(
+                    mapper.on_manual_db_changed)
+            if refresh:
+                self._epg_mapper.reload_changed_sources()
+            return self._epg_mapper
+        finally:
+            # Swap the waiters out before releasing, so a caller cannot
+            # queue itself after the last wake-up
+            with self._waiters_lock:
+                waiters, self._waiters = self._waiters, []
+                self._build_lock.release()
+            for callback in waiters:
+                callback(self._epg_mapper)
+
+    def peek_epg_mapper(self):
+        """Return the shared mapper if already loaded, without loading it."""
+        return self._epg_mapper
+
+    def replace_epg_mapper(self, mapper):
+        """Install a freshly built mapper as the shared one."""
+        with self._build_lock:
+            self._detach_mapper()
+            self._epg_mapper = mapper
+
+    def _detach_mapper(self):
+        if self._epg_mapper is not None and self._manual_db is not None:
+            self._manual_db.remove_change_listener(
+                self._epg_mapper.on_manual_db_changed)
+
+
 def main(session, **kwargs):
     """Main entry point with storage verification"""
     if config.plugins.m3uconverter.enable_debug.value:
@@ -11592,6 +12459,56 @@ def main(session, **kwargs):
     session.open(ConversionSelector)
 
 
+# Delay before warming the databases, so boot is not slowed down
+PRELOAD_DELAY_MS = 30000
+preload_timer = None
+
+
+def _preload_databases(mapper):
+    """Load or refresh the shared databases at low CPU priority."""
+    try:
+        # On Linux nice() only lowers the calling thread
+        nice(10)
+    except OSError:
+        pass
+
+    try:
+        start_time = time.time()
+        database_registry.get_epg_mapper(mapper=mapper)
+        if config.plugins.m3uconverter.enable_debug.value:
+            logger.info(
+                "✅ Databases preloaded in %.1f s",
+                time.time() - start_time)
+    except Exception as e:
+        logger.error(f"❌ Database preload failed: {str(e)}")
+
+
+def _start_preload():
+    """Timer callback: create the mapper here, load it in a thread."""
+    mapper = None
+    if database_registry.peek_epg_mapper() is None:
+        mapper = EPGServiceMapper(
+            prefer_satellite=True,
+            manual_db=database_registry.get_manual_db())
+
+    threading.Thread(
+        target=_preload_databases,
+        args=(mapper,),
+        name="M3UConverterPreload",
+        daemon=True).start()
+
+
+def sessionstart(reason, session=None, **kwargs):
+    """Schedule the background database warm-up after boot."""
+    global preload_timer
+    if reason != 0 or not config.plugins.m3uconverter.preload_databases.value:
+        return
+
+    preload_timer = eTimer()
+    preload_timer.callback.append(_start_preload)
+    preload_timer.start(PRELOAD_DELAY_MS, True)
+
+
 def Plugins(**kwargs):
     from Plugins.Plugin import PluginDescriptor
     return [PluginDescriptor(
@@ -11599,9 +12516,14 @@ def Plugins(**kwargs):
         description=_("Convert between M3U Enigma2 Bouquets Json"),
         where=PluginDescriptor.WHERE_PLUGINMENU,
         icon="plugin.png",
-        fnc=main)
+        fnc=main),
+        PluginDescriptor(
+        where=PluginDescriptor.WHERE_SESSIONSTART,
+        fnc=sessionstart)
     ]
 
 
 # Global converter instance
 core_converter = CoreConverter()
+# Shared mapper / manual database registry
+database_registry = DatabaseRegistry()
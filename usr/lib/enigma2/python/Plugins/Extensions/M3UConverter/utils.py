@@ -2,7 +2,7 @@
 from __future__ import absolute_import
 
 import unicodedata
-from re import IGNORECASE, sub
+from re import IGNORECASE, compile, sub
 from os import access, remove, W_OK, system
 from os.path import dirname, exists, isdir, join
 
@@ -156,6 +156,27 @@ def clean_group_name(name):
     return cleaned or "Default"
 
 
+# VOD entries: video file URLs, or provider movie/series paths in a VOD group
+VOD_FILE_PATTERN = compile(
+    r'\.(mp4|mkv|avi|mov|wmv|flv|m4v|mpe?g)(\?|$)', IGNORECASE)
+VOD_PATH_PATTERN = compile(r'/(movies?|series|vod)/', IGNORECASE)
+VOD_GROUP_PATTERN = compile(
+    r'\b(vod|movies?|series|serie\s*tv|tv\s*shows?)\b', IGNORECASE)
+
+
+def is_vod_entry(url, group=""):
+    """Check whether a playlist entry is a movie/series rather than live TV.
+
+    The URL decides: live groups are often called "Movies" or "Series 24/7",
+    so a group title only confirms a URL with a movie/series path.
+    """
+    if not url:
+        return False
+    if VOD_FILE_PATTERN.search(url):
+        return True
+    return bool(group and VOD_PATH_PATTERN.search(url) and VOD_GROUP_PATTERN.search(group))
+
+
 def transliterate_text(text):
     """Convert accented characters to ASCII equivalents."""
     if not text:
@@ -201,7 +222,10 @@ def _reload_services_after_delay(delay=4000):
 
 
 class M3UFileBrowser(Screen):
-    """File browser screen for selecting M3U, TV, JSON, and XSPF files."""
+    """File browser screen for selecting M3U, TV, JSON, and XSPF files.
+
+    M3U conversions also list compressed playlists (.gz/.xz/.bz2/.zip).
+    """
 
     def __init__(self, session, startdir="/etc/enigma2",
                  matchingPattern=r"(?i)^.*\.(tv|m3u|m3u8|json|xspf)$",